@@ -0,0 +1,9 @@
+#! /usr/bin/env bash
+
+set -ex
+
+cd "$(dirname "$0")/.."
+
+alembic upgrade head || exit 1
+
+cd src && python -m benchmarks.write_statements
@@ -4,10 +4,15 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, ORJSONResponse
 
+from backend.api.coalescing import CoalescingMiddleware
+from backend.api.etag import ETagMiddleware
+from backend.api.sticky_reads import StickyReadMiddleware
 from backend.core.config import settings
 from backend.core.database import session_manager
 from backend.core.logging_config import get_logger
 from backend.core.managers import DatabaseManager, ImportManager
+from backend.core.reference_cache import reference_cache
+from backend.scheduling.pool import schedule_pool
 from fake.main import Seeder
 
 logger = get_logger(__name__)
@@ -23,8 +28,11 @@ async def lifespan(app: FastAPI):
             await Seeder.seed_all()
 
     ImportManager.import_routers(app)
+    await reference_cache.start()
     yield
 
+    await reference_cache.stop()
+    schedule_pool.shutdown()
     await session_manager.dispose()
 
 
@@ -44,10 +52,20 @@ async def exception_handler(_: Request, exc: Exception):
     )
 
 
+app.add_middleware(ETagMiddleware)
+
+if session_manager.replica_engines:
+    app.add_middleware(StickyReadMiddleware)
+
+if settings.api_config.COALESCE_GET_REQUESTS:
+    # outside ETagMiddleware so the shared response carries the ETag
+    app.add_middleware(CoalescingMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
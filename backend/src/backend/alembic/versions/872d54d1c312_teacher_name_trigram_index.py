@@ -0,0 +1,31 @@
+"""teacher name trigram index
+
+Revision ID: 872d54d1c312
+Revises: 2f3432fb3959
+Create Date: 2026-10-18 20:47:37.470437
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '872d54d1c312'
+down_revision: Union[str, None] = '2f3432fb3959'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # same expression as Teacher.name, the search query has to match it verbatim
+    op.execute(
+        "CREATE INDEX ix_teachers_name_trgm ON teachers "
+        "USING gin ((last_name || ' ' || first_name || ' ' || patronymic) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_teachers_name_trgm", table_name="teachers")
+    # the extension is left in place, other objects may depend on it
@@ -1,36 +1,77 @@
-from fastapi import APIRouter, status
+from typing import Annotated
 
-from backend.api.depends import AsyncSessionDep
-from backend.entities.base import ListResponseModel
+from fastapi import APIRouter, Depends, Query, status
+
+from backend.api.depends import ReadSessionDep, ReadSessionFactoryDep, UnitOfWorkDep
+from backend.api.etag import VersionETag
+from backend.api.responses import ExportResponse
+from backend.utils.bulk_import import IMPORT_OPENAPI
+from backend.entities.base import BatchResponseModel, ImportReport, ListResponseModel
+from backend.entities.classroom.repository import classroom_repository
 from backend.entities.classroom.schemas import (
+    ClassroomFilterParams,
     ClassroomPostRequest,
     ClassroomCreateResponse,
     ClassroomPutRequest,
+    ClassroomResponse,
     ClassroomUpdateResponse,
 )
 from backend.entities.classroom.services import ClassroomManager
-from backend.api.depends import PaginationParamsDep
+from backend.api.depends import BatchIdsDep, ExpandParamsDep, ExportParamsDep, ImportParamsDep, PaginationParamsDep
 
 router = APIRouter(prefix="/classrooms", tags=["Учебные классы"])
+etag = Depends(VersionETag(classroom_repository))
 
 
 @router.post("/", response_model=ClassroomCreateResponse, status_code=status.HTTP_201_CREATED)
-async def create_classroom(session: AsyncSessionDep, request_data: ClassroomPostRequest) -> ClassroomCreateResponse:
+async def create_classroom(session: UnitOfWorkDep, request_data: ClassroomPostRequest) -> ClassroomCreateResponse:
     return await ClassroomManager.create_classroom(session, request_data)
 
 
-@router.get("/", response_model=ListResponseModel)
-async def list_classrooms(session: AsyncSessionDep, params: PaginationParamsDep) -> ListResponseModel:
-    return await ClassroomManager.list_classrooms(session, params)
+@router.post("/import", response_model=ImportReport, openapi_extra=IMPORT_OPENAPI)
+async def import_classrooms(session: UnitOfWorkDep, params: ImportParamsDep) -> ImportReport:
+    return await ClassroomManager.import_classrooms(session, params)
+
+
+@router.get("/", response_model=ListResponseModel, response_model_exclude_unset=True, dependencies=[etag])
+async def list_classrooms(
+    session: ReadSessionDep,
+    params: PaginationParamsDep,
+    expand: ExpandParamsDep,
+    filters: Annotated[ClassroomFilterParams, Query()],
+) -> ListResponseModel:
+    return await ClassroomManager.list_classrooms(session, params, expand, filters)
+
+
+@router.get("/export", dependencies=[etag])
+async def export_classrooms(
+    session_factory: ReadSessionFactoryDep,
+    export: ExportParamsDep,
+    expand: ExpandParamsDep,
+    filters: Annotated[ClassroomFilterParams, Query()],
+) -> ExportResponse:
+    return ClassroomManager.export_classrooms(session_factory, export, expand, filters)
+
+
+@router.get("/batch", response_model=BatchResponseModel, response_model_exclude_unset=True, dependencies=[etag])
+async def get_classrooms_batch(
+    session: ReadSessionDep, batch_ids: BatchIdsDep, expand: ExpandParamsDep
+) -> BatchResponseModel:
+    return await ClassroomManager.get_classrooms_batch(session, batch_ids, expand)
+
+
+@router.get("/{classroom_id}", response_model=ClassroomResponse, response_model_exclude_unset=True, dependencies=[etag])
+async def get_classroom(session: ReadSessionDep, classroom_id: int, expand: ExpandParamsDep) -> ClassroomResponse:
+    return await ClassroomManager.get_classroom(session, classroom_id, expand)
 
 
 @router.put("/{classroom_id}", response_model=ClassroomUpdateResponse)
 async def update_classroom(
-    session: AsyncSessionDep, request_data: ClassroomPutRequest, classroom_id: int
+    session: UnitOfWorkDep, request_data: ClassroomPutRequest, classroom_id: int
 ) -> ClassroomUpdateResponse:
     return await ClassroomManager.update_classroom(session, classroom_id, request_data)
 
 
 @router.delete("/{classroom_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_classroom(session: AsyncSessionDep, classroom_id: int) -> None:
+async def delete_classroom(session: UnitOfWorkDep, classroom_id: int) -> None:
     await ClassroomManager.delete_classroom(session, classroom_id)
@@ -1,22 +1,65 @@
-from fastapi import APIRouter, status
+from typing import Annotated
 
-from backend.api.depends import AsyncSessionDep
-from backend.entities.base import ListResponseModel
+from fastapi import APIRouter, Depends, Query, status
+
+from backend.api.depends import ReadSessionDep, ReadSessionFactoryDep, UnitOfWorkDep
+from backend.api.etag import VersionETag
+from backend.api.responses import ExportResponse
+from backend.entities.base import BatchResponseModel, ListResponseModel
+from backend.entities.lesson.repository import lesson_repository
 from backend.entities.lesson.schemas import (
-    LessonPostRequest,
     LessonCreateResponse,
+    LessonFilterParams,
+    LessonPostRequest,
+    LessonPutRequest,
+    LessonResponse,
+    LessonUpdateResponse,
 )
 from backend.entities.lesson.services import LessonManager
-from backend.api.depends import PaginationParamsDep
+from backend.api.depends import BatchIdsDep, ExportParamsDep, PaginationParamsDep
 
 router = APIRouter(prefix="/lessons", tags=["Уроки"])
+etag = Depends(VersionETag(lesson_repository))
 
 
 @router.post("/", response_model=LessonCreateResponse, status_code=status.HTTP_201_CREATED)
-async def create_lesson(session: AsyncSessionDep, request_data: LessonPostRequest) -> LessonCreateResponse:
+async def create_lesson(session: UnitOfWorkDep, request_data: LessonPostRequest) -> LessonCreateResponse:
     return await LessonManager.create_lesson(session, request_data)
 
 
-@router.get("/", response_model=ListResponseModel)
-async def list_lessons(pagination: PaginationParamsDep, session: AsyncSessionDep) -> ListResponseModel:
-    return await LessonManager.list_lessons(session, pagination)
+@router.get("/", response_model=ListResponseModel, dependencies=[etag])
+async def list_lessons(
+    session: ReadSessionDep,
+    pagination: PaginationParamsDep,
+    filters: Annotated[LessonFilterParams, Query()],
+) -> ListResponseModel:
+    return await LessonManager.list_lessons(session, pagination, filters)
+
+
+@router.get("/export", dependencies=[etag])
+async def export_lessons(
+    session_factory: ReadSessionFactoryDep,
+    export: ExportParamsDep,
+    filters: Annotated[LessonFilterParams, Query()],
+) -> ExportResponse:
+    return LessonManager.export_lessons(session_factory, export, filters)
+
+
+@router.get("/batch", response_model=BatchResponseModel, dependencies=[etag])
+async def get_lessons_batch(session: ReadSessionDep, batch_ids: BatchIdsDep) -> BatchResponseModel:
+    return await LessonManager.get_lessons_batch(session, batch_ids)
+
+
+@router.get("/{lesson_id}", response_model=LessonResponse, dependencies=[etag])
+async def get_lesson(session: ReadSessionDep, lesson_id: int) -> LessonResponse:
+    return await LessonManager.get_lesson(session, lesson_id)
+
+
+@router.put("/{lesson_id}", response_model=LessonUpdateResponse)
+async def update_lesson(session: UnitOfWorkDep, lesson_id: int, request_data: LessonPutRequest) -> LessonUpdateResponse:
+    return await LessonManager.update_lesson(session, lesson_id, request_data)
+
+
+@router.delete("/{lesson_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_lesson(session: UnitOfWorkDep, lesson_id: int) -> None:
+    await LessonManager.delete_lesson(session, lesson_id)
@@ -0,0 +1,26 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+
+from backend.api.depends import ReadSessionDep, UnitOfWorkDep
+from backend.scheduling.schemas import (
+    ScheduleGenerateRequest,
+    ScheduleGenerateResponse,
+    ScheduleScoreParams,
+    ScheduleScoreResponse,
+)
+from backend.scheduling.services import ScheduleManager
+
+router = APIRouter(prefix="/schedule", tags=["Расписание"])
+
+
+@router.post("/generate", response_model=ScheduleGenerateResponse)
+async def generate_schedule(session: UnitOfWorkDep, request_data: ScheduleGenerateRequest) -> ScheduleGenerateResponse:
+    return await ScheduleManager.generate_schedule(session, request_data)
+
+
+@router.get("/score", response_model=ScheduleScoreResponse)
+async def score_schedule(
+    session: ReadSessionDep, params: Annotated[ScheduleScoreParams, Query()]
+) -> ScheduleScoreResponse:
+    return await ScheduleManager.score_schedule(session, params)
@@ -1,34 +1,82 @@
-from fastapi import APIRouter, status
+from typing import Annotated
 
-from backend.api.depends import AsyncSessionDep
-from backend.entities.base import ListResponseModel
+from fastapi import APIRouter, Depends, Query, status
+
+from backend.api.depends import ReadSessionDep, ReadSessionFactoryDep, UnitOfWorkDep
+from backend.api.etag import VersionETag
+from backend.api.responses import ExportResponse
+from backend.utils.bulk_import import IMPORT_OPENAPI
+from backend.entities.base import BatchResponseModel, ImportReport, ListResponseModel
+from backend.entities.student_group.repository import student_group_repository
 from backend.entities.student_group.schemas import (
+    StudentGroupFilterParams,
     StudentGroupPostRequest,
     StudentGroupCreateResponse,
     StudentGroupPutRequest,
+    StudentGroupResponse,
     StudentGroupUpdateResponse,
 )
 from backend.entities.student_group.services import StudentGroupManager
-from backend.api.depends import PaginationParamsDep
+from backend.api.depends import BatchIdsDep, ExpandParamsDep, ExportParamsDep, ImportParamsDep, PaginationParamsDep
 
 router = APIRouter(prefix="/student_groups", tags=["Ученические группы"])
+etag = Depends(VersionETag(student_group_repository))
 
 
 @router.post("/", response_model=StudentGroupCreateResponse, status_code=status.HTTP_201_CREATED)
 async def create_student_group(
-    session: AsyncSessionDep, request_data: StudentGroupPostRequest
+    session: UnitOfWorkDep, request_data: StudentGroupPostRequest
 ) -> StudentGroupCreateResponse:
     return await StudentGroupManager.create_student_group(session, request_data)
 
 
-@router.get("/", response_model=ListResponseModel)
-async def list_student_groups(session: AsyncSessionDep, params: PaginationParamsDep) -> ListResponseModel:
-    return await StudentGroupManager.list_student_groups(session, params)
+@router.post("/import", response_model=ImportReport, openapi_extra=IMPORT_OPENAPI)
+async def import_student_groups(session: UnitOfWorkDep, params: ImportParamsDep) -> ImportReport:
+    return await StudentGroupManager.import_student_groups(session, params)
+
+
+@router.get("/", response_model=ListResponseModel, response_model_exclude_unset=True, dependencies=[etag])
+async def list_student_groups(
+    session: ReadSessionDep,
+    params: PaginationParamsDep,
+    expand: ExpandParamsDep,
+    filters: Annotated[StudentGroupFilterParams, Query()],
+) -> ListResponseModel:
+    return await StudentGroupManager.list_student_groups(session, params, expand, filters)
+
+
+@router.get("/export", dependencies=[etag])
+async def export_student_groups(
+    session_factory: ReadSessionFactoryDep,
+    export: ExportParamsDep,
+    expand: ExpandParamsDep,
+    filters: Annotated[StudentGroupFilterParams, Query()],
+) -> ExportResponse:
+    return StudentGroupManager.export_student_groups(session_factory, export, expand, filters)
+
+
+@router.get("/batch", response_model=BatchResponseModel, response_model_exclude_unset=True, dependencies=[etag])
+async def get_student_groups_batch(
+    session: ReadSessionDep, batch_ids: BatchIdsDep, expand: ExpandParamsDep
+) -> BatchResponseModel:
+    return await StudentGroupManager.get_student_groups_batch(session, batch_ids, expand)
+
+
+@router.get(
+    "/{student_group_id}",
+    response_model=StudentGroupResponse,
+    response_model_exclude_unset=True,
+    dependencies=[etag],
+)
+async def get_student_group(
+    session: ReadSessionDep, student_group_id: int, expand: ExpandParamsDep
+) -> StudentGroupResponse:
+    return await StudentGroupManager.get_student_group(session, student_group_id, expand)
 
 
 @router.put("/{student_group_id}", response_model=StudentGroupUpdateResponse)
 async def update_student_group(
-    session: AsyncSessionDep,
+    session: UnitOfWorkDep,
     request_data: StudentGroupPutRequest,
     student_group_id: int,
 ) -> StudentGroupUpdateResponse:
@@ -36,5 +84,5 @@ async def update_student_group(
 
 
 @router.delete("/{student_group_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_student_group(db: AsyncSessionDep, student_group_id: int) -> None:
+async def delete_student_group(db: UnitOfWorkDep, student_group_id: int) -> None:
     await StudentGroupManager.delete_student_group(db, student_group_id)
@@ -1,36 +1,86 @@
-from fastapi import APIRouter, status
+from typing import Annotated
 
-from backend.entities.base import ListResponseModel
+from fastapi import APIRouter, Depends, Query, status
+
+from backend.api.etag import VersionETag
+from backend.api.responses import ExportResponse
+from backend.utils.bulk_import import IMPORT_OPENAPI
+from backend.entities.base import BatchResponseModel, ImportReport, ListResponseModel
+from backend.entities.subject.repository import subject_repository
 from backend.entities.subject.services import SubjectManager
-from backend.api.depends import AsyncSessionDep, PaginationParamsDep
+from backend.api.depends import (
+    BatchIdsDep,
+    ExpandParamsDep,
+    ExportParamsDep,
+    ImportParamsDep,
+    PaginationParamsDep,
+    ReadSessionDep,
+    ReadSessionFactoryDep,
+    UnitOfWorkDep,
+)
 from backend.entities.subject.schemas import (
+    SubjectFilterParams,
     SubjectCreateResponse,
     SubjectPostRequest,
+    SubjectResponse,
     SubjectUpdateResponse,
     SubjectPutRequest,
 )
 
 
 router = APIRouter(prefix="/subjects", tags=["Учебные дисциплины"])
+etag = Depends(VersionETag(subject_repository))
 
 
 @router.post("/", response_model=SubjectCreateResponse, status_code=status.HTTP_201_CREATED)
-async def create_subject(session: AsyncSessionDep, request_data: SubjectPostRequest) -> SubjectCreateResponse:
+async def create_subject(session: UnitOfWorkDep, request_data: SubjectPostRequest) -> SubjectCreateResponse:
     return await SubjectManager.create_subject(session, request_data)
 
 
-@router.get("/", response_model=ListResponseModel)
-async def list_subjects(pagination: PaginationParamsDep, session: AsyncSessionDep) -> ListResponseModel:
-    return await SubjectManager.list_subjects(session, pagination)
+@router.post("/import", response_model=ImportReport, openapi_extra=IMPORT_OPENAPI)
+async def import_subjects(session: UnitOfWorkDep, params: ImportParamsDep) -> ImportReport:
+    return await SubjectManager.import_subjects(session, params)
+
+
+@router.get("/", response_model=ListResponseModel, response_model_exclude_unset=True, dependencies=[etag])
+async def list_subjects(
+    pagination: PaginationParamsDep,
+    session: ReadSessionDep,
+    expand: ExpandParamsDep,
+    filters: Annotated[SubjectFilterParams, Query()],
+) -> ListResponseModel:
+    return await SubjectManager.list_subjects(session, pagination, expand, filters)
+
+
+@router.get("/export", dependencies=[etag])
+async def export_subjects(
+    session_factory: ReadSessionFactoryDep,
+    export: ExportParamsDep,
+    expand: ExpandParamsDep,
+    filters: Annotated[SubjectFilterParams, Query()],
+) -> ExportResponse:
+    return SubjectManager.export_subjects(session_factory, export, expand, filters)
+
+
+@router.get("/batch", response_model=BatchResponseModel, response_model_exclude_unset=True, dependencies=[etag])
+async def get_subjects_batch(
+    session: ReadSessionDep, batch_ids: BatchIdsDep, expand: ExpandParamsDep
+) -> BatchResponseModel:
+    return await SubjectManager.get_subjects_batch(session, batch_ids, expand)
+
+
+@router.get("/{subject_id}", response_model=SubjectResponse, response_model_exclude_unset=True, dependencies=[etag])
+async def get_subject(session: ReadSessionDep, subject_id: int, expand: ExpandParamsDep) -> SubjectResponse:
+    return await SubjectManager.get_subject(session, subject_id, expand)
 
 
 @router.put("/{subject_id}", response_model=SubjectUpdateResponse)
 async def update_subject(
-    session: AsyncSessionDep, subject_id: int, request_data: SubjectPutRequest
+    session: UnitOfWorkDep, subject_id: int, request_data: SubjectPutRequest
 ) -> SubjectUpdateResponse:
     return await SubjectManager.update_subject(session, subject_id, request_data)
 
 
 @router.delete("/{subject_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_subject(session: AsyncSessionDep, subject_id: int) -> None:
+async def delete_subject(session: UnitOfWorkDep, subject_id: int) -> None:
     await SubjectManager.delete_subject(session, subject_id)
@@ -1,27 +1,79 @@
-from fastapi import APIRouter, status
+from typing import Annotated, List
 
-from backend.api.depends import AsyncSessionDep
-from backend.entities.base import ListResponseModel
+from fastapi import APIRouter, Depends, Query, status
+
+from backend.api.depends import ReadSessionDep, ReadSessionFactoryDep, UnitOfWorkDep
+from backend.api.etag import VersionETag
+from backend.api.responses import ExportResponse
+from backend.utils.bulk_import import IMPORT_OPENAPI
+from backend.core.config import settings
+from backend.entities.base import BatchResponseModel, ImportReport, ListResponseModel
+from backend.entities.teacher.repository import teacher_repository
 from backend.entities.teacher.schemas import (
+    TeacherFilterParams,
     TeacherPostRequest,
     TeacherCreateResponse,
+    TeacherResponse,
+    TeacherSearchResponse,
     TeacherUpdateResponse,
     TeacherPutRequest,
 )
 from backend.entities.teacher.services import TeacherManager
-from backend.api.depends import PaginationParamsDep
+from backend.api.depends import BatchIdsDep, ExpandParamsDep, ExportParamsDep, ImportParamsDep, PaginationParamsDep
 
 router = APIRouter(prefix="/teachers", tags=["Учителя"])
+etag = Depends(VersionETag(teacher_repository))
 
 
 @router.post("/", response_model=TeacherCreateResponse, status_code=status.HTTP_201_CREATED)
-async def create_teacher(session: AsyncSessionDep, request_data: TeacherPostRequest) -> TeacherCreateResponse:
+async def create_teacher(session: UnitOfWorkDep, request_data: TeacherPostRequest) -> TeacherCreateResponse:
     return await TeacherManager.create_teacher(session, request_data)
 
 
-@router.get("/", response_model=ListResponseModel)
-async def list_teachers(session: AsyncSessionDep, params: PaginationParamsDep):
-    return await TeacherManager.list_teachers(session, params)
+@router.post("/import", response_model=ImportReport, openapi_extra=IMPORT_OPENAPI)
+async def import_teachers(session: UnitOfWorkDep, params: ImportParamsDep) -> ImportReport:
+    return await TeacherManager.import_teachers(session, params)
+
+
+@router.get("/", response_model=ListResponseModel, response_model_exclude_unset=True, dependencies=[etag])
+async def list_teachers(
+    session: ReadSessionDep,
+    params: PaginationParamsDep,
+    expand: ExpandParamsDep,
+    filters: Annotated[TeacherFilterParams, Query()],
+):
+    return await TeacherManager.list_teachers(session, params, expand, filters)
+
+
+@router.get("/search", response_model=List[TeacherSearchResponse])
+async def search_teachers(
+    session: ReadSessionDep,
+    q: str = Query(..., min_length=2, max_length=100, description="Часть ФИО: 'Иван', 'Петров Ив'"),
+    limit: int = Query(10, ge=1, le=settings.api_config.PAGINATION_LIMIT, description="Количество результатов"),
+) -> List[TeacherSearchResponse]:
+    return await TeacherManager.search_teachers(session, q, limit)
+
+
+@router.get("/export", dependencies=[etag])
+async def export_teachers(
+    session_factory: ReadSessionFactoryDep,
+    export: ExportParamsDep,
+    expand: ExpandParamsDep,
+    filters: Annotated[TeacherFilterParams, Query()],
+) -> ExportResponse:
+    return TeacherManager.export_teachers(session_factory, export, expand, filters)
+
+
+@router.get("/batch", response_model=BatchResponseModel, response_model_exclude_unset=True, dependencies=[etag])
+async def get_teachers_batch(
+    session: ReadSessionDep, batch_ids: BatchIdsDep, expand: ExpandParamsDep
+) -> BatchResponseModel:
+    return await TeacherManager.get_teachers_batch(session, batch_ids, expand)
+
+
+@router.get("/{teacher_id}", response_model=TeacherResponse, response_model_exclude_unset=True, dependencies=[etag])
+async def get_teacher(session: ReadSessionDep, teacher_id: int, expand: ExpandParamsDep) -> TeacherResponse:
+    return await TeacherManager.get_teacher(session, teacher_id, expand)
 
 
 # TODO: router.patch
@@ -29,11 +81,11 @@ async def list_teachers(session: AsyncSessionDep, params: PaginationParamsDep):
 
 @router.put("/{teacher_id}", response_model=TeacherUpdateResponse)
 async def update_teacher(
-    session: AsyncSessionDep, teacher_id: int, request_data: TeacherPutRequest
+    session: UnitOfWorkDep, teacher_id: int, request_data: TeacherPutRequest
 ) -> TeacherUpdateResponse:
     return await TeacherManager.update_teacher(session, teacher_id, request_data)
 
 
 @router.delete("/{teacher_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_teacher(session: AsyncSessionDep, teacher_id: int) -> None:
+async def delete_teacher(session: UnitOfWorkDep, teacher_id: int) -> None:
     await TeacherManager.delete_teacher(session, teacher_id)
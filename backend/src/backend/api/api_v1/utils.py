@@ -1,5 +1,7 @@
 from fastapi import APIRouter
 
+from backend.api.coalescing import single_flight
+from backend.core.database import session_manager
 from backend.core.managers import DatabaseManager
 from backend.core.exceptions import DatabaseConnectionError
 from backend.core.logging_config import get_logger
@@ -15,3 +17,15 @@ async def health_check():
     except Exception as e:
         logger.error(f"Database connection error: {e}")
         raise DatabaseConnectionError()
+
+
+@router.get("/pool-stats/")
+async def pool_stats() -> dict:
+    """Connection pool of this worker: occupancy and how long checkouts waited for a connection."""
+    return session_manager.pool_stats()
+
+
+@router.get("/coalescing-stats/")
+async def coalescing_stats() -> dict:
+    """GETs of this worker that ran (executed) and that got the response of an identical running one (coalesced)."""
+    return single_flight.stats()
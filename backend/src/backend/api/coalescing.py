@@ -0,0 +1,120 @@
+import asyncio
+from typing import Optional
+from urllib.parse import parse_qsl
+
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core.config import settings
+from backend.core.database import session_manager
+
+Key = tuple[str, tuple[tuple[str, str], ...], str, bool]
+
+
+class SingleFlight:
+    """In-flight GET responses of this worker, shared by identical concurrent requests.
+
+    Requests are identical when path, query (parameter order aside) and the headers
+    that change the answer match. Counters are per process, i.e. per uvicorn worker.
+    """
+
+    # bigger responses (exports) are not buffered, waiting requests then run on their own
+    MAX_SHARED_BODY = 1 << 20
+
+    def __init__(self) -> None:
+        self.in_flight: dict[Key, asyncio.Future[Optional[list[Message]]]] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def key(scope: Scope) -> Key:
+        connection = HTTPConnection(scope)
+        # stable sort: repeated parameters keep their relative order
+        query = sorted(parse_qsl(scope["query_string"].decode("latin-1"), keep_blank_values=True), key=lambda p: p[0])
+        return (
+            scope["path"],
+            tuple(query),
+            connection.headers.get("if-none-match", ""),
+            session_manager.STICKY_COOKIE in connection.cookies,
+        )
+
+    def stats(self) -> dict:
+        return {"executed": self.executed, "coalesced": self.coalesced, "in_flight": len(self.in_flight)}
+
+
+single_flight = SingleFlight()
+
+
+class CoalescingMiddleware:
+    """Runs identical concurrent GETs once and replays the leader's response to the others.
+
+    Only the entity list and read endpoints are coalesced; diagnostics (``/utils``) and
+    ``/schedule`` always answer the request itself. If the leader fails or its body exceeds
+    ``SingleFlight.MAX_SHARED_BODY`` the waiting requests are run normally.
+    """
+
+    ENTITY_PATHS = ("/lessons", "/teachers", "/classrooms", "/student_groups", "/subjects")
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.prefixes = tuple(f"{settings.api_config.api_prefix}{path}" for path in self.ENTITY_PATHS)
+
+    def coalesces(self, scope: Scope) -> bool:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return False
+        path = scope["path"].rstrip("/")
+        return any(path == prefix or path.startswith(f"{prefix}/") for prefix in self.prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.coalesces(scope):
+            await self.app(scope, receive, send)
+            return
+
+        key = single_flight.key(scope)
+        if (flight := single_flight.in_flight.get(key)) is not None:
+            if (messages := await asyncio.shield(flight)) is not None:
+                single_flight.coalesced += 1
+                for message in messages:
+                    await send(_copy(message))
+                return
+
+        await self._lead(key, scope, receive, send)
+
+    async def _lead(self, key: Key, scope: Scope, receive: Receive, send: Send) -> None:
+        flight = asyncio.get_running_loop().create_future()
+        single_flight.in_flight[key] = flight
+        single_flight.executed += 1
+
+        messages: Optional[list[Message]] = []
+        body_size = 0
+
+        def release(result: Optional[list[Message]]) -> None:
+            if single_flight.in_flight.get(key) is flight:
+                del single_flight.in_flight[key]
+            if not flight.done():
+                flight.set_result(result)
+
+        async def send_and_capture(message: Message) -> None:
+            nonlocal messages, body_size
+            if messages is not None:
+                body_size += len(message.get("body", b""))
+                if body_size > SingleFlight.MAX_SHARED_BODY:
+                    messages = None
+                    release(None)
+                else:
+                    # outer middlewares (CORS) edit the headers of the message they are sent
+                    messages.append(_copy(message))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_capture)
+        except BaseException:
+            release(None)
+            raise
+        release(messages)
+
+
+def _copy(message: Message) -> Message:
+    if "headers" in message:
+        return {**message, "headers": list(message["headers"])}
+    return message
@@ -1,10 +1,14 @@
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from backend.core.logging_config import get_logger
 from backend.core.database import session_manager
+from backend.utils.batch import BatchIds, get_batch_ids
+from backend.utils.bulk_import import ImportParams, get_import_params
+from backend.utils.export import ExportParams, get_export_params
+from backend.utils.expand import ExpandParams, get_expand
 from backend.utils.pagination import PaginationParams, get_pagination
 
 
@@ -13,4 +17,19 @@ logger = get_logger(__name__)
 
 AsyncSessionDep = Annotated[AsyncSession, Depends(session_manager.get_async_session)]
 
+ReadSessionDep = Annotated[AsyncSession, Depends(session_manager.get_read_session)]
+
+# for streaming responses: a yield dependency's session is closed before the body is sent
+ReadSessionFactoryDep = Annotated[async_sessionmaker[AsyncSession], Depends(session_manager.read_session_factory)]
+
+UnitOfWorkDep = Annotated[AsyncSession, Depends(session_manager.get_unit_of_work)]
+
 PaginationParamsDep = Annotated[PaginationParams, Depends(get_pagination)]
+
+ExpandParamsDep = Annotated[ExpandParams, Depends(get_expand)]
+
+BatchIdsDep = Annotated[BatchIds, Depends(get_batch_ids)]
+
+ExportParamsDep = Annotated[ExportParams, Depends(get_export_params)]
+
+ImportParamsDep = Annotated[ImportParams, Depends(get_import_params)]
@@ -0,0 +1,51 @@
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.api.depends import ReadSessionDep
+from backend.core.exceptions import NotModifiedException
+from backend.core.table_versions import table_versions
+from backend.entities.base import BaseRepository
+
+
+class VersionETag:
+    """Conditional GET for an entity's endpoints.
+
+    The ETag is built from the versions of ``repository.versioned_tables``, so answering a
+    matching ``If-None-Match`` with 304 costs one primary key lookup and no list queries.
+    """
+
+    def __init__(self, repository: BaseRepository) -> None:
+        self.repository = repository
+
+    async def __call__(self, request: Request, session: ReadSessionDep) -> None:
+        versions = await table_versions.get(session, self.repository.versioned_tables)
+        etag = f'W/"{".".join(map(str, versions.values()))}"'
+
+        if_none_match = request.headers.get("if-none-match", "")
+        if if_none_match == "*" or etag in (tag.strip() for tag in if_none_match.split(",")):
+            raise NotModifiedException(etag)
+
+        request.state.etag = etag
+
+
+class ETagMiddleware:
+    """Puts the ETag from ``VersionETag`` on 200 responses, also on Response objects returned by endpoints."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_etag(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                if etag := scope.get("state", {}).get("etag"):
+                    headers = MutableHeaders(scope=message)
+                    headers["ETag"] = etag
+                    headers["Cache-Control"] = "no-cache"
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
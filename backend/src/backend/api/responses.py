@@ -0,0 +1,25 @@
+from typing import Any, AsyncIterator
+
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+from backend.utils.export import MEDIA_TYPES, ExportFormat
+
+
+class RawJSONResponse(ORJSONResponse):
+    """Sends already serialized JSON bytes as is, anything else is rendered by orjson."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return super().render(content)
+
+
+class ExportResponse(StreamingResponse):
+    """Streams export chunks as a file download, ``<name>.ndjson`` or ``<name>.csv``."""
+
+    def __init__(self, chunks: AsyncIterator[bytes], export_format: ExportFormat, name: str) -> None:
+        super().__init__(
+            chunks,
+            media_type=MEDIA_TYPES[export_format],
+            headers={"Content-Disposition": f'attachment; filename="{name}.{export_format}"'},
+        )
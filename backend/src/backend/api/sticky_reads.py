@@ -0,0 +1,33 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core.config import settings
+from backend.core.database import session_manager
+
+
+class StickyReadMiddleware:
+    """Pins the client's reads to the primary for REPLICA_STICKY_SECONDS after its unit of work
+    committed, so it doesn't miss its own write on a lagging replica.
+
+    ``SessionManager.get_unit_of_work`` flags the request once the commit went through; the
+    endpoint's response headers are already built by then, hence the cookie is set here.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.cookie = (
+            f"{session_manager.STICKY_COOKIE}=1; HttpOnly; "
+            f"Max-Age={settings.database.REPLICA_STICKY_SECONDS}; Path=/; SameSite=lax"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and scope.get("state", {}).get("committed_write"):
+                MutableHeaders(scope=message).append("set-cookie", self.cookie)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
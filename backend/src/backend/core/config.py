@@ -7,7 +7,7 @@ from pydantic import AnyUrl, BeforeValidator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from backend.core.pathes import base_pathes
-from backend.utils.common_utils import parse_cors
+from backend.utils.common_utils import parse_cors, parse_list
 
 
 class GlobalSettings(BaseSettings):
@@ -28,9 +28,34 @@ class SecurityConfig(GlobalSettings):
     BACKEND_CORS_ORIGINS: Annotated[list[AnyUrl] | str, BeforeValidator(parse_cors)]
 
 
+CountStrategy = Literal["exact", "estimated", "cached"]
+
+
 class ApiConfig(GlobalSettings):
     API_VERSION: str
     PAGINATION_LIMIT: int
+    # max ids of one /batch request
+    BATCH_LIMIT: int = 100
+    # rows fetched from the server-side cursor per /export chunk
+    EXPORT_CHUNK_SIZE: int = 1000
+    # rows validated and copied into the staging tables at a time by /import
+    IMPORT_BATCH_SIZE: int = 1000
+    # processes of /schedule/generate searches, 0 - one per core
+    SCHEDULE_WORKERS: int = 0
+
+    COUNT_STRATEGY: CountStrategy = "exact"
+    COUNT_CACHE_TTL: int = 60
+
+    READ_MODE: Literal["orm", "raw", "json"] = "orm"
+
+    VALIDATION_MODE: Literal["pessimistic", "optimistic"] = "pessimistic"
+
+    # identical concurrent GETs share one response, see api/coalescing.py
+    COALESCE_GET_REQUESTS: bool = True
+
+    REFERENCE_CACHE_TTL: int = 300
+    # tables with more rows are not cached
+    REFERENCE_CACHE_MAX_SIZE: int = 10000
 
     @cached_property
     def api_root_dir_name(self) -> str:
@@ -53,6 +78,21 @@ class DatabaseConfig(GlobalSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
 
+    POOL_SIZE: int = 5
+    POOL_MAX_OVERFLOW: int = 10
+    POOL_TIMEOUT: float = 30
+    POOL_RECYCLE: int = 1800
+    POOL_PRE_PING: bool = False
+    # asyncpg prepared statement cache, 0 when running behind pgbouncer in transaction mode
+    STATEMENT_CACHE_SIZE: int = 100
+    # e.g. {"application_name": "schedule", "jit": "off"}
+    SERVER_SETTINGS: dict[str, str] = {}
+
+    # read replicas as "host" or "host:port", same credentials and database as the primary
+    POSTGRES_REPLICAS: Annotated[list[str] | str, BeforeValidator(parse_list)] = []
+    # a client reads from the primary for this long after its last write
+    REPLICA_STICKY_SECONDS: int = 5
+
     naming_convention: dict[str, str] = {
         "ix": "ix_%(column_0_label)s",
         "uq": "uq_%(table_name)s_%(column_0_N_name)s",
@@ -63,8 +103,24 @@ class DatabaseConfig(GlobalSettings):
 
     @property
     def async_db_url(self) -> str:
+        return self._db_url(self.POSTGRES_SERVER, self.POSTGRES_PORT)
+
+    @property
+    def dsn(self) -> str:
+        """Plain asyncpg DSN of the primary, for connections outside the engine's pool."""
+        return self.async_db_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+    @property
+    def replica_db_urls(self) -> list[str]:
+        urls = []
+        for replica in self.POSTGRES_REPLICAS:
+            server, _, port = replica.partition(":")
+            urls.append(self._db_url(server, int(port or self.POSTGRES_PORT)))
+        return urls
+
+    def _db_url(self, server: str, port: int) -> str:
         password = quote(self.POSTGRES_PASSWORD)
-        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{password}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{password}@{server}:{port}/{self.POSTGRES_DB}"
 
 
 class AppSettings(GlobalSettings):
@@ -0,0 +1,46 @@
+from time import monotonic
+from typing import Iterable, Optional
+
+from backend.core.config import settings
+from backend.core.table_versions import table_versions
+
+
+class CountCache:
+    """Per-table row counters for the 'cached' count strategy.
+
+    Entries expire after ``ttl`` seconds and are dropped as soon as a transaction
+    of this worker that changed the table commits (``table_versions`` marks, which
+    include the tables ``ON DELETE CASCADE`` reaches), so other workers catch up
+    within one TTL.
+    """
+
+    def __init__(self, ttl: int) -> None:
+        self._ttl = ttl
+        self._counts: dict[str, tuple[int, float]] = {}
+
+    def get(self, table_name: str) -> Optional[int]:
+        if (entry := self._counts.get(table_name)) is None:
+            return None
+
+        count, expires_at = entry
+        if expires_at < monotonic():
+            self._counts.pop(table_name, None)
+            return None
+        return count
+
+    def set(self, table_name: str, count: int) -> None:
+        self._counts[table_name] = (count, monotonic() + self._ttl)
+
+    def invalidate(self, table_name: str) -> None:
+        self._counts.pop(table_name, None)
+
+    def listen(self) -> None:
+        table_versions.on_commit(self._on_commit)
+
+    def _on_commit(self, table_names: Iterable[str]) -> None:
+        for table_name in table_names:
+            self.invalidate(table_name)
+
+
+count_cache = CountCache(ttl=settings.api_config.COUNT_CACHE_TTL)
+count_cache.listen()
@@ -1,7 +1,18 @@
+from itertools import cycle
+from time import perf_counter
 from typing import AsyncGenerator
 
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import orjson
+from fastapi import Request
+from sqlalchemy import AsyncAdaptedQueuePool
+from sqlalchemy.exc import SQLAlchemyError, TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    AsyncSessionTransaction,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from backend.core.config import settings
 from backend.core.logging_config import get_logger
@@ -9,16 +20,88 @@ from backend.core.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection.
+
+    Counters are per process, i.e. per uvicorn worker.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def connect(self):
+        start = perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            wait = perf_counter() - start
+            self.checkouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": self.wait_total / self.checkouts * 1000 if self.checkouts else 0.0,
+            "wait_max_ms": self.wait_max * 1000,
+        }
+
+
 class SessionManager:
+    STICKY_COOKIE = "read_primary"
+
     def __init__(self):
-        self.async_engine = create_async_engine(
-            settings.database.async_db_url,
+        self.async_engine = self._create_engine(settings.database.async_db_url)
+        self.replica_engines = [self._create_engine(url) for url in settings.database.replica_db_urls]
+
+        self.async_session = self._sessionmaker(self.async_engine)
+        # read-only sessions: replicas round-robin, the primary when there are none
+        self._read_sessions = cycle(
+            [
+                self._sessionmaker(engine.execution_options(postgresql_readonly=True))
+                for engine in self.replica_engines or [self.async_engine]
+            ]
+        )
+        self._primary_read_session = self._sessionmaker(self.async_engine.execution_options(postgresql_readonly=True))
+
+    @staticmethod
+    def _create_engine(url: str) -> AsyncEngine:
+        db = settings.database
+        return create_async_engine(
+            url,
             future=True,
             echo=False,
+            json_serializer=lambda obj: orjson.dumps(obj).decode(),
+            json_deserializer=orjson.loads,
+            poolclass=InstrumentedPool,
+            pool_size=db.POOL_SIZE,
+            max_overflow=db.POOL_MAX_OVERFLOW,
+            pool_timeout=db.POOL_TIMEOUT,
+            pool_recycle=db.POOL_RECYCLE,
+            pool_pre_ping=db.POOL_PRE_PING,
+            connect_args={
+                "statement_cache_size": db.STATEMENT_CACHE_SIZE,
+                "server_settings": db.SERVER_SETTINGS,
+            },
         )
 
-        self.async_session = async_sessionmaker(
-            bind=self.async_engine,
+    @staticmethod
+    def _sessionmaker(bind: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+        return async_sessionmaker(
+            bind=bind,
             autocommit=False,
             autoflush=False,
             expire_on_commit=False,
@@ -34,8 +117,51 @@ class SessionManager:
                 await session.rollback()
                 raise
 
+    def read_session_factory(self, request: Request) -> async_sessionmaker[AsyncSession]:
+        """Read-only sessions on a replica, or on the primary while the client's sticky cookie is alive."""
+        if request.cookies.get(self.STICKY_COOKIE):
+            return self._primary_read_session
+        return next(self._read_sessions)
+
+    async def get_read_session(self, request: Request) -> AsyncGenerator[AsyncSession, None]:
+        async with self.read_session_factory(request)() as session:
+            try:
+                yield session
+            except SQLAlchemyError as e:
+                logger.exception(f"Database error: {e}")
+                raise
+
+    async def get_unit_of_work(self, request: Request) -> AsyncGenerator[AsyncSession, None]:
+        """One transaction per request: committed once after the endpoint returns, rolled back on any error.
+
+        Steps that must be able to fail on their own run in a SAVEPOINT, see ``transaction``.
+        Only a committed request gets the sticky primary-read cookie, see ``StickyReadMiddleware``.
+        """
+        async with self.async_session() as session:
+            try:
+                async with session.begin():
+                    yield session
+            except SQLAlchemyError as e:
+                logger.exception(f"Database error: {e}")
+                raise
+        request.state.committed_write = True
+
+    def pool_stats(self) -> dict:
+        return {
+            **self.async_engine.pool.stats(),
+            "replicas": [engine.pool.stats() for engine in self.replica_engines],
+        }
+
     async def dispose(self) -> None:
-        await self.async_engine.dispose()
+        for engine in [self.async_engine, *self.replica_engines]:
+            await engine.dispose()
+
+
+def transaction(session: AsyncSession) -> AsyncSessionTransaction:
+    """A SAVEPOINT inside an already running transaction (unit of work), a new transaction otherwise."""
+    if session.in_transaction():
+        return session.begin_nested()
+    return session.begin()
 
 
 session_manager = SessionManager()
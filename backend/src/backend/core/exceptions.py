@@ -13,6 +13,42 @@ class InvalidLoadStrategyException(BaseAPIException):
         )
 
 
+class InvalidExpandException(BaseAPIException):
+    def __init__(self, relation, allowed_relations):
+        super().__init__(
+            status_code=400, detail=f"Неверная связь в 'expand': {relation}. Допустимые значения: {allowed_relations}"
+        )
+
+
+class InvalidOrderByException(BaseAPIException):
+    def __init__(self, order_by, allowed_columns):
+        super().__init__(
+            status_code=400,
+            detail=f"Неверное поле сортировки 'order_by': {order_by}. Допустимые значения: {allowed_columns}",
+        )
+
+
+class InvalidCursorException(BaseAPIException):
+    def __init__(self, cursor: str):
+        super().__init__(
+            status_code=400,
+            detail=f"Неверный курсор пагинации: '{cursor}'. Курсор не соответствует параметрам сортировки",
+        )
+
+
+class InvalidBatchIdsException(BaseAPIException):
+    def __init__(self, ids: str, limit: int):
+        super().__init__(
+            status_code=400,
+            detail=f"Неверный список идентификаторов: '{ids}'. Ожидается от 1 до {limit} целых чисел",
+        )
+
+
+class InvalidImportFileException(BaseAPIException):
+    def __init__(self, reason: str):
+        super().__init__(status_code=400, detail=f"Файл импорта не может быть прочитан: {reason}")
+
+
 class DatabaseConnectionError(BaseAPIException):
     def __init__(self):
         super().__init__(
@@ -66,6 +102,39 @@ class DuplicateStudentGroupException(BaseAPIException):
         )
 
 
+class DuplicateClassroomException(BaseAPIException):
+    def __init__(self, classroom_name: str):
+        super().__init__(
+            status_code=400,
+            detail=f"Учебный класс '{classroom_name}' уже существует.",
+        )
+
+
+class InvalidReferenceException(BaseAPIException):
+    def __init__(self, entity: str, entity_id):
+        super().__init__(
+            status_code=400,
+            detail=f"Объект '{entity}' с идентификатором '{entity_id}' не существует",
+        )
+
+
+class LessonSlotConflictException(BaseAPIException):
+    def __init__(self, entity: str, entity_id, lesson_date, school_shift: int, lesson_number: int):
+        super().__init__(
+            status_code=409,
+            detail=(
+                f"Объект '{entity}' с идентификатором '{entity_id}' уже занят: "
+                f"{lesson_date}, смена {school_shift}, урок {lesson_number}"
+            ),
+        )
+
+
+class NotModifiedException(BaseAPIException):
+    def __init__(self, etag: str):
+        super().__init__(status_code=304, detail="")
+        self.headers = {"ETag": etag}
+
+
 class RequestDataMissingException(BaseAPIException):
     def __init__(self):
         super().__init__(status_code=400, detail="Отсутствуют данные запроса")
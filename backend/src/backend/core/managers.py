@@ -58,6 +58,8 @@ class DatabaseManager:
             try:
                 async with session_manager.async_engine.begin() as conn:
                     logger.info("🔄 Creating database tables")
+                    # operator class of the teacher name search index
+                    await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
                     await conn.run_sync(Base.metadata.create_all)
                     logger.info("✅ Tables successfully created")
 
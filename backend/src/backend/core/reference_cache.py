@@ -0,0 +1,119 @@
+import asyncio
+from time import monotonic
+from typing import Iterable, Optional
+
+import asyncpg
+from sqlalchemy import Table, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.config import settings
+from backend.core.logging_config import get_logger
+from backend.core.table_versions import table_versions
+
+logger = get_logger(__name__)
+
+
+class ReferenceCache:
+    """In-process id sets of rarely changing reference tables (subjects, classrooms).
+
+    A table's ids are loaded with one SELECT and then answer lookups without touching the
+    database until the entry expires after ``ttl`` seconds or the table's version is bumped
+    by any worker: every worker LISTENs on the ``table_versions`` channel, see ``start``.
+    Tables with more than ``max_size`` rows are not cached. While the listener is not
+    connected the cache is bypassed, so a worker never serves ids it can't invalidate.
+    """
+
+    RECONNECT_DELAY = 5
+
+    def __init__(self, ttl: int, max_size: int) -> None:
+        self._ttl = ttl
+        self._max_size = max_size
+        self._ids: dict[str, tuple[frozenset[int], float]] = {}
+        # bumped on invalidation, so a load that raced with it is not stored
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+        self._listening = False
+        self._task: Optional[asyncio.Task] = None
+
+    async def existing_ids(self, session: AsyncSession, table: Table, ids: Iterable[int]) -> set[int]:
+        """The subset of ``ids`` present in ``table``."""
+        if not (ids := set(ids)):
+            return ids
+
+        if (cached := await self._get_ids(session, table)) is not None and ids <= cached:
+            return ids
+
+        # unknown ids: invalid, or created by a transaction whose notification is still on its way
+        stmt = select(table.c.id).where(table.c.id.in_(ids))
+        return set(await session.scalars(stmt))
+
+    async def _get_ids(self, session: AsyncSession, table: Table) -> Optional[frozenset[int]]:
+        if not self._listening:
+            return None
+
+        if (entry := self._ids.get(table.name)) is not None:
+            ids, expires_at = entry
+            if expires_at >= monotonic():
+                return ids
+            self._ids.pop(table.name, None)
+
+        generation = self._generation(table.name)
+        ids = frozenset(await session.scalars(select(table.c.id).limit(self._max_size + 1)))
+        if len(ids) > self._max_size:
+            return None
+
+        if self._listening and generation == self._generation(table.name):
+            self._ids[table.name] = (ids, monotonic() + self._ttl)
+        return ids
+
+    def _generation(self, table_name: str) -> tuple[int, int]:
+        return self._epoch, self._generations.get(table_name, 0)
+
+    def invalidate(self, table_name: str) -> None:
+        self._generations[table_name] = self._generations.get(table_name, 0) + 1
+        self._ids.pop(table_name, None)
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self._ids.clear()
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _listen(self) -> None:
+        # a dedicated connection: a LISTEN must outlive any pooled checkout
+        while True:
+            try:
+                conn = await asyncpg.connect(settings.database.dsn)
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(f"Reference cache listener can't connect: {e}")
+                await asyncio.sleep(self.RECONNECT_DELAY)
+                continue
+
+            closed = asyncio.Event()
+            conn.add_termination_listener(lambda _: closed.set())
+            try:
+                await conn.add_listener(table_versions.CHANNEL, self._on_notify)
+                self.clear()
+                self._listening = True
+                await closed.wait()
+                logger.warning("Reference cache listener disconnected")
+            finally:
+                self._listening = False
+                self.clear()
+                await conn.close()
+
+    def _on_notify(self, conn, pid, channel, table_name: str) -> None:
+        self.invalidate(table_name)
+
+
+reference_cache = ReferenceCache(
+    ttl=settings.api_config.REFERENCE_CACHE_TTL,
+    max_size=settings.api_config.REFERENCE_CACHE_MAX_SIZE,
+)
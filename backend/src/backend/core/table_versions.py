@@ -0,0 +1,82 @@
+from typing import Callable, Iterable
+
+from sqlalchemy import ARRAY, BigInteger, String, cast, column, event, func, literal, select, table
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+# mapped as entities.table_version.models.TableVersion
+_versions_table = table(
+    "table_versions",
+    column("table_name", String),
+    column("version", BigInteger),
+)
+
+
+class TableVersions:
+    """Per-table change counters shared by all workers through the database.
+
+    Writes only mark their tables in the session (``mark_changed``); the counters of all
+    marked tables are bumped with one statement right before the transaction commits.
+    The same statement NOTIFYs ``CHANNEL`` with each bumped table name, Postgres delivers
+    the notifications on commit only. ``on_commit`` callbacks get the bumped names once
+    the outermost transaction has committed.
+    """
+
+    CHANNEL = "table_versions"
+    _info_key = "changed_tables"
+    _bumped_key = "bumped_tables"
+
+    def __init__(self) -> None:
+        self._commit_callbacks: list[Callable[[set[str]], None]] = []
+
+    def mark_changed(self, session: AsyncSession | Session, *table_names: str) -> None:
+        session.info.setdefault(self._info_key, set()).update(table_names)
+
+    async def get(self, session: AsyncSession, table_names: Iterable[str]) -> dict[str, int]:
+        table_names = list(table_names)
+        stmt = select(_versions_table.c.table_name, _versions_table.c.version).where(
+            _versions_table.c.table_name.in_(table_names)
+        )
+        versions = dict((await session.execute(stmt)).tuples().all())
+        return {name: versions.get(name, 0) for name in table_names}
+
+    def on_commit(self, callback: Callable[[set[str]], None]) -> None:
+        self._commit_callbacks.append(callback)
+
+    def listen(self) -> None:
+        # AsyncSession commits through the wrapped sync Session, so the bump joins its transaction
+        event.listen(Session, "before_commit", self._on_before_commit)
+        event.listen(Session, "after_commit", self._on_after_commit)
+        event.listen(Session, "after_soft_rollback", self._on_after_soft_rollback)
+
+    def _on_before_commit(self, session: Session) -> None:
+        if not (changed := session.info.pop(self._info_key, None)):
+            return
+
+        names = select(func.unnest(cast(sorted(changed), ARRAY(String))), literal(1))
+        stmt = insert(_versions_table).from_select(["table_name", "version"], names)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["table_name"],
+            set_={"version": _versions_table.c.version + 1},
+        )
+        bumped = stmt.returning(_versions_table.c.table_name).cte("bumped")
+        session.execute(select(func.pg_notify(self.CHANNEL, bumped.c.table_name)).select_from(bumped))
+        session.info.setdefault(self._bumped_key, set()).update(changed)
+
+    def _on_after_commit(self, session: Session) -> None:
+        # before_commit runs on a SAVEPOINT release too, the callbacks wait for the real commit
+        if session.in_nested_transaction() or not (bumped := session.info.pop(self._bumped_key, None)):
+            return
+        for callback in self._commit_callbacks:
+            callback(bumped)
+
+    def _on_after_soft_rollback(self, session: Session, previous_transaction: SessionTransaction) -> None:
+        # a failed SAVEPOINT step doesn't undo the unit of work's earlier writes, keep their marks
+        if previous_transaction.parent is None:
+            session.info.pop(self._info_key, None)
+            session.info.pop(self._bumped_key, None)
+
+
+table_versions = TableVersions()
+table_versions.listen()
@@ -1,10 +1,49 @@
-from typing import Any, Generic, Optional, Sequence, Type, TypeVar
-
-from pydantic import BaseModel
-from sqlalchemy import MetaData, Select, func, inspect, select
-from sqlalchemy.ext.asyncio import AsyncSession
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cached_property, partial
+from itertools import chain
+from typing import Any, AsyncIterator, Callable, Generic, Optional, Sequence, Type, TypeVar, get_args
+
+import orjson
+from pydantic import BaseModel, model_validator
+from pydantic.fields import FieldInfo
+from sqlalchemy import (
+    ARRAY,
+    JSON,
+    BigInteger,
+    Column,
+    ColumnElement,
+    Integer,
+    MetaData,
+    RowMapping,
+    ScalarSelect,
+    Select,
+    String,
+    Text,
+    and_,
+    any_,
+    bindparam,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    inspect,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    tuple_,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import (
     DeclarativeBase,
+    RelationshipProperty,
     class_mapper,
     declared_attr,
     joinedload,
@@ -13,17 +52,24 @@ from sqlalchemy.orm import (
     subqueryload,
 )
 
-from backend.api.depends import PaginationParamsDep
-from backend.core.config import settings
+from backend.api.depends import ExpandParamsDep, PaginationParamsDep
+from backend.core.config import CountStrategy, settings
+from backend.core.count_cache import count_cache
 from backend.core.exceptions import (
     DatabaseConnectionError,
+    InvalidExpandException,
     InvalidLoadStrategyException,
+    InvalidOrderByException,
     NotFoundException,
     RequestDataMissingException,
 )
 from backend.core.logging_config import get_logger
+from backend.core.table_versions import table_versions
 from backend.utils.case_converter import camel_case_to_snake_case
 from backend.utils.common_utils import get_bound_arguments
+from backend.utils.export import ExportFormat, csv_chunk, ndjson_chunk
+from backend.utils.filters import FilterParams
+from backend.utils.pagination import decode_cursor, encode_cursor
 
 logger = get_logger(__name__)
 
@@ -78,31 +124,120 @@ class CustomBaseModel(BaseModel):
         from_attributes = True
 
 
+class ExpandableResponseModel(CustomBaseModel):
+    """Relations that weren't loaded (see ``expand``) stay unset and are omitted from the response."""
+
+    @model_validator(mode="before")
+    @classmethod
+    def skip_unloaded_relations(cls, data: Any) -> Any:
+        if isinstance(data, Base):
+            unloaded = inspect(data).unloaded
+            return {
+                name: getattr(data, name)
+                for name in cls.model_fields
+                if name not in unloaded and hasattr(data, name)
+            }
+        return data
+
+
 T = TypeVar("T")
 
 
+@dataclass
+class Page:
+    items: Sequence[Any]
+    total: int
+    next_cursor: Optional[str] = None
+    count_strategy: CountStrategy = "exact"
+
+
 class ListResponseModel(CustomBaseModel, Generic[T]):
     items: Sequence[T]
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
+    count_strategy: CountStrategy = "exact"
+
+    @classmethod
+    def from_page(cls, page: Page, pagination: PaginationParamsDep):
+        return cls(
+            items=page.items,
+            total=page.total,
+            limit=pagination.limit,
+            offset=pagination.offset,
+            next_cursor=page.next_cursor,
+            count_strategy=page.count_strategy,
+        )
+
+
+@dataclass
+class Batch:
+    items: Sequence[Any]
+    missing_ids: list[int]
+
+
+class BatchResponseModel(CustomBaseModel, Generic[T]):
+    items: Sequence[T]
+    missing_ids: list[int]
+
+    @classmethod
+    def from_batch(cls, batch: Batch):
+        return cls(items=batch.items, missing_ids=batch.missing_ids)
+
+
+class ImportRowError(CustomBaseModel):
+    row: int
+    detail: str
+
+
+class ImportReport(CustomBaseModel):
+    imported: int
+    errors: list[ImportRowError]
 
 
 # INFO: BASEs
 
 
 class BaseRepository:
+    # SQL for computed fields of the response schemas, for output rendered by Postgres (exports)
+    computed_columns: dict[str, ColumnElement] = {}
+
     def __init__(self, sql_model: Type[Any]) -> None:
         self.sql_model = sql_model
 
+    @cached_property
+    def versioned_tables(self) -> tuple[str, ...]:
+        """The entity's table and the tables of its relations, i.e. everything its responses are built from."""
+        mapper = inspect(self.sql_model)
+        return (mapper.local_table.name, *(rel.target.name for rel in mapper.relationships))
+
+    @cached_property
+    def cascaded_tables(self) -> tuple[str, ...]:
+        """Tables whose rows ``ON DELETE CASCADE`` removes together with an entity (e.g. its lessons)."""
+        table = self.sql_model.__table__
+        return tuple(
+            sorted(
+                {
+                    foreign_key.parent.table.name
+                    for other in table.metadata.tables.values()
+                    for foreign_key in other.foreign_keys
+                    if foreign_key.column.table is table and foreign_key.ondelete == "CASCADE"
+                }
+            )
+        )
+
     async def get_by_id(
-        self, session: AsyncSession, id: int, load_strategy: Optional[str] = None
+        self,
+        session: AsyncSession,
+        id: int,
+        load_strategy: Optional[str] = None,
+        expand: Optional[ExpandParamsDep] = None,
     ):
         stmt = select(self.sql_model).where(self.sql_model.id == id)
-        if load_strategy is not None:
-            stmt = self._apply_load_strategy(stmt, load_strategy)
+        stmt = self._apply_load_strategy(stmt, load_strategy, expand)
         result = await session.execute(stmt)
-        entity = result.scalars().first()
+        entity = result.unique().scalars().first()
 
         if entity is None:
             logger.error(f"Entity {self.sql_model.__name__} with id:{id} wasn't found")
@@ -110,31 +245,379 @@ class BaseRepository:
 
         return entity
 
-    async def list_all(
+    async def get_many(
+        self,
+        session: AsyncSession,
+        ids: Sequence[int],
+        load_strategy: Optional[str] = None,
+        expand: Optional[ExpandParamsDep] = None,
+    ) -> Batch:
+        """Entities for ``ids`` in the order asked for, with one ``WHERE id = ANY(:ids)``.
+
+        The ids go as a single array parameter, so every batch size shares one prepared statement.
+        """
+        ids_param = bindparam(None, list(ids), type_=ARRAY(Integer))
+        stmt = select(self.sql_model).where(self.sql_model.id == any_(ids_param))
+        stmt = self._apply_load_strategy(stmt, load_strategy, expand)
+        result = await session.execute(stmt)
+        entities = {entity.id: entity for entity in result.unique().scalars()}
+
+        return Batch(
+            items=[entities[id] for id in ids if id in entities],
+            missing_ids=[id for id in ids if id not in entities],
+        )
+
+    async def insert_returning(
+        self, session: AsyncSession, values: Sequence[Mapping[str, Any]]
+    ) -> Sequence[RowMapping]:
+        """Inserts all ``values`` with one ``INSERT ... RETURNING``, rows come back in input order."""
+        table = self.sql_model.__table__
+        stmt = insert(table).returning(*table.c, sort_by_parameter_order=True)
+        result = await session.execute(stmt, list(values))
+        table_versions.mark_changed(session, table.name)
+        return result.mappings().all()
+
+    async def update_returning(
+        self, session: AsyncSession, id: int, values: Mapping[str, Any]
+    ) -> RowMapping:
+        table = self.sql_model.__table__
+        if values:
+            stmt = update(table).where(table.c.id == id).values(**values).returning(*table.c)
+            table_versions.mark_changed(session, table.name)
+        else:
+            stmt = select(*table.c).where(table.c.id == id)
+        row = (await session.execute(stmt)).mappings().first()
+
+        if row is None:
+            logger.error(f"Entity {self.sql_model.__name__} with id:{id} wasn't found")
+            raise NotFoundException(self.sql_model.__name__, id)
+
+        return row
+
+    async def relation_rows(self, session: AsyncSession, id: int, schema: Type[BaseModel]) -> RowMapping:
+        """The relation arrays ``schema`` shows for one entity, aggregated by one select with json_agg."""
+        columns = self.sql_model.__table__.c
+        relations = {key: expression for key, expression in self._projection(schema).items() if key not in columns}
+        stmt = select(*(expression.label(key) for key, expression in relations.items())).where(columns.id == id)
+        return (await session.execute(stmt)).mappings().one()
+
+    async def delete(self, session: AsyncSession, id: int) -> None:
+        """Association rows go away through ``ON DELETE CASCADE``, nothing is loaded beforehand."""
+        table = self.sql_model.__table__
+        stmt = delete(table).where(table.c.id == id).returning(table.c.id)
+
+        if await session.scalar(stmt) is None:
+            logger.error(f"Entity {self.sql_model.__name__} with id:{id} wasn't found")
+            raise NotFoundException(self.sql_model.__name__, id)
+
+        table_versions.mark_changed(session, *self.versioned_tables, *self.cascaded_tables)
+
+    async def list_page(
         self,
         session: AsyncSession,
         pagination: PaginationParamsDep,
         load_strategy: Optional[str] = None,
-    ) -> Sequence[Any]:
-        stmt = select(self.sql_model)
-        stmt = self._apply_load_strategy(stmt, load_strategy)
-        stmt = self._apply_pagination(stmt, pagination)
+        expand: Optional[ExpandParamsDep] = None,
+        schema: Optional[Type[BaseModel]] = None,
+        filters: Optional[FilterParams] = None,
+    ) -> Page:
+        """Page items and total count in one statement: the total is an uncorrelated scalar subquery.
+
+        How the total is obtained depends on ``COUNT_STRATEGY``; a cached total skips it altogether.
+        Filtered pages always count exactly, both the table estimate and the cache are per table.
+        With ``READ_MODE=raw`` and a response ``schema`` the page is read by ``list_rows`` instead.
+        """
+        if schema is not None and settings.api_config.READ_MODE == "raw":
+            return await self.list_rows(session, pagination, schema, expand, filters)
+
+        stmt = self._apply_load_strategy(select(self.sql_model), load_strategy, expand)
+        return await self._fetch_page(session, stmt, pagination, filters=filters)
+
+    async def list_rows(
+        self,
+        session: AsyncSession,
+        pagination: PaginationParamsDep,
+        schema: Type[BaseModel],
+        expand: Optional[ExpandParamsDep] = None,
+        filters: Optional[FilterParams] = None,
+    ) -> Page:
+        """Raw read mode: selects only the columns ``schema`` needs, aggregates relation rows
+        with json_agg and returns plain dicts, no mapped instances are created."""
+        projection = self._projection(schema, expand)
+        for key, page_column in self._page_columns(pagination).items():
+            projection.setdefault(key, page_column)
+
+        stmt = select(*(expression.label(key) for key, expression in projection.items()))
+        return await self._fetch_page(session, stmt, pagination, raw=True, filters=filters)
+
+    async def list_json(
+        self,
+        session: AsyncSession,
+        pagination: PaginationParamsDep,
+        schema: Type[BaseModel],
+        expand: Optional[ExpandParamsDep] = None,
+        filters: Optional[FilterParams] = None,
+    ) -> bytes:
+        """JSON read mode: Postgres renders every item with json_build_object (relations included),
+        the response body is assembled from those bytes without decoding or validating them."""
+        projection = self._projection(schema, expand, by_alias=False)
+        item = func.json_build_object(
+            *chain.from_iterable((literal(key, String), expression) for key, expression in projection.items())
+        )
+        stmt = select(
+            cast(item, Text).label("item"),
+            *(page_column.label(key) for key, page_column in self._page_columns(pagination).items()),
+        )
+        page = await self._fetch_page(session, stmt, pagination, raw=True, filters=filters)
+
+        meta = orjson.dumps(
+            {
+                "total": page.total,
+                "limit": pagination.limit,
+                "offset": pagination.offset,
+                "next_cursor": page.next_cursor,
+                "count_strategy": page.count_strategy,
+            }
+        )
+        items = b",".join(row["item"].encode() for row in page.items)
+        return b'{"items":[' + items + b"]," + meta[1:]
+
+    def export(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        schema: Type[BaseModel],
+        export_format: ExportFormat,
+        expand: Optional[ExpandParamsDep] = None,
+        filters: Optional[FilterParams] = None,
+    ) -> AsyncIterator[bytes]:
+        """All rows (matching ``filters``) in id order as NDJSON or CSV chunks for a streaming response.
+
+        Rows come from a server-side cursor, ``EXPORT_CHUNK_SIZE`` at a time, with relations
+        aggregated per row like ``list_rows`` does, so memory use doesn't grow with the table.
+        The chunks open their own session: a request's session is closed before the body is sent.
+        The statement is built here, so invalid ``expand`` fails before the response starts.
+        """
+        projection = self._projection(schema, expand, by_alias=False)
+        conditions = filters.conditions(self.sql_model) if filters is not None else []
+
+        if export_format == "ndjson":
+            item = func.json_build_object(
+                *chain.from_iterable((literal(key, String), expression) for key, expression in projection.items())
+            )
+            columns = [cast(item, Text).label("item")]
+        else:
+            # relations go into their cell as JSON text
+            columns = [
+                (cast(expression, Text) if isinstance(expression, ScalarSelect) else expression).label(key)
+                for key, expression in projection.items()
+            ]
+        stmt = select(*columns).where(*conditions).order_by(self.sql_model.__table__.c.id)
+        stmt = stmt.execution_options(yield_per=settings.api_config.EXPORT_CHUNK_SIZE)
+
+        async def chunks() -> AsyncIterator[bytes]:
+            if export_format == "csv":
+                yield csv_chunk([projection.keys()])
+
+            async with session_factory() as session:
+                result = await session.stream(stmt)
+                async for rows in result.partitions():
+                    yield ndjson_chunk(rows) if export_format == "ndjson" else csv_chunk(rows)
+
+        return chunks()
+
+    async def _fetch_page(
+        self,
+        session: AsyncSession,
+        stmt: Select,
+        pagination: PaginationParamsDep,
+        raw: bool = False,
+        filters: Optional[FilterParams] = None,
+    ) -> Page:
+        conditions = filters.conditions(self.sql_model) if filters is not None else []
+        strategy = "exact" if conditions else settings.api_config.COUNT_STRATEGY
+        table_name = self.sql_model.__tablename__
+        cached_total = count_cache.get(table_name) if strategy == "cached" else None
+
+        if cached_total is None:
+            stmt = stmt.add_columns(self._total_subquery(strategy, conditions).label("total"))
+        stmt = self._apply_pagination(stmt.where(*conditions), pagination)
 
         result = await session.execute(stmt)
-        return result.scalars().unique().all()
+        if raw:
+            rows = result.all()
+            items = [
+                {key: value for key, value in row._mapping.items() if key != "total"}
+                for row in rows
+            ]
+        else:
+            rows = result.unique().all()
+            items = [row[0] for row in rows]
+
+        if cached_total is not None:
+            total, used_strategy = cached_total, "cached"
+        elif rows and rows[0].total is not None:
+            total = rows[0].total
+            used_strategy = "estimated" if strategy == "estimated" else "exact"
+        elif not rows and pagination.offset == 0 and pagination.cursor is None:
+            total, used_strategy = 0, "exact"
+        else:
+            total, used_strategy = await self.entity_count(session, conditions), "exact"
 
-    async def entity_count(self, session) -> int:
-        count_stmt = select(func.count()).select_from(self.sql_model)
+        if strategy == "cached" and used_strategy == "exact":
+            count_cache.set(table_name, total)
+
+        return Page(
+            items=items,
+            total=total,
+            next_cursor=self.next_cursor(items, pagination),
+            count_strategy=used_strategy,
+        )
+
+    async def entity_count(self, session, conditions: Sequence[ColumnElement] = ()) -> int:
+        count_stmt = select(func.count()).select_from(self.sql_model).where(*conditions)
         result = await session.execute(count_stmt)
         return result.scalar()
 
+    def _total_subquery(self, strategy: CountStrategy, conditions: Sequence[ColumnElement] = ()) -> ScalarSelect:
+        if strategy != "estimated":
+            return select(func.count()).select_from(self.sql_model).where(*conditions).scalar_subquery()
+
+        # NOTE: planner statistics, NULL until the table was analyzed at least once
+        pg_class = table("pg_class", column("oid"), column("reltuples"))
+        return (
+            select(
+                case(
+                    (pg_class.c.reltuples < 0, None),
+                    else_=cast(pg_class.c.reltuples, BigInteger),
+                )
+            )
+            .where(pg_class.c.oid == func.to_regclass(self.sql_model.__tablename__))
+            .scalar_subquery()
+        )
+
+    def next_cursor(
+        self, items: Sequence[Any], pagination: PaginationParamsDep
+    ) -> Optional[str]:
+        if not pagination.is_cursor_mode or len(items) < pagination.limit:
+            return None
+
+        last_item = items[-1]
+        if isinstance(last_item, Mapping):
+            get_value = last_item.__getitem__
+        else:
+            get_value = partial(getattr, last_item)
+
+        order_column = self._keyset_column(pagination)
+        value = get_value(order_column.key) if order_column is not None else None
+        return encode_cursor(pagination.order_by, pagination.desc, value, get_value("id"))
+
     def _apply_load_strategy(
-        self, stmt: Select, load_strategy: Optional[str] = None
+        self,
+        stmt: Select,
+        load_strategy: Optional[str] = None,
+        expand: Optional[ExpandParamsDep] = None,
     ) -> Select:
         model_relations = inspect(self.sql_model).relationships.keys()
-        if not model_relations or load_strategy is None:
+        if not model_relations:
             return stmt
 
+        if expand is None or expand.expand_all:
+            if load_strategy is None:
+                return stmt
+            relations = dict.fromkeys(model_relations, load_strategy)
+        else:
+            self._validate_expand(expand)
+            relations = {
+                rel: rel_strategy or load_strategy or "selectin"
+                for rel, rel_strategy in expand.relations.items()
+            }
+
+        options = [
+            self._get_load_method(rel_strategy)(getattr(self.sql_model, rel))
+            for rel, rel_strategy in relations.items()
+        ]
+        return stmt.options(*options)
+
+    def _validate_expand(self, expand: ExpandParamsDep) -> None:
+        model_relations = inspect(self.sql_model).relationships.keys()
+        if unknown := [rel for rel in expand.relations if rel not in model_relations]:
+            logger.error(f"Invalid expand relation: {unknown[0]}.")
+            raise InvalidExpandException(unknown[0], model_relations)
+
+    def _projection(
+        self,
+        schema: Type[BaseModel],
+        expand: Optional[ExpandParamsDep] = None,
+        by_alias: bool = True,
+    ) -> dict[str, ColumnElement]:
+        """Columns for ``schema`` fields: model columns as is, expanded relations as json arrays.
+
+        Keys are validation aliases (``by_alias``) to feed the schema, or field names for output JSON.
+        """
+        relationships = inspect(self.sql_model).relationships
+        columns = self.sql_model.__table__.c
+
+        if expand is not None and not expand.expand_all:
+            self._validate_expand(expand)
+
+        projection: dict[str, ColumnElement] = {}
+        for name, field in schema.model_fields.items():
+            source = self._source_name(name, field)
+            key = source if by_alias else name
+            if source in columns:
+                projection[key] = columns[source]
+            elif source in relationships and (
+                expand is None or expand.expand_all or source in expand.relations
+            ):
+                projection[key] = self._aggregate_relation(relationships[source], field, by_alias)
+        if not by_alias:
+            # validated input recomputes these itself
+            computed = schema.model_computed_fields.keys() & self.computed_columns.keys()
+            projection.update((name, self.computed_columns[name]) for name in sorted(computed))
+        return projection
+
+    def _page_columns(self, pagination: PaginationParamsDep) -> dict[str, ColumnElement]:
+        """Columns ``next_cursor`` reads from the last row of a page."""
+        columns = {"id": self.sql_model.__table__.c.id}
+        if (order_column := self._keyset_column(pagination)) is not None:
+            columns[order_column.key] = order_column
+        return columns
+
+    def _aggregate_relation(
+        self, relationship: RelationshipProperty, field: FieldInfo, by_alias: bool = True
+    ) -> ScalarSelect:
+        """Correlated ``SELECT coalesce(json_agg(json_build_object(...)), '[]')`` over the related rows."""
+        target_columns = relationship.mapper.local_table.c
+        nested_schema = self._nested_schema(field.annotation)
+
+        pairs = []
+        for name, nested_field in nested_schema.model_fields.items():
+            source = self._source_name(name, nested_field)
+            if source in target_columns:
+                pairs += [literal(source if by_alias else name, String), target_columns[source]]
+
+        rows = func.json_agg(func.json_build_object(*pairs))
+        return (
+            select(func.coalesce(rows, literal_column("'[]'::json"), type_=JSON))
+            .where(relationship.primaryjoin)
+            .scalar_subquery()
+        )
+
+    @staticmethod
+    def _source_name(name: str, field: FieldInfo) -> str:
+        return field.validation_alias if isinstance(field.validation_alias, str) else name
+
+    @classmethod
+    def _nested_schema(cls, annotation: Any) -> Optional[Type[BaseModel]]:
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return annotation
+        for arg in get_args(annotation):
+            if (nested := cls._nested_schema(arg)) is not None:
+                return nested
+        return None
+
+    @staticmethod
+    def _get_load_method(load_strategy: str):
         load_methods = {
             "selectin": selectinload,
             "joined": joinedload,
@@ -146,13 +629,14 @@ class BaseRepository:
             logger.error(f"Invalid load strategy: {load_strategy}.")
             raise InvalidLoadStrategyException(load_strategy, load_methods.keys())
 
-        load_method = load_methods[load_strategy]
-        options = [load_method(getattr(self.sql_model, rel)) for rel in model_relations]
-        return stmt.options(*options)
+        return load_methods[load_strategy]
 
     def _apply_pagination(
         self, stmt: Select, pagination: PaginationParamsDep
     ) -> Select:
+        if pagination.is_cursor_mode:
+            return self._apply_keyset(stmt, pagination)
+
         if pagination.order_by and hasattr(self.sql_model, pagination.order_by):
             order_clause = getattr(self.sql_model, pagination.order_by)
             stmt = stmt.order_by(
@@ -160,9 +644,74 @@ class BaseRepository:
             )
         return stmt.offset(pagination.offset).limit(pagination.limit)
 
+    def _apply_keyset(self, stmt: Select, pagination: PaginationParamsDep) -> Select:
+        """Keyset pagination over (order_by, id): WHERE (col, id) > (:value, :id).
+
+        NULLs sort the way the offset mode sorts them, last ascending and first descending,
+        so a nullable column gets an ``IS NULL`` branch next to the row comparison.
+        """
+        order_column = self._keyset_column(pagination)
+        id_column = self.sql_model.id
+
+        if pagination.cursor is not None:
+            value, last_id = decode_cursor(
+                pagination.cursor, pagination.order_by, pagination.desc
+            )
+            after_id = id_column < last_id if pagination.desc else id_column > last_id
+            if order_column is None:
+                condition = after_id
+            elif value is None:
+                condition = and_(order_column.is_(None), after_id)
+                if pagination.desc:
+                    condition = or_(condition, order_column.is_not(None))
+            else:
+                key = tuple_(order_column, id_column)
+                bound = tuple_(
+                    bindparam(None, self._cursor_value(order_column, value), type_=order_column.type),
+                    last_id,
+                )
+                condition = key < bound if pagination.desc else key > bound
+                if order_column.nullable and not pagination.desc:
+                    condition = or_(condition, order_column.is_(None))
+            stmt = stmt.where(condition)
+
+        order_columns = [id_column] if order_column is None else [order_column, id_column]
+        stmt = stmt.order_by(
+            *(column.desc() if pagination.desc else column for column in order_columns)
+        )
+        return stmt.limit(pagination.limit)
+
+    def _keyset_column(self, pagination: PaginationParamsDep) -> Optional[Column]:
+        """The column ordered by before id, None for id alone."""
+        column = self.sql_model.__table__.c.get(pagination.order_by or "id")
+        if column is None:
+            raise InvalidOrderByException(pagination.order_by, self.sql_model.__table__.c.keys())
+        if column.key == "id":
+            return None
+        return column
+
+    @staticmethod
+    def _cursor_value(column: Column, value: Any) -> Any:
+        python_type = column.type.python_type
+        if isinstance(value, str) and hasattr(python_type, "fromisoformat"):
+            return python_type.fromisoformat(value)
+        return value
+
 
 class BaseValidator:
+    """Checks the request before ``func`` runs.
+
+    VALIDATION_MODE 'pessimistic' runs ``validate`` (in-memory checks plus SELECTs) in the
+    request's transaction. 'optimistic' runs only ``check_request_data`` and lets the
+    unique/foreign-key constraints reject the write; ``constraint_errors`` maps the
+    violated constraint to the API exception the pessimistic check would have raised.
+    Either way the unit of work rolls the request back when an exception leaves it.
+    """
+
+    constraint_errors: dict[str, Callable[["BaseValidator", Optional[str]], Exception]] = {}
+
     def __init__(self, func, *args, **kwargs):
+        self.func, self.args, self.kwargs = func, args, kwargs
         bound_args = get_bound_arguments(func, *args, **kwargs)
 
         if not (session := bound_args.arguments.get("session")):
@@ -179,3 +728,35 @@ class BaseValidator:
             (v for k, v in bound_args.arguments.items() if k.endswith("id")),
             None,
         )
+
+    def check_request_data(self) -> None:
+        """Checks that need no database, they run in both modes."""
+
+    async def validate(self) -> None:
+        raise NotImplementedError
+
+    async def run(self):
+        if settings.api_config.VALIDATION_MODE == "pessimistic":
+            await self.validate()
+        else:
+            self.check_request_data()
+
+        # the constraints stay the backstop in pessimistic mode too, e.g. for a cached id
+        # whose row another worker has just deleted
+        try:
+            return await self.func(*self.args, **self.kwargs)
+        except IntegrityError as error:
+            if (exception := self.translate_integrity_error(error)) is None:
+                raise
+            raise exception from error
+
+    def translate_integrity_error(self, error: IntegrityError) -> Optional[Exception]:
+        violation = error.orig.__cause__
+        constraint_name = getattr(violation, "constraint_name", None)
+
+        if (make_exception := self.constraint_errors.get(constraint_name)) is None:
+            return None
+
+        # e.g. 'Key (subject_id)=(42) is not present in table "subjects".'
+        key = re.search(r"\)=\((.*)\)", getattr(violation, "detail", None) or "")
+        return make_exception(self, key.group(1) if key else None)
@@ -0,0 +1,210 @@
+from collections import Counter
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, List, Optional, Sequence, Type
+
+from fastapi import HTTPException
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import Column, Integer, MetaData, Table, and_, exists, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateTable
+
+from backend.core.config import settings
+from backend.core.exceptions import BaseAPIException, DuplicateSubjectIDException, InvalidSubjectIDException
+from backend.core.table_versions import table_versions
+from backend.entities.base import Base, ImportReport, ImportRowError
+from backend.utils.bulk_import import ImportParams, RawRow, read_rows
+
+if TYPE_CHECKING:
+    from backend.entities.relations.sync import AssociationSync
+
+# row number, column values, association rows
+StagedRow = tuple[int, dict[str, Any], List[dict[str, Any]]]
+
+
+class BulkImport:
+    """Imports a CSV/NDJSON file of POST request bodies into an entity table and its subject association.
+
+    Rows are validated with ``schema`` ``IMPORT_BATCH_SIZE`` at a time and each batch goes through
+    asyncpg ``copy_records_to_table`` into temporary staging tables (dropped on commit). Then, set-based:
+
+    - rows referencing unknown subjects are dropped from staging;
+    - ``INSERT ... SELECT ... ON CONFLICT DO NOTHING RETURNING`` inserts the rest in file order,
+      a data-modifying CTE inserts their association rows in the same statement;
+    - rows whose ``key`` already exists come back as not inserted.
+
+    Rows that fail are reported with the detail of the exception their POST request would have raised.
+    """
+
+    def __init__(
+        self,
+        schema: Type[BaseModel],
+        model: Type[Base],
+        columns: Sequence[str],
+        key: Sequence[str],
+        values: Callable[[Any], dict[str, Any]],
+        duplicate: Callable[[dict[str, Any]], BaseAPIException],
+        association: Optional["AssociationSync"] = None,
+        children: Optional[Callable[[Any], List[dict[str, Any]]]] = None,
+    ) -> None:
+        self.schema = schema
+        self.table = model.__table__
+        self.columns = list(columns)
+        self.key = tuple(key)
+        self.values = values
+        self.duplicate = duplicate
+        self.association = association
+        self.children = children
+
+        metadata = MetaData()
+        self.staging = self._staging_table(metadata, self.table, self.columns)
+        self.staging_children = None
+        if association is not None:
+            self.association_table = association.model.__table__
+            self.child_columns = [association.child_key, *association.value_keys]
+            self.staging_children = self._staging_table(metadata, self.association_table, self.child_columns)
+
+    async def run(self, session: AsyncSession, params: ImportParams) -> ImportReport:
+        errors: List[ImportRowError] = []
+
+        await session.execute(CreateTable(self.staging))
+        if self.staging_children is not None:
+            await session.execute(CreateTable(self.staging_children))
+
+        staged = 0
+        batch: List[StagedRow] = []
+        # the body is read, validated and copied a batch at a time, it is never held whole
+        async for row in self._validated(read_rows(params, self.schema), errors):
+            batch.append(row)
+            if len(batch) == settings.api_config.IMPORT_BATCH_SIZE:
+                await self._copy(session, batch)
+                staged += len(batch)
+                batch = []
+        if batch:
+            await self._copy(session, batch)
+            staged += len(batch)
+
+        if staged:
+            staged -= await self._drop_invalid_children(session, errors)
+            staged -= await self._merge(session, errors)
+
+        if staged:
+            tables = [self.table.name]
+            if self.association is not None:
+                tables.append(self.association_table.name)
+            table_versions.mark_changed(session, *tables)
+
+        return ImportReport(imported=staged, errors=sorted(errors, key=lambda error: error.row))
+
+    async def _validated(
+        self, rows: AsyncIterator[tuple[int, RawRow]], errors: List[ImportRowError]
+    ) -> AsyncIterator[StagedRow]:
+        """What the POST endpoint checks without a database, the rest is left to the merge."""
+        seen = set()
+        async for row_no, row in rows:
+            try:
+                if isinstance(row, str):
+                    raise HTTPException(status_code=400, detail=row)
+                request_data = self.schema.model_validate(row)
+
+                values = self.values(request_data)
+                if (key := tuple(values[name] for name in self.key)) in seen:
+                    raise self.duplicate(values)
+
+                children = self.children(request_data) if self.children is not None else []
+                child_ids = [child[self.association.child_key] for child in children]
+                if duplicates := [id for id, count in Counter(child_ids).items() if count > 1]:
+                    raise DuplicateSubjectIDException(*duplicates)
+            except ValidationError as error:
+                detail = "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in error.errors())
+                errors.append(ImportRowError(row=row_no, detail=detail))
+            except HTTPException as error:
+                # schema field validators raise the API exception directly
+                errors.append(ImportRowError(row=row_no, detail=error.detail))
+            else:
+                seen.add(key)
+                yield row_no, values, children
+
+    async def _copy(self, session: AsyncSession, batch: List[StagedRow]) -> None:
+        connection = await (await session.connection()).get_raw_connection()
+        driver_connection = connection.driver_connection
+
+        await driver_connection.copy_records_to_table(
+            self.staging.name,
+            records=[(row_no, *(values[name] for name in self.columns)) for row_no, values, _ in batch],
+            columns=["row_no", *self.columns],
+        )
+
+        if self.staging_children is not None:
+            await driver_connection.copy_records_to_table(
+                self.staging_children.name,
+                records=[
+                    (row_no, *(child[name] for name in self.child_columns))
+                    for row_no, _, children in batch
+                    for child in children
+                ],
+                columns=["row_no", *self.child_columns],
+            )
+
+    async def _drop_invalid_children(self, session: AsyncSession, errors: List[ImportRowError]) -> int:
+        if self.staging_children is None:
+            return 0
+
+        children = self.staging_children.c
+        child_id = children[self.association.child_key]
+        (foreign_key,) = self.association_table.c[self.association.child_key].foreign_keys
+        target = foreign_key.column
+
+        invalid = (
+            select(children.row_no, func.array_agg(child_id).label("ids"))
+            .where(~exists().where(target == child_id))
+            .group_by(children.row_no)
+            .cte("invalid")
+        )
+        dropped = self.staging.delete().where(self.staging.c.row_no.in_(select(invalid.c.row_no))).cte("dropped")
+        result = await session.execute(select(invalid.c.row_no, invalid.c.ids).add_cte(dropped))
+
+        rows = result.all()
+        errors.extend(ImportRowError(row=row_no, detail=InvalidSubjectIDException(*ids).detail) for row_no, ids in rows)
+        return len(rows)
+
+    async def _merge(self, session: AsyncSession, errors: List[ImportRowError]) -> int:
+        staging = self.staging.c
+
+        inserted = (
+            insert(self.table)
+            .from_select(self.columns, select(*(staging[name] for name in self.columns)).order_by(staging.row_no))
+            .on_conflict_do_nothing()
+            .returning(self.table.c.id, *(self.table.c[name] for name in self.key))
+            .cte("inserted")
+        )
+        matched = and_(*(inserted.c[name] == staging[name] for name in self.key))
+
+        stmt = (
+            select(staging.row_no, *(staging[name] for name in self.key))
+            .select_from(self.staging.outerjoin(inserted, matched))
+            .where(inserted.c.id.is_(None))
+        )
+        if self.staging_children is not None:
+            children = self.staging_children.c
+            linked = insert(self.association_table).from_select(
+                [self.association.parent_key, *self.child_columns],
+                select(inserted.c.id, *(children[name] for name in self.child_columns))
+                .select_from(inserted.join(self.staging, matched))
+                .join(self.staging_children, children.row_no == staging.row_no),
+            )
+            stmt = stmt.add_cte(linked.cte("linked"))
+
+        rows = (await session.execute(stmt)).mappings().all()
+        errors.extend(ImportRowError(row=row["row_no"], detail=self.duplicate(row).detail) for row in rows)
+        return len(rows)
+
+    @staticmethod
+    def _staging_table(metadata: MetaData, table: Table, columns: Iterable[str]) -> Table:
+        return Table(
+            f"import_{table.name}",
+            metadata,
+            Column("row_no", Integer, nullable=False),
+            *(Column(name, table.c[name].type) for name in columns),
+            prefixes=["TEMPORARY"],
+            postgresql_on_commit="DROP",
+        )
@@ -13,7 +13,7 @@ class Classroom(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String, nullable=False, unique=True)
 
-    capacity: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    capacity: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
 
     subjects: Mapped[List["ClassroomSubject"]] = relationship(
         back_populates="classroom",
@@ -1,61 +1,105 @@
-from typing import List
+from typing import Iterable, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.entities.base import BaseRepository
+from backend.core.database import transaction
+from backend.core.exceptions import DuplicateClassroomException
+from backend.core.reference_cache import reference_cache
+from backend.entities.base import BaseRepository, ImportReport, Page
+from backend.entities.bulk_import import BulkImport
 from backend.entities.classroom.models import Classroom
+from backend.entities.relations.sync import classroom_subjects_sync
 from backend.entities.classroom.schemas import (
+    ClassroomFilterParams,
     ClassroomPostRequest,
     ClassroomPutRequest,
+    ClassroomRequest,
+    ClassroomResponse,
 )
-from backend.api.depends import PaginationParamsDep
+from backend.api.depends import ExpandParamsDep, PaginationParamsDep
+from backend.utils.bulk_import import ImportParams
 
 
 class ClassroomRepository(BaseRepository):
     def __init__(self) -> None:
         super().__init__(Classroom)
+        self.bulk_import = BulkImport(
+            ClassroomPostRequest,
+            Classroom,
+            columns=("name", "capacity"),
+            key=("name",),
+            values=lambda request_data: request_data.model_dump(include={"name", "capacity"}),
+            duplicate=lambda values: DuplicateClassroomException(values["name"]),
+            association=classroom_subjects_sync,
+            children=self._subject_rows,
+        )
 
-    async def create(self, session: AsyncSession, request_data: ClassroomPostRequest) -> Classroom:
-        classroom = self.sql_model(name=request_data.name, capacity=request_data.capacity)
-        session.add(classroom)
-        await session.commit()
+    async def create(self, session: AsyncSession, request_data: ClassroomPostRequest) -> dict:
+        (classroom,) = await self.insert_returning(session, [request_data.model_dump(include={"name", "capacity"})])
+        subjects = self._subject_rows(request_data)
+        await classroom_subjects_sync.sync(session, {classroom["id"]: subjects}, prune=False)
 
-        classroom = await self.get_by_id(session, classroom.id, load_strategy="selectin")
-        return classroom
+        return {**classroom, "subjects": subjects}
 
     async def create_many(self, session: AsyncSession, request_data_list: List[ClassroomPostRequest]):
-        async with session.begin():
-            classrooms = [self.sql_model(name=data.name, capacity=data.capacity) for data in request_data_list]
-            session.add_all(classrooms)
+        async with transaction(session):
+            classrooms = await self.insert_returning(
+                session, [data.model_dump(include={"name", "capacity"}) for data in request_data_list]
+            )
 
-    async def list_classrooms(self, session: AsyncSession, pagination: PaginationParamsDep):
-        classrooms = await self.list_all(session, pagination, load_strategy="selectin")
-        return classrooms
+            await classroom_subjects_sync.sync(
+                session,
+                {
+                    classroom["id"]: self._subject_rows(request_data)
+                    for classroom, request_data in zip(classrooms, request_data_list)
+                },
+                prune=False,
+            )
+
+    async def import_classrooms(self, session: AsyncSession, params: ImportParams) -> ImportReport:
+        return await self.bulk_import.run(session, params)
+
+    async def list_classrooms(
+        self,
+        session: AsyncSession,
+        pagination: PaginationParamsDep,
+        expand: Optional[ExpandParamsDep] = None,
+        filters: Optional[ClassroomFilterParams] = None,
+    ) -> Page:
+        return await self.list_page(
+            session,
+            pagination,
+            load_strategy="selectin",
+            expand=expand,
+            schema=ClassroomResponse,
+            filters=filters,
+        )
 
     async def update(
         self,
         session: AsyncSession,
         id: int,
         request_data: ClassroomPutRequest,
-    ) -> Classroom:
-        classroom = await self.get_by_id(session, id, load_strategy="selectin")
-
-        await self._set_name(classroom, request_data)
-        await self._set_capacity(classroom, request_data)
+    ) -> dict:
+        classroom = await self.update_returning(session, id, self._update_values(request_data))
+        subjects = self._subject_rows(request_data)
+        await classroom_subjects_sync.sync(session, {id: subjects})
 
-        await session.commit()
-        await session.refresh(classroom)
-        return classroom
+        return {**classroom, "subjects": subjects}
 
-    async def delete(self, session: AsyncSession, id: int) -> None:
-        await session.delete(await self.get_by_id(session, id))
+    async def existing_ids(self, session: AsyncSession, ids: Iterable[int]) -> set[int]:
+        return await reference_cache.existing_ids(session, self.sql_model.__table__, ids)
 
-    async def _set_name(self, classroom, request_data):
-        if request_data.name != classroom.name:
-            classroom.name = request_data.name
+    @staticmethod
+    def _update_values(request_data: ClassroomPutRequest) -> dict:
+        # capacity is left untouched unless it is given explicitly
+        values = {"name": request_data.name}
+        if request_data.capacity is not None:
+            values["capacity"] = request_data.capacity
+        return values
 
-    async def _set_capacity(self, classroom, request_data):
-        if request_data.capacity is not None and request_data.capacity != classroom.capacity:
-            classroom.capacity = request_data.capacity
+    @staticmethod
+    def _subject_rows(request_data: ClassroomRequest) -> List[dict]:
+        return [{"subject_id": subj.id} for subj in request_data.subjects]
 
 
 classroom_repository = ClassroomRepository()
@@ -4,8 +4,9 @@ from typing import Annotated, List, Optional
 from fastapi import HTTPException
 from pydantic import Field, field_validator
 
-from backend.entities.base import CustomBaseModel
+from backend.entities.base import CustomBaseModel, ExpandableResponseModel
 from backend.entities.relations.schemas import SubjectIDRequest, SubjectIDResponse
+from backend.utils.filters import Filter, FilterParams
 
 # INFO: BASE
 
@@ -66,9 +67,9 @@ class ClassroomPostRequest(ClassroomRequest):
 # INFO: RESPONSE
 
 
-class ClassroomResponse(ClassroomBaseSchema):
+class ClassroomResponse(ClassroomBaseSchema, ExpandableResponseModel):
     id: int
-    subjects: List[SubjectIDResponse]
+    subjects: Optional[List[SubjectIDResponse]] = None
 
 
 # INFO: UPDATEresponse
@@ -83,3 +84,14 @@ class ClassroomUpdateResponse(ClassroomResponse):
 
 class ClassroomCreateResponse(ClassroomResponse):
     pass
+
+
+# INFO: FILTERS
+
+
+class ClassroomFilterParams(FilterParams):
+    capacity_min: Annotated[Optional[int], Filter("capacity", "ge"), Field(description="Вместимость не меньше.")] = None
+    capacity_max: Annotated[Optional[int], Filter("capacity", "le"), Field(description="Вместимость не больше.")] = None
+    subject_id: Annotated[
+        Optional[int], Filter("subjects", "has", "subject_id"), Field(description="Подходит для предмета.")
+    ] = None
@@ -1,7 +1,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.entities.base import ListResponseModel
+from backend.api.responses import ExportResponse, RawJSONResponse
+from backend.core.config import settings
+from backend.entities.base import BatchResponseModel, ImportReport, ListResponseModel
 from backend.entities.classroom.schemas import (
+    ClassroomFilterParams,
     ClassroomCreateResponse,
     ClassroomPostRequest,
     ClassroomPutRequest,
@@ -9,37 +12,79 @@ from backend.entities.classroom.schemas import (
     ClassroomUpdateResponse,
 )
 from backend.entities.classroom.repository import classroom_repository
-from backend.api.depends import PaginationParamsDep
+from backend.entities.classroom.validators import validate_classroom_request
+from backend.api.depends import (
+    BatchIdsDep,
+    ExpandParamsDep,
+    ExportParamsDep,
+    ImportParamsDep,
+    PaginationParamsDep,
+    ReadSessionFactoryDep,
+)
 
 
 class ClassroomManager:
-    @classmethod  # TODO: @validate_classroom_request
+    @classmethod
+    @validate_classroom_request
     async def create_classroom(
         cls, session: AsyncSession, request_data: ClassroomPostRequest
     ) -> ClassroomCreateResponse:
         classroom = await classroom_repository.create(session, request_data)
-        await session.commit()
         return ClassroomCreateResponse.model_validate(classroom)
 
     @classmethod
-    async def list_classrooms(cls, session: AsyncSession, pagination: PaginationParamsDep) -> ListResponseModel:
-        classrooms = await classroom_repository.list_classrooms(session, pagination)
-        total = await classroom_repository.entity_count(session)
-        return ListResponseModel[ClassroomResponse](
-            items=classrooms, total=total, limit=pagination.limit, offset=pagination.offset
-        )
+    async def import_classrooms(cls, session: AsyncSession, params: ImportParamsDep) -> ImportReport:
+        return await classroom_repository.import_classrooms(session, params)
+
+    @classmethod
+    async def get_classroom(cls, session: AsyncSession, id: int, expand: ExpandParamsDep) -> ClassroomResponse:
+        classroom = await classroom_repository.get_by_id(session, id, load_strategy="selectin", expand=expand)
+        return ClassroomResponse.model_validate(classroom)
 
-    @classmethod  # TODO: @validate_classroom_request
+    @classmethod
+    async def get_classrooms_batch(
+        cls, session: AsyncSession, batch_ids: BatchIdsDep, expand: ExpandParamsDep
+    ) -> BatchResponseModel[ClassroomResponse]:
+        batch = await classroom_repository.get_many(session, batch_ids.ids, load_strategy="selectin", expand=expand)
+        return BatchResponseModel[ClassroomResponse].from_batch(batch)
+
+    @classmethod
+    async def list_classrooms(
+        cls,
+        session: AsyncSession,
+        pagination: PaginationParamsDep,
+        expand: ExpandParamsDep,
+        filters: ClassroomFilterParams,
+    ) -> ListResponseModel | RawJSONResponse:
+        if settings.api_config.READ_MODE == "json":
+            content = await classroom_repository.list_json(session, pagination, ClassroomResponse, expand, filters)
+            return RawJSONResponse(content)
+
+        page = await classroom_repository.list_classrooms(session, pagination, expand, filters)
+        return ListResponseModel[ClassroomResponse].from_page(page, pagination)
+
+    @classmethod
+    def export_classrooms(
+        cls,
+        session_factory: ReadSessionFactoryDep,
+        export: ExportParamsDep,
+        expand: ExpandParamsDep,
+        filters: ClassroomFilterParams,
+    ) -> ExportResponse:
+        chunks = classroom_repository.export(session_factory, ClassroomResponse, export.format, expand, filters)
+        return ExportResponse(chunks, export.format, "classrooms")
+
+    @classmethod
+    @validate_classroom_request
     async def update_classroom(
         cls,
         session: AsyncSession,
         id: int,
         request_data: ClassroomPutRequest,
     ) -> ClassroomUpdateResponse:
-        subject = await classroom_repository.update(session, id, request_data)
-        return ClassroomUpdateResponse.model_validate(subject)
+        classroom = await classroom_repository.update(session, id, request_data)
+        return ClassroomUpdateResponse.model_validate(classroom)
 
     @classmethod
     async def delete_classroom(cls, session: AsyncSession, id: int) -> None:
         await classroom_repository.delete(session, id)
-        await session.commit()
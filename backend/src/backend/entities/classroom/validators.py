@@ -1 +1,61 @@
-# TODO: MAKE THIS!
+from collections import Counter
+from functools import wraps
+
+from sqlalchemy import select
+
+from backend.core.exceptions import (
+    DuplicateClassroomException,
+    DuplicateSubjectIDException,
+    InvalidSubjectIDException,
+)
+from backend.entities.base import BaseValidator
+from backend.entities.classroom.models import Classroom
+from backend.entities.subject.repository import subject_repository
+
+
+class ClassroomReqValidator(BaseValidator):
+    constraint_errors = {
+        "uq_classrooms_name": lambda self, key: DuplicateClassroomException(self.request_data.name),
+        "fk_classroom_subjects_subject_id_subjects": lambda self, key: InvalidSubjectIDException(int(key)),
+    }
+
+    def __init__(self, func, *args, **kwargs):
+        super().__init__(func, *args, **kwargs)
+
+    async def check_duplicate_classroom(self):
+        stmt = select(Classroom).where(Classroom.name == self.request_data.name)
+
+        if self.id is not None:
+            stmt = stmt.where(Classroom.id != self.id)
+
+        if existing_classroom := await self.session.scalar(stmt):
+            raise DuplicateClassroomException(existing_classroom.name)
+
+    def check_request_data(self):
+        user_ids = [subj.id for subj in self.request_data.subjects]
+        duplicates = [item for item, count in Counter(user_ids).items() if count > 1]
+        if duplicates:
+            raise DuplicateSubjectIDException(*duplicates)
+
+    async def check_classroom_subjects_validity(self):
+        user_ids = [subj.id for subj in self.request_data.subjects]
+        if not user_ids:
+            return
+
+        db_subject_ids = await subject_repository.existing_ids(self.session, user_ids)
+
+        if wrong_subject_ids := set(user_ids) - db_subject_ids:
+            raise InvalidSubjectIDException(*wrong_subject_ids)
+
+    async def validate(self):
+        self.check_request_data()
+        await self.check_classroom_subjects_validity()
+        await self.check_duplicate_classroom()
+
+
+def validate_classroom_request(func):
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await ClassroomReqValidator(func, *args, **kwargs).run()
+
+    return wrapper
@@ -0,0 +1,29 @@
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.entities.base import Base
+
+SLOT = ("lesson_date", "school_shift", "lesson_number")
+
+
+class Lesson(Base):
+    __table_args__ = (
+        # a teacher, a classroom and a group are in one lesson per slot at most; the unique
+        # indexes also make the conflict check and per-owner schedule reads index probes
+        UniqueConstraint("teacher_id", *SLOT, name="uq_lessons_teacher_slot"),
+        UniqueConstraint("classroom_id", *SLOT, name="uq_lessons_classroom_slot"),
+        UniqueConstraint("student_group_id", *SLOT, name="uq_lessons_student_group_slot"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    lesson_date: Mapped[date] = mapped_column(Date, nullable=False)
+    school_shift: Mapped[int] = mapped_column(nullable=False)
+    lesson_number: Mapped[int] = mapped_column(nullable=False)
+
+    classroom_id: Mapped[int] = mapped_column(ForeignKey("classrooms.id", ondelete="CASCADE"), nullable=False)
+    # the only reference not leading a slot index, deleting a subject needs its own
+    subject_id: Mapped[int] = mapped_column(ForeignKey("subjects.id", ondelete="CASCADE"), nullable=False, index=True)
+    teacher_id: Mapped[int] = mapped_column(ForeignKey("teachers.id", ondelete="CASCADE"), nullable=False)
+    student_group_id: Mapped[int] = mapped_column(ForeignKey("student_groups.id", ondelete="CASCADE"), nullable=False)
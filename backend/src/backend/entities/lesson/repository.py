@@ -1,51 +1,62 @@
+from datetime import date
+from typing import Any, Mapping, Optional, Sequence
+
+from sqlalchemy import Integer, cast, delete, extract, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.entities.base import BaseRepository
-from backend.entities.lesson._models import Lesson
-from backend.entities.lesson.schemas import LessonPostRequest
+from backend.core.table_versions import table_versions
+from backend.entities.base import BaseRepository, Page
+from backend.entities.lesson.models import Lesson
+from backend.entities.lesson.schemas import (
+    LessonFilterParams,
+    LessonPostRequest,
+    LessonPutRequest,
+    LessonResponse,
+)
 from backend.api.depends import PaginationParamsDep
 
 
 class LessonRepository(BaseRepository):
+    # LessonResponse.lesson_day, 0 is Monday
+    computed_columns = {"lesson_day": cast(extract("isodow", Lesson.lesson_date), Integer) - 1}
+
     def __init__(self) -> None:
         super().__init__(Lesson)
 
-    async def create(
-        self, session: AsyncSession, request_data: LessonPostRequest
-    ) -> Lesson:
-        lesson = self.sql_model(**request_data.model_dump())
-        session.add(lesson)
-        await session.commit()
-        await session.refresh(lesson)
-        return lesson
+    async def create(self, session: AsyncSession, request_data: LessonPostRequest) -> dict:
+        (lesson,) = await self.insert_returning(session, [request_data.model_dump()])
+        return dict(lesson)
 
     async def list_lessons(
-        self, session: AsyncSession, pagination: PaginationParamsDep
-    ):
-        lessons = await self.list_all(session, pagination, load_strategy="selectin")
-        return lessons
-
-    # async def update(
-    #     self, session: AsyncSession, id: int, request_data: LessonUpdateRequest
-    # ) -> Lesson:
-    #     lesson = await self.get_by_id(session, id, load_strategy="selectin")
-    #
-    #     if request_data.name != lesson.name:
-    #         lesson.name = request_data.name
-    #         await session.commit()
-    #         await session.refresh(lesson)
-    #     return lesson
-    #
-    # async def delete(self, session: AsyncSession, id: int) -> Lesson:
-    #     lesson = await self.get_by_id(session, id)
-    #     deleted_data = {
-    #         key: value
-    #         for key, value in lesson.__dict__.items()
-    #         if not key.startswith("_")
-    #     }
-    #     await session.delete(lesson)
-    #     await session.commit()
-    #     return Lesson(**deleted_data)
+        self,
+        session: AsyncSession,
+        pagination: PaginationParamsDep,
+        filters: Optional[LessonFilterParams] = None,
+    ) -> Page:
+        return await self.list_page(session, pagination, schema=LessonResponse, filters=filters)
+
+    async def update(self, session: AsyncSession, id: int, request_data: LessonPutRequest) -> dict:
+        return dict(await self.update_returning(session, id, request_data.model_dump()))
+
+    async def replace_range(
+        self,
+        session: AsyncSession,
+        date_from: date,
+        date_to: date,
+        school_shift: int,
+        values: Sequence[Mapping[str, Any]],
+    ) -> None:
+        """Swaps the shift's lessons between the dates for ``values``, in the caller's transaction."""
+        table = self.sql_model.__table__
+        await session.execute(
+            delete(table).where(
+                table.c.lesson_date.between(date_from, date_to),
+                table.c.school_shift == school_shift,
+            )
+        )
+        if values:
+            await session.execute(insert(table), list(values))
+        table_versions.mark_changed(session, table.name)
 
 
 lesson_repository = LessonRepository()
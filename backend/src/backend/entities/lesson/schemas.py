@@ -1,8 +1,10 @@
 from datetime import date
+from typing import Annotated, Optional
 
-from pydantic import Field
+from pydantic import Field, computed_field
 
 from backend.entities.base import CustomBaseModel
+from backend.utils.filters import Filter, FilterParams
 
 # INFO: BASE
 
@@ -12,10 +14,10 @@ class LessonBaseSchema(CustomBaseModel):
     school_shift: int = Field(..., ge=1, le=3)
     lesson_number: int = Field(..., ge=0, le=8)
 
-    classroom: int
-    subject: int
-    teacher: int
-    student_group: int
+    classroom_id: int = Field(..., description="ID учебного класса")
+    subject_id: int = Field(..., description="ID предмета")
+    teacher_id: int = Field(..., description="ID преподавателя")
+    student_group_id: int = Field(..., description="ID ученического класса")
 
 
 # INFO: REQUEST
@@ -28,10 +30,10 @@ class LessonRequest(LessonBaseSchema):
                 "lesson_number": 2,
                 "lesson_date": "2025-03-19",
                 "school_shift": 1,
-                "classroom": 1,
-                "subject": 1,
-                "teacher": 1,
-                "student_group": 1,
+                "classroom_id": 1,
+                "subject_id": 1,
+                "teacher_id": 1,
+                "student_group_id": 1,
             }
         }
     }
@@ -56,7 +58,11 @@ class LessonPutRequest(LessonRequest):
 
 class LessonResponse(LessonBaseSchema):
     id: int
-    lesson_day: str
+
+    @computed_field(description="День недели, 0 - понедельник")
+    @property
+    def lesson_day(self) -> int:
+        return self.lesson_date.weekday()
 
     model_config = {
         "json_schema_extra": {
@@ -64,11 +70,12 @@ class LessonResponse(LessonBaseSchema):
                 "id": 2,
                 "lesson_number": 2,
                 "lesson_date": "2025-03-19",
+                "lesson_day": 2,
                 "school_shift": 1,
-                "classroom": 1,
-                "subject": 1,
-                "teacher": 1,
-                "student_group": 1,
+                "classroom_id": 1,
+                "subject_id": 1,
+                "teacher_id": 1,
+                "student_group_id": 1,
             }
         }
     }
@@ -86,3 +93,17 @@ class LessonCreateResponse(LessonResponse):
 
 class LessonUpdateResponse(LessonResponse):
     pass
+
+
+# INFO: FILTERS
+
+
+class LessonFilterParams(FilterParams):
+    teacher_id: Annotated[Optional[int], Filter("teacher_id"), Field(description="Уроки преподавателя.")] = None
+    classroom_id: Annotated[Optional[int], Filter("classroom_id"), Field(description="Уроки в кабинете.")] = None
+    student_group_id: Annotated[
+        Optional[int], Filter("student_group_id"), Field(description="Уроки группы.")
+    ] = None
+    subject_id: Annotated[Optional[int], Filter("subject_id"), Field(description="Уроки по предмету.")] = None
+    date_from: Annotated[Optional[date], Filter("lesson_date", "ge"), Field(description="Не раньше даты.")] = None
+    date_to: Annotated[Optional[date], Filter("lesson_date", "le"), Field(description="Не позже даты.")] = None
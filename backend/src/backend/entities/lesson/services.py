@@ -1,26 +1,61 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.entities.base import ListResponseModel
+from backend.api.responses import ExportResponse
+from backend.entities.base import BatchResponseModel, ListResponseModel
 from backend.entities.lesson.repository import lesson_repository
-
 from backend.entities.lesson.schemas import (
-    LessonPostRequest,
     LessonCreateResponse,
+    LessonFilterParams,
+    LessonPostRequest,
+    LessonPutRequest,
     LessonResponse,
+    LessonUpdateResponse,
 )
-from backend.api.depends import PaginationParamsDep
+from backend.entities.lesson.validators import validate_lesson_request
+from backend.api.depends import BatchIdsDep, ExportParamsDep, PaginationParamsDep, ReadSessionFactoryDep
 
 
 class LessonManager:
     @classmethod
+    @validate_lesson_request
     async def create_lesson(cls, session: AsyncSession, request_data: LessonPostRequest) -> LessonCreateResponse:
         lesson = await lesson_repository.create(session, request_data)
         return LessonCreateResponse.model_validate(lesson)
 
     @classmethod
-    async def list_lessons(cls, session: AsyncSession, pagination: PaginationParamsDep) -> ListResponseModel:
-        subjects = await lesson_repository.list_lessons(session, pagination)
-        total = await lesson_repository.entity_count(session)
-        return ListResponseModel[LessonResponse](
-            items=subjects, total=total, limit=pagination.limit, offset=pagination.offset
-        )
+    async def get_lesson(cls, session: AsyncSession, id: int) -> LessonResponse:
+        lesson = await lesson_repository.get_by_id(session, id)
+        return LessonResponse.model_validate(lesson)
+
+    @classmethod
+    async def get_lessons_batch(cls, session: AsyncSession, batch_ids: BatchIdsDep) -> BatchResponseModel[LessonResponse]:
+        batch = await lesson_repository.get_many(session, batch_ids.ids)
+        return BatchResponseModel[LessonResponse].from_batch(batch)
+
+    @classmethod
+    async def list_lessons(
+        cls, session: AsyncSession, pagination: PaginationParamsDep, filters: LessonFilterParams
+    ) -> ListResponseModel:
+        # no READ_MODE=json here: lesson_day is computed by the response schema
+        page = await lesson_repository.list_lessons(session, pagination, filters)
+        return ListResponseModel[LessonResponse].from_page(page, pagination)
+
+    @classmethod
+    def export_lessons(
+        cls,
+        session_factory: ReadSessionFactoryDep,
+        export: ExportParamsDep,
+        filters: LessonFilterParams,
+    ) -> ExportResponse:
+        chunks = lesson_repository.export(session_factory, LessonResponse, export.format, filters=filters)
+        return ExportResponse(chunks, export.format, "lessons")
+
+    @classmethod
+    @validate_lesson_request
+    async def update_lesson(cls, session: AsyncSession, id: int, request_data: LessonPutRequest) -> LessonUpdateResponse:
+        lesson = await lesson_repository.update(session, id, request_data)
+        return LessonUpdateResponse.model_validate(lesson)
+
+    @classmethod
+    async def delete_lesson(cls, session: AsyncSession, id: int) -> None:
+        await lesson_repository.delete(session, id)
@@ -0,0 +1,109 @@
+from functools import wraps
+
+from sqlalchemy import exists, or_, select
+
+from backend.core.exceptions import InvalidReferenceException, LessonSlotConflictException
+from backend.entities.base import BaseValidator
+from backend.entities.classroom.models import Classroom
+from backend.entities.classroom.repository import classroom_repository
+from backend.entities.lesson.models import Lesson
+from backend.entities.student_group.models import StudentGroup
+from backend.entities.subject.models import Subject
+from backend.entities.subject.repository import subject_repository
+from backend.entities.teacher.models import Teacher
+
+REFERENCES = {
+    "classroom_id": Classroom,
+    "subject_id": Subject,
+    "teacher_id": Teacher,
+    "student_group_id": StudentGroup,
+}
+
+# small reference tables, checked against the ids in reference_cache instead of the database
+CACHED_REFERENCES = {
+    "classroom_id": classroom_repository,
+    "subject_id": subject_repository,
+}
+
+# owner column -> the unique constraint on (owner, lesson_date, school_shift, lesson_number)
+SLOT_OWNERS = {
+    "teacher_id": "uq_lessons_teacher_slot",
+    "classroom_id": "uq_lessons_classroom_slot",
+    "student_group_id": "uq_lessons_student_group_slot",
+}
+
+
+class LessonReqValidator(BaseValidator):
+    constraint_errors = {
+        **{
+            constraint: lambda self, key, owner=owner: self.slot_conflict(owner)
+            for owner, constraint in SLOT_OWNERS.items()
+        },
+        **{
+            f"fk_lessons_{reference}_{model.__tablename__}": lambda self, key, reference=reference: (
+                self.invalid_reference(reference)
+            )
+            for reference, model in REFERENCES.items()
+        },
+    }
+
+    def __init__(self, func, *args, **kwargs):
+        super().__init__(func, *args, **kwargs)
+
+    def slot_conflict(self, owner: str) -> LessonSlotConflictException:
+        return LessonSlotConflictException(
+            REFERENCES[owner].__name__,
+            getattr(self.request_data, owner),
+            self.request_data.lesson_date,
+            self.request_data.school_shift,
+            self.request_data.lesson_number,
+        )
+
+    def invalid_reference(self, reference: str) -> InvalidReferenceException:
+        return InvalidReferenceException(REFERENCES[reference].__name__, getattr(self.request_data, reference))
+
+    async def check_references(self):
+        for reference, repository in CACHED_REFERENCES.items():
+            id = getattr(self.request_data, reference)
+            if id not in await repository.existing_ids(self.session, [id]):
+                raise self.invalid_reference(reference)
+
+        queried = [reference for reference in REFERENCES if reference not in CACHED_REFERENCES]
+        stmt = select(
+            *(
+                exists().where(REFERENCES[reference].id == getattr(self.request_data, reference)).label(reference)
+                for reference in queried
+            )
+        )
+        found = (await self.session.execute(stmt)).one()
+
+        if missing := next((reference for reference in queried if not getattr(found, reference)), None):
+            raise self.invalid_reference(missing)
+
+    async def check_slot_conflicts(self):
+        """One probe per unique slot index (BitmapOr), no scan of the schedule."""
+        owners = [getattr(Lesson, owner) == getattr(self.request_data, owner) for owner in SLOT_OWNERS]
+        stmt = select(*(owner.label(name) for owner, name in zip(owners, SLOT_OWNERS))).where(
+            Lesson.lesson_date == self.request_data.lesson_date,
+            Lesson.school_shift == self.request_data.school_shift,
+            Lesson.lesson_number == self.request_data.lesson_number,
+            or_(*owners),
+        )
+
+        if self.id is not None:
+            stmt = stmt.where(Lesson.id != self.id)
+
+        if taken := (await self.session.execute(stmt.limit(1))).first():
+            raise self.slot_conflict(next(owner for owner in SLOT_OWNERS if getattr(taken, owner)))
+
+    async def validate(self):
+        await self.check_references()
+        await self.check_slot_conflicts()
+
+
+def validate_lesson_request(func):
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await LessonReqValidator(func, *args, **kwargs).run()
+
+    return wrapper
@@ -16,8 +16,9 @@ class TeacherSubject(Base):
     teacher_id: Mapped[int] = mapped_column(
         ForeignKey("teachers.id", ondelete="CASCADE"), primary_key=True
     )
+    # the primary key starts with the owner id, reverse lookups by subject need their own index
     subject_id: Mapped[int] = mapped_column(
-        ForeignKey("subjects.id", ondelete="CASCADE"), primary_key=True
+        ForeignKey("subjects.id", ondelete="CASCADE"), primary_key=True, index=True
     )
     teaching_hours: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
@@ -30,7 +31,7 @@ class StudentGroupSubject(Base):
         ForeignKey("student_groups.id", ondelete="CASCADE"), primary_key=True
     )
     subject_id: Mapped[int] = mapped_column(
-        ForeignKey("subjects.id", ondelete="CASCADE"), primary_key=True
+        ForeignKey("subjects.id", ondelete="CASCADE"), primary_key=True, index=True
     )
     study_hours: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
@@ -47,7 +48,7 @@ class ClassroomSubject(Base):
         ForeignKey("classrooms.id", ondelete="CASCADE"), primary_key=True
     )
     subject_id: Mapped[int] = mapped_column(
-        ForeignKey("subjects.id", ondelete="CASCADE"), primary_key=True
+        ForeignKey("subjects.id", ondelete="CASCADE"), primary_key=True, index=True
     )
 
     classroom: Mapped["Classroom"] = relationship(
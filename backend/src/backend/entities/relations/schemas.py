@@ -1,4 +1,4 @@
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from backend.entities.base import CustomBaseModel
 
@@ -23,11 +23,15 @@ class SubjectWithSHoursRequest(CustomBaseModel):
 
 
 class SubjectIDResponse(CustomBaseModel):
-    id: int = Field(..., description="ID предмета")
+    id: int = Field(..., validation_alias="subject_id", description="ID предмета")
+
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class ClassroomIDResponse(CustomBaseModel):
-    id: int = Field(..., description="ID предмета")
+    id: int = Field(..., validation_alias="classroom_id", description="ID учебного класса")
+
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class TeacherWithHoursResponse(CustomBaseModel):
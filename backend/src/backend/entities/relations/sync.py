@@ -0,0 +1,113 @@
+from typing import Any, Iterable, Mapping, Sequence, Type
+
+from sqlalchemy import ARRAY, any_, cast, delete, func, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.table_versions import table_versions
+from backend.entities.base import Base
+from backend.entities.relations.models import (
+    ClassroomSubject,
+    StudentGroupSubject,
+    TeacherSubject,
+)
+
+
+class AssociationSync:
+    """Brings association rows of any number of parents to a desired state with set-based statements.
+
+    Rows are passed to Postgres as one array per column and expanded with ``unnest``, so
+    the statement size doesn't depend on the number of rows:
+
+    - ``DELETE ... WHERE parent = ANY(:parents) AND (parent, child) NOT IN (unnest(...))``
+    - ``INSERT ... SELECT unnest(...) ON CONFLICT (parent, child) DO UPDATE`` (only changed values)
+
+    When both are needed the DELETE runs as a data-modifying CTE of the INSERT, so a sync is a
+    single round trip. The two touch disjoint sets of rows, which is what makes this safe.
+    """
+
+    def __init__(
+        self,
+        model: Type[Base],
+        parent_key: str,
+        child_key: str = "subject_id",
+        value_keys: Sequence[str] = (),
+    ) -> None:
+        self.model = model
+        self.parent_key = parent_key
+        self.child_key = child_key
+        self.value_keys = tuple(value_keys)
+
+    async def sync(
+        self,
+        session: AsyncSession,
+        desired: Mapping[int, Iterable[Mapping[str, Any]]],
+        prune: bool = True,
+    ) -> None:
+        """``desired`` maps parent id to its complete list of ``{child_key: ..., *value_keys}`` rows.
+
+        With ``prune=False`` rows missing from ``desired`` are kept (e.g. for freshly created parents).
+        """
+        if not desired:
+            return
+
+        table_versions.mark_changed(session, self.model.__tablename__)
+
+        rows = {
+            (parent_id, row[self.child_key]): row
+            for parent_id, parent_rows in desired.items()
+            for row in parent_rows
+        }
+        columns = {
+            self.parent_key: [parent_id for parent_id, _ in rows],
+            self.child_key: [child_id for _, child_id in rows],
+            **{key: [row[key] for row in rows.values()] for key in self.value_keys},
+        }
+
+        if not rows:
+            if prune:
+                await session.execute(self._delete_stmt(list(desired), columns))
+            return
+
+        stmt = self._upsert_stmt(columns)
+        if prune:
+            stmt = stmt.add_cte(self._delete_stmt(list(desired), columns).cte("pruned"))
+        await session.execute(stmt)
+
+    def _unnest(self, columns: Mapping[str, list]):
+        table_columns = self.model.__table__.c
+        return select(
+            *(
+                func.unnest(cast(values, ARRAY(table_columns[key].type))).label(key)
+                for key, values in columns.items()
+            )
+        )
+
+    def _delete_stmt(self, parent_ids: list[int], columns: Mapping[str, list]):
+        table_columns = self.model.__table__.c
+        parent, child = table_columns[self.parent_key], table_columns[self.child_key]
+
+        stmt = delete(self.model).where(parent == any_(cast(parent_ids, ARRAY(parent.type))))
+        if columns[self.parent_key]:
+            keys = {key: columns[key] for key in (self.parent_key, self.child_key)}
+            stmt = stmt.where(tuple_(parent, child).not_in(self._unnest(keys)))
+        return stmt
+
+    def _upsert_stmt(self, columns: Mapping[str, list]):
+        stmt = insert(self.model).from_select(list(columns), self._unnest(columns))
+        index_elements = [self.parent_key, self.child_key]
+
+        if not self.value_keys:
+            return stmt.on_conflict_do_nothing(index_elements=index_elements)
+
+        table_columns = self.model.__table__.c
+        return stmt.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={key: stmt.excluded[key] for key in self.value_keys},
+            where=or_(*(table_columns[key].is_distinct_from(stmt.excluded[key]) for key in self.value_keys)),
+        )
+
+
+teacher_subjects_sync = AssociationSync(TeacherSubject, "teacher_id", value_keys=("teaching_hours",))
+student_group_subjects_sync = AssociationSync(StudentGroupSubject, "student_group_id", value_keys=("study_hours",))
+classroom_subjects_sync = AssociationSync(ClassroomSubject, "classroom_id")
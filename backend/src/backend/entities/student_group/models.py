@@ -1,6 +1,8 @@
+import re
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import Integer, String
+from sqlalchemy import Index, Integer, String, cast, func, literal_column
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.entities.base import Base
@@ -13,9 +15,24 @@ class StudentGroup(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String, nullable=False, unique=True)
 
-    capacity: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    capacity: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
 
     subjects: Mapped[List["StudentGroupSubject"]] = relationship(
         back_populates="student_group",
         cascade="all, delete-orphan",
     )
+
+    @hybrid_property
+    def grade(self) -> Optional[int]:
+        """11 for '11-А'."""
+        match = re.match(r"\d+", self.name)
+        return int(match.group()) if match else None
+
+    @grade.inplace.expression
+    @classmethod
+    def _grade_expression(cls):
+        # an inline pattern, queries must repeat the indexed expression verbatim to use its index
+        return cast(func.substring(cls.name, literal_column(r"'^\d+'")), Integer)
+
+
+Index("ix_student_groups_grade", StudentGroup.grade)
@@ -1,146 +1,108 @@
-from typing import Sequence
+from typing import List, Optional
 
-from sqlalchemy import case, delete, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.api.depends import PaginationParamsDep
-from backend.entities.base import BaseRepository
-from backend.entities.relations.models import StudentGroupSubject
+from backend.api.depends import ExpandParamsDep, PaginationParamsDep
+from backend.core.database import transaction
+from backend.core.exceptions import DuplicateStudentGroupException
+from backend.entities.base import BaseRepository, ImportReport, Page
+from backend.entities.bulk_import import BulkImport
+from backend.entities.relations.sync import student_group_subjects_sync
 from backend.entities.student_group.models import StudentGroup
 from backend.entities.student_group.schemas import (
+    StudentGroupFilterParams,
     StudentGroupPostRequest,
     StudentGroupPutRequest,
+    StudentGroupRequest,
     StudentGroupResponse,
 )
+from backend.utils.bulk_import import ImportParams
 
 
 class StudentGroupRepository(BaseRepository):
     def __init__(self) -> None:
         super().__init__(StudentGroup)
+        self.bulk_import = BulkImport(
+            StudentGroupPostRequest,
+            StudentGroup,
+            columns=("name", "capacity"),
+            key=("name",),
+            values=lambda request_data: request_data.model_dump(include={"name", "capacity"}),
+            duplicate=lambda values: DuplicateStudentGroupException(values["name"]),
+            association=student_group_subjects_sync,
+            children=self._subject_rows,
+        )
 
     async def create(
         self, session: AsyncSession, request_data: StudentGroupPostRequest
-    ) -> StudentGroup:
-        student_group = self.sql_model(
-            name=request_data.name, capacity=request_data.capacity
+    ) -> dict:
+        (student_group,) = await self.insert_returning(
+            session, [request_data.model_dump(include={"name", "capacity"})]
         )
-        session.add(student_group)
-        await session.flush()
-        await self._update_student_group_subjects(session, request_data, student_group)
-        student_group = await self.get_by_id(
-            session, student_group.id, load_strategy="selectin"
+        subjects = self._subject_rows(request_data)
+        await student_group_subjects_sync.sync(
+            session, {student_group["id"]: subjects}, prune=False
         )
 
-        return student_group
+        return {**student_group, "subjects": subjects}
+
+    async def create_many(
+        self, session: AsyncSession, request_data_list: List[StudentGroupPostRequest]
+    ):
+        async with transaction(session):
+            student_groups = await self.insert_returning(
+                session,
+                [data.model_dump(include={"name", "capacity"}) for data in request_data_list],
+            )
+
+            await student_group_subjects_sync.sync(
+                session,
+                {
+                    student_group["id"]: self._subject_rows(request_data)
+                    for student_group, request_data in zip(student_groups, request_data_list)
+                },
+                prune=False,
+            )
+
+    async def import_student_groups(self, session: AsyncSession, params: ImportParams) -> ImportReport:
+        return await self.bulk_import.run(session, params)
 
     async def list_student_groups(
-        self, session: AsyncSession, pagination: PaginationParamsDep
-    ) -> Sequence[StudentGroupResponse]:
-        student_groups = await self.list_all(
-            session, pagination, load_strategy="selectin"
+        self,
+        session: AsyncSession,
+        pagination: PaginationParamsDep,
+        expand: Optional[ExpandParamsDep] = None,
+        filters: Optional[StudentGroupFilterParams] = None,
+    ) -> Page:
+        return await self.list_page(
+            session,
+            pagination,
+            load_strategy="selectin",
+            expand=expand,
+            schema=StudentGroupResponse,
+            filters=filters,
         )
-        return student_groups
 
     async def update(
         self,
         session: AsyncSession,
         id: int,
         request_data: StudentGroupPutRequest,
-    ) -> StudentGroup:
-        student_group = await self.get_by_id(session, id, load_strategy="selectin")
-
-        update_data = request_data.model_dump(include={"name"})
-        for field, value in update_data.items():
-            setattr(student_group, field, value)
-
-        await self._update_student_group_subjects(session, request_data, student_group)
-        await session.refresh(student_group)
-
-        return student_group
-
-    async def _update_student_group_subjects(
-        self,
-        session: AsyncSession,
-        request_data: StudentGroupPostRequest | StudentGroupPutRequest,
-        student_group: StudentGroup,
-    ) -> None:
-        if isinstance(request_data, StudentGroupPostRequest):
-            student_group_subjects = [
-                StudentGroupSubject(
-                    student_group_id=student_group.id,
-                    subject_id=subj.id,
-                    study_hours=subj.study_hours,
-                )
-                for subj in request_data.subjects
-            ]
-
-            session.add_all(student_group_subjects)
-            await session.flush()
-
-        elif isinstance(request_data, StudentGroupPutRequest):
-            request_subj_and_hours = {
-                subj.id: subj.study_hours for subj in request_data.subjects
-            }
-            existing_subjects_hours = {
-                subj.subject_id: subj.study_hours for subj in student_group.subjects
-            }
-
-            subjects_to_remove = (
-                existing_subjects_hours.keys() - request_subj_and_hours.keys()
-            )
-            subjects_to_add = (
-                request_subj_and_hours.keys() - existing_subjects_hours.keys()
-            )
-            subjects_to_update = {
-                _id
-                for _id in request_subj_and_hours.keys()
-                & existing_subjects_hours.keys()
-                if request_subj_and_hours[_id] != existing_subjects_hours[_id]
-            }
-
-            if subjects_to_remove:
-                stmt = delete(StudentGroupSubject).where(
-                    (StudentGroupSubject.student_group_id == student_group.id)
-                    & (StudentGroupSubject.subject_id.in_(subjects_to_remove))
-                )
-                await session.execute(stmt)
-
-            if subjects_to_update:
-                stmt = (
-                    update(StudentGroupSubject)
-                    .where(
-                        (StudentGroupSubject.student_group_id == student_group.id)
-                        & (StudentGroupSubject.subject_id.in_(subjects_to_update))
-                    )
-                    .values(
-                        study_hours=case(
-                            *[
-                                (
-                                    StudentGroupSubject.subject_id == _id,
-                                    request_subj_and_hours[_id],
-                                )
-                                for _id in subjects_to_update
-                            ],
-                            else_=StudentGroupSubject.study_hours,
-                        ),
-                    )
-                )
-                await session.execute(stmt)
+    ) -> dict:
+        student_group = await self.update_returning(
+            session, id, request_data.model_dump(include={"name"})
+        )
+        subjects = self._subject_rows(request_data)
+        await student_group_subjects_sync.sync(session, {id: subjects})
 
-            if subjects_to_add:
-                new_associations = [
-                    {
-                        "student_group_id": student_group.id,
-                        "subject_id": subject_id,
-                        "study_hours": request_subj_and_hours[subject_id],
-                    }
-                    for subject_id in subjects_to_add
-                ]
-                await session.execute(
-                    insert(StudentGroupSubject).values(new_associations)
-                )
+        return {**student_group, "subjects": subjects}
 
-            await session.flush()
+    @staticmethod
+    def _subject_rows(request_data: StudentGroupRequest) -> List[dict]:
+        return [
+            {"subject_id": subj.id, "study_hours": subj.study_hours}
+            for subj in request_data.subjects
+        ]
 
 
 student_group_repository = StudentGroupRepository()
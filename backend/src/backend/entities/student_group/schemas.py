@@ -4,11 +4,12 @@ from typing import Annotated, List, Optional
 from fastapi import HTTPException
 from pydantic import Field, field_validator
 
-from backend.entities.base import CustomBaseModel
+from backend.entities.base import CustomBaseModel, ExpandableResponseModel
 from backend.entities.relations.schemas import (
     SubjectWithSHoursRequest,
     SubjectWithSHoursResponse,
 )
+from backend.utils.filters import Filter, FilterParams
 
 # INFO: BASE
 
@@ -84,9 +85,9 @@ class StudentGroupPostRequest(StudentGroupRequest):
 # INFO: RESPONSE
 
 
-class StudentGroupResponse(StudentGroupBaseSchema):
+class StudentGroupResponse(StudentGroupBaseSchema, ExpandableResponseModel):
     id: int
-    subjects: List[SubjectWithSHoursResponse]
+    subjects: Optional[List[SubjectWithSHoursResponse]] = None
 
     model_config = {
         "json_schema_extra": {
@@ -116,3 +117,17 @@ class StudentGroupUpdateResponse(StudentGroupResponse):
 
 class StudentGroupCreateResponse(StudentGroupResponse):
     pass
+
+
+# INFO: FILTERS
+
+
+class StudentGroupFilterParams(FilterParams):
+    grade: Annotated[
+        Optional[int], Filter("grade"), Field(ge=1, le=11, description="Номер класса: 11 для группы '11-А'.")
+    ] = None
+    capacity_min: Annotated[Optional[int], Filter("capacity", "ge"), Field(description="Численность не меньше.")] = None
+    capacity_max: Annotated[Optional[int], Filter("capacity", "le"), Field(description="Численность не больше.")] = None
+    subject_id: Annotated[
+        Optional[int], Filter("subjects", "has", "subject_id"), Field(description="Изучают предмет.")
+    ] = None
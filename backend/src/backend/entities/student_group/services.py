@@ -1,14 +1,24 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.entities.base import ListResponseModel
+from backend.api.responses import ExportResponse, RawJSONResponse
+from backend.core.config import settings
+from backend.entities.base import BatchResponseModel, ImportReport, ListResponseModel
 from backend.entities.student_group.schemas import (
+    StudentGroupFilterParams,
     StudentGroupPostRequest,
     StudentGroupCreateResponse,
     StudentGroupResponse,
     StudentGroupPutRequest,
     StudentGroupUpdateResponse,
 )
-from backend.api.depends import PaginationParamsDep
+from backend.api.depends import (
+    BatchIdsDep,
+    ExpandParamsDep,
+    ExportParamsDep,
+    ImportParamsDep,
+    PaginationParamsDep,
+    ReadSessionFactoryDep,
+)
 
 from backend.entities.student_group.repository import student_group_repository
 from backend.entities.student_group.validators import validate_student_group_request
@@ -20,17 +30,50 @@ class StudentGroupManager:
     async def create_student_group(
         cls, session: AsyncSession, request_data: StudentGroupPostRequest
     ) -> StudentGroupCreateResponse:
-        async with session.begin():
-            student_group = await student_group_repository.create(session, request_data)
-            return StudentGroupCreateResponse.model_validate(student_group)
+        student_group = await student_group_repository.create(session, request_data)
+        return StudentGroupCreateResponse.model_validate(student_group)
+
+    @classmethod
+    async def import_student_groups(cls, session: AsyncSession, params: ImportParamsDep) -> ImportReport:
+        return await student_group_repository.import_student_groups(session, params)
+
+    @classmethod
+    async def get_student_group(cls, session: AsyncSession, id: int, expand: ExpandParamsDep) -> StudentGroupResponse:
+        student_group = await student_group_repository.get_by_id(session, id, load_strategy="selectin", expand=expand)
+        return StudentGroupResponse.model_validate(student_group)
+
+    @classmethod
+    async def get_student_groups_batch(
+        cls, session: AsyncSession, batch_ids: BatchIdsDep, expand: ExpandParamsDep
+    ) -> BatchResponseModel[StudentGroupResponse]:
+        batch = await student_group_repository.get_many(session, batch_ids.ids, load_strategy="selectin", expand=expand)
+        return BatchResponseModel[StudentGroupResponse].from_batch(batch)
 
     @classmethod
-    async def list_student_groups(cls, session: AsyncSession, pagination: PaginationParamsDep) -> ListResponseModel:
-        student_groups = await student_group_repository.list_student_groups(session, pagination)
-        total = await student_group_repository.entity_count(session)
-        return ListResponseModel[StudentGroupResponse](
-            items=student_groups, total=total, limit=pagination.limit, offset=pagination.offset
-        )
+    async def list_student_groups(
+        cls,
+        session: AsyncSession,
+        pagination: PaginationParamsDep,
+        expand: ExpandParamsDep,
+        filters: StudentGroupFilterParams,
+    ) -> ListResponseModel | RawJSONResponse:
+        if settings.api_config.READ_MODE == "json":
+            content = await student_group_repository.list_json(session, pagination, StudentGroupResponse, expand, filters)
+            return RawJSONResponse(content)
+
+        page = await student_group_repository.list_student_groups(session, pagination, expand, filters)
+        return ListResponseModel[StudentGroupResponse].from_page(page, pagination)
+
+    @classmethod
+    def export_student_groups(
+        cls,
+        session_factory: ReadSessionFactoryDep,
+        export: ExportParamsDep,
+        expand: ExpandParamsDep,
+        filters: StudentGroupFilterParams,
+    ) -> ExportResponse:
+        chunks = student_group_repository.export(session_factory, StudentGroupResponse, export.format, expand, filters)
+        return ExportResponse(chunks, export.format, "student_groups")
 
     @classmethod
     @validate_student_group_request
@@ -40,11 +83,9 @@ class StudentGroupManager:
         id: int,
         request_data: StudentGroupPutRequest,
     ) -> StudentGroupUpdateResponse:
-        async with session.begin():
-            student_group = await student_group_repository.update(session, id, request_data)
-            return StudentGroupUpdateResponse.model_validate(student_group)
+        student_group = await student_group_repository.update(session, id, request_data)
+        return StudentGroupUpdateResponse.model_validate(student_group)
 
     @classmethod
     async def delete_student_group(cls, session: AsyncSession, id: int) -> None:
-        await session.delete(await student_group_repository.get_by_id(session, id))
-        await session.commit()
+        await student_group_repository.delete(session, id)
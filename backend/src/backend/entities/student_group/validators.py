@@ -10,10 +10,15 @@ from backend.core.exceptions import (
 )
 from backend.entities.base import BaseValidator
 from backend.entities.student_group.models import StudentGroup
-from backend.entities.subject.models import Subject
+from backend.entities.subject.repository import subject_repository
 
 
 class StudentGroupReqValidator(BaseValidator):
+    constraint_errors = {
+        "uq_student_groups_name": lambda self, key: DuplicateStudentGroupException(self.request_data.name),
+        "fk_student_group_subjects_subject_id_subjects": lambda self, key: InvalidSubjectIDException(int(key)),
+    }
+
     def __init__(self, func, *args, **kwargs):
         super().__init__(func, *args, **kwargs)
 
@@ -28,30 +33,29 @@ class StudentGroupReqValidator(BaseValidator):
         if existing_student_group := await self.session.scalar(stmt):
             raise DuplicateStudentGroupException(existing_student_group.name)
 
-    async def _check_student_group_subjects_validity(self):
+    def check_request_data(self) -> None:
         user_ids = [subj.id for subj in self.request_data.subjects]
         duplicates = [item for item, count in Counter(user_ids).items() if count > 1]
         if duplicates:
             raise DuplicateSubjectIDException(*duplicates)
 
-        stmt = select(Subject.id).where(Subject.id.in_(user_ids))
-        db_subject_ids = await self.session.scalars(stmt)
+    async def _check_student_group_subjects_validity(self):
+        user_ids = [subj.id for subj in self.request_data.subjects]
+
+        db_subject_ids = await subject_repository.existing_ids(self.session, user_ids)
 
-        if wrong_subject_ids := set(user_ids) - set(db_subject_ids):
+        if wrong_subject_ids := set(user_ids) - db_subject_ids:
             raise InvalidSubjectIDException(*wrong_subject_ids)
 
     async def validate(self) -> None:
-        try:
-            await self._check_student_group_subjects_validity()
-            await self._check_duplicate_student_group()
-        finally:
-            await self.session.rollback()
+        self.check_request_data()
+        await self._check_student_group_subjects_validity()
+        await self._check_duplicate_student_group()
 
 
 def validate_student_group_request(func):
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        await StudentGroupReqValidator(func, *args, **kwargs).validate()
-        return await func(*args, **kwargs)
+        return await StudentGroupReqValidator(func, *args, **kwargs).run()
 
     return wrapper
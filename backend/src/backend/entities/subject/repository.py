@@ -1,51 +1,76 @@
-from typing import List, Sequence
+from typing import Iterable, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.api.depends import PaginationParamsDep
-from backend.entities.base import BaseRepository
+from backend.api.depends import ExpandParamsDep, PaginationParamsDep
+from backend.core.database import transaction
+from backend.core.exceptions import DuplicateSubjectNameException
+from backend.core.reference_cache import reference_cache
+from backend.entities.base import BaseRepository, ImportReport, Page
+from backend.entities.bulk_import import BulkImport
 from backend.entities.subject.models import Subject
 from backend.entities.subject.schemas import (
+    SubjectFilterParams,
     SubjectPostRequest,
     SubjectPutRequest,
     SubjectResponse,
 )
+from backend.utils.bulk_import import ImportParams
 
 
 class SubjectRepository(BaseRepository):
     def __init__(self) -> None:
         super().__init__(Subject)
+        self.bulk_import = BulkImport(
+            SubjectPostRequest,
+            Subject,
+            columns=("name",),
+            key=("name",),
+            values=lambda request_data: {"name": request_data.name},
+            duplicate=lambda values: DuplicateSubjectNameException(values["name"]),
+        )
 
     async def create(
         self, session: AsyncSession, request_data: SubjectPostRequest
-    ) -> Subject:
-        subject = self.sql_model(name=request_data.name)
-        session.add(subject)
-        return subject
+    ) -> dict:
+        (subject,) = await self.insert_returning(session, [{"name": request_data.name}])
+        return dict(subject)
 
     async def create_many(
         self, session: AsyncSession, request_data_list: List[SubjectPostRequest]
     ):
-        async with session.begin():
-            subjects = [self.sql_model(name=data.name) for data in request_data_list]
-            session.add_all(subjects)
+        async with transaction(session):
+            await self.insert_returning(session, [{"name": data.name} for data in request_data_list])
+
+    async def import_subjects(self, session: AsyncSession, params: ImportParams) -> ImportReport:
+        return await self.bulk_import.run(session, params)
 
     async def list_subjects(
-        self, session: AsyncSession, pagination: PaginationParamsDep
-    ) -> Sequence[SubjectResponse]:
-        subjects = await self.list_all(session, pagination, load_strategy="selectin")
-        return subjects
+        self,
+        session: AsyncSession,
+        pagination: PaginationParamsDep,
+        expand: Optional[ExpandParamsDep] = None,
+        filters: Optional[SubjectFilterParams] = None,
+    ) -> Page:
+        return await self.list_page(
+            session,
+            pagination,
+            load_strategy="selectin",
+            expand=expand,
+            schema=SubjectResponse,
+            filters=filters,
+        )
 
     async def update(
         self, session: AsyncSession, id: int, request_data: SubjectPutRequest
-    ) -> Subject:
-        subject = await self.get_by_id(session, id, load_strategy="selectin")
-        subject.name = request_data.name
-        session.add(subject)
+    ) -> dict:
+        subject = dict(await self.update_returning(session, id, {"name": request_data.name}))
+        # the response lists the subject's teachers, groups and classrooms, the UPDATE doesn't return them
+        subject.update(await self.relation_rows(session, id, SubjectResponse))
         return subject
 
-    async def delete(self, session: AsyncSession, id: int) -> None:
-        await session.delete(await self.get_by_id(session, id))
+    async def existing_ids(self, session: AsyncSession, ids: Iterable[int]) -> set[int]:
+        return await reference_cache.existing_ids(session, self.sql_model.__table__, ids)
 
 
 subject_repository = SubjectRepository()
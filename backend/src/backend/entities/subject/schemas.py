@@ -1,15 +1,16 @@
 import re
-from typing import List
+from typing import Annotated, List, Optional
 
 from fastapi import HTTPException
 from pydantic import Field, field_validator
 
-from backend.entities.base import CustomBaseModel
+from backend.entities.base import CustomBaseModel, ExpandableResponseModel
 from backend.entities.relations.schemas import (
     ClassroomIDResponse,
     StudentGroupWithHoursResponse,
     TeacherWithHoursResponse,
 )
+from backend.utils.filters import Filter, FilterParams
 
 # INFO: BASE
 
@@ -57,11 +58,11 @@ class SubjectPutRequest(SubjectRequest):
 # INFO: RESPONSE
 
 
-class SubjectResponse(SubjectBaseSchema):
+class SubjectResponse(SubjectBaseSchema, ExpandableResponseModel):
     id: int
-    teachers: List[TeacherWithHoursResponse]
-    student_groups: List[StudentGroupWithHoursResponse]
-    classrooms: List[ClassroomIDResponse]
+    teachers: Optional[List[TeacherWithHoursResponse]] = None
+    student_groups: Optional[List[StudentGroupWithHoursResponse]] = None
+    classrooms: Optional[List[ClassroomIDResponse]] = None
 
     model_config = {
         "json_schema_extra": {
@@ -94,3 +95,18 @@ class SubjectCreateResponse(SubjectBaseSchema):
 
 class SubjectUpdateResponse(SubjectResponse):
     pass
+
+
+# INFO: FILTERS
+
+
+class SubjectFilterParams(FilterParams):
+    teacher_id: Annotated[
+        Optional[int], Filter("teachers", "has", "teacher_id"), Field(description="Преподаются учителем.")
+    ] = None
+    student_group_id: Annotated[
+        Optional[int], Filter("student_groups", "has", "student_group_id"), Field(description="Изучаются группой.")
+    ] = None
+    classroom_id: Annotated[
+        Optional[int], Filter("classrooms", "has", "classroom_id"), Field(description="Проводятся в кабинете.")
+    ] = None
@@ -1,7 +1,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.entities.base import ListResponseModel
+from backend.api.responses import ExportResponse, RawJSONResponse
+from backend.core.config import settings
+from backend.entities.base import BatchResponseModel, ImportReport, ListResponseModel
 from backend.entities.subject.schemas import (
+    SubjectFilterParams,
     SubjectCreateResponse,
     SubjectPostRequest,
     SubjectResponse,
@@ -10,7 +13,14 @@ from backend.entities.subject.schemas import (
 )
 from backend.entities.subject.validators import validate_subject_request
 from backend.entities.subject.repository import subject_repository
-from backend.api.depends import PaginationParamsDep
+from backend.api.depends import (
+    BatchIdsDep,
+    ExpandParamsDep,
+    ExportParamsDep,
+    ImportParamsDep,
+    PaginationParamsDep,
+    ReadSessionFactoryDep,
+)
 
 
 class SubjectManager:
@@ -18,16 +28,49 @@ class SubjectManager:
     @validate_subject_request
     async def create_subject(cls, session: AsyncSession, request_data: SubjectPostRequest) -> SubjectCreateResponse:
         subject = await subject_repository.create(session, request_data)
-        await session.commit()
         return SubjectCreateResponse.model_validate(subject)
 
     @classmethod
-    async def list_subjects(cls, session: AsyncSession, pagination: PaginationParamsDep) -> ListResponseModel:
-        subjects = await subject_repository.list_subjects(session, pagination)
-        total = await subject_repository.entity_count(session)
-        return ListResponseModel[SubjectResponse](
-            items=subjects, total=total, limit=pagination.limit, offset=pagination.offset
-        )
+    async def import_subjects(cls, session: AsyncSession, params: ImportParamsDep) -> ImportReport:
+        return await subject_repository.import_subjects(session, params)
+
+    @classmethod
+    async def get_subject(cls, session: AsyncSession, id: int, expand: ExpandParamsDep) -> SubjectResponse:
+        subject = await subject_repository.get_by_id(session, id, load_strategy="selectin", expand=expand)
+        return SubjectResponse.model_validate(subject)
+
+    @classmethod
+    async def get_subjects_batch(
+        cls, session: AsyncSession, batch_ids: BatchIdsDep, expand: ExpandParamsDep
+    ) -> BatchResponseModel[SubjectResponse]:
+        batch = await subject_repository.get_many(session, batch_ids.ids, load_strategy="selectin", expand=expand)
+        return BatchResponseModel[SubjectResponse].from_batch(batch)
+
+    @classmethod
+    async def list_subjects(
+        cls,
+        session: AsyncSession,
+        pagination: PaginationParamsDep,
+        expand: ExpandParamsDep,
+        filters: SubjectFilterParams,
+    ) -> ListResponseModel | RawJSONResponse:
+        if settings.api_config.READ_MODE == "json":
+            content = await subject_repository.list_json(session, pagination, SubjectResponse, expand, filters)
+            return RawJSONResponse(content)
+
+        page = await subject_repository.list_subjects(session, pagination, expand, filters)
+        return ListResponseModel[SubjectResponse].from_page(page, pagination)
+
+    @classmethod
+    def export_subjects(
+        cls,
+        session_factory: ReadSessionFactoryDep,
+        export: ExportParamsDep,
+        expand: ExpandParamsDep,
+        filters: SubjectFilterParams,
+    ) -> ExportResponse:
+        chunks = subject_repository.export(session_factory, SubjectResponse, export.format, expand, filters)
+        return ExportResponse(chunks, export.format, "subjects")
 
     @classmethod
     @validate_subject_request
@@ -35,10 +78,8 @@ class SubjectManager:
         cls, session: AsyncSession, id: int, request_data: SubjectPutRequest
     ) -> SubjectUpdateResponse:
         subject = await subject_repository.update(session, id, request_data)
-        await session.commit()
         return SubjectUpdateResponse.model_validate(subject)
 
     @classmethod
     async def delete_subject(cls, session: AsyncSession, id: int) -> None:
         await subject_repository.delete(session, id)
-        await session.commit()
@@ -8,6 +8,10 @@ from backend.entities.subject.models import Subject
 
 
 class SubjectValidator(BaseValidator):
+    constraint_errors = {
+        "uq_subjects_name": lambda self, key: DuplicateSubjectNameException(self.request_data.name),
+    }
+
     def __init__(self, func, *args, **kwargs):
         super().__init__(func, *args, **kwargs)
 
@@ -21,17 +25,12 @@ class SubjectValidator(BaseValidator):
             raise DuplicateSubjectNameException(existing_subject.name)
 
     async def validate(self) -> None:
-        try:
-            await self.check_duplicate_subject()
-        finally:
-            await self.session.rollback()
+        await self.check_duplicate_subject()
 
 
 def validate_subject_request(func):
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        await SubjectValidator(func, *args, **kwargs).validate()
-
-        return await func(*args, **kwargs)
+        return await SubjectValidator(func, *args, **kwargs).run()
 
     return wrapper
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Boolean, String
+from sqlalchemy import Boolean, Index, String, UniqueConstraint, literal_column, text
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.entities.base import Base
@@ -10,6 +11,12 @@ if TYPE_CHECKING:
 
 
 class Teacher(Base):
+    __table_args__ = (
+        UniqueConstraint("last_name", "first_name", "patronymic"),
+        # pages of active teachers in id order
+        Index("ix_teachers_active_id", "id", postgresql_where=text("is_active")),
+    )
+
     id: Mapped[int] = mapped_column(primary_key=True)
     first_name: Mapped[str] = mapped_column(String, nullable=False)
     last_name: Mapped[str] = mapped_column(String, nullable=False)
@@ -21,6 +28,22 @@ class Teacher(Base):
         cascade="all, delete-orphan",
     )
 
-    @property
+    @hybrid_property
     def name(self) -> str:
         return f"{self.last_name} {self.first_name} {self.patronymic}"
+
+    @name.inplace.expression
+    @classmethod
+    def _name_expression(cls):
+        # an inline separator, queries must repeat the indexed expression verbatim to use its index
+        space = literal_column("' '")
+        return cls.last_name + space + cls.first_name + space + cls.patronymic
+
+
+# name search, pg_trgm is created by the migration (and by create_db_tables for local runs)
+Index(
+    "ix_teachers_name_trgm",
+    Teacher.name.label("name"),
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+)
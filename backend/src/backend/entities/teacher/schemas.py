@@ -1,14 +1,15 @@
 import re
-from typing import List
+from typing import Annotated, List, Optional
 
 from fastapi import HTTPException
 from pydantic import Field, field_validator
 
-from backend.entities.base import CustomBaseModel
+from backend.entities.base import CustomBaseModel, ExpandableResponseModel
 from backend.entities.relations.schemas import (
     SubjectWithTHoursRequest,
     SubjectWithTHoursResponse,
 )
+from backend.utils.filters import Filter, FilterParams
 
 # INFO: BASE
 
@@ -95,10 +96,16 @@ class TeacherPutRequest(_TeacherUpdateRequest):
 # INFO: RESPONSE
 
 
-class TeacherResponse(TeacherBaseSchema):
+class TeacherResponse(TeacherBaseSchema, ExpandableResponseModel):
     id: int
     is_active: bool = True
-    subjects: List[SubjectWithTHoursResponse]
+    subjects: Optional[List[SubjectWithTHoursResponse]] = None
+
+
+class TeacherSearchResponse(TeacherBaseSchema):
+    id: int
+    is_active: bool
+    score: float = Field(..., description="Сходство с запросом, от 0 до 1")
 
 
 # INFO: UPDATEresponse
@@ -111,3 +118,13 @@ class TeacherUpdateResponse(TeacherResponse):
 # INFO: CREATEresponse
 class TeacherCreateResponse(TeacherResponse):
     pass
+
+
+# INFO: FILTERS
+
+
+class TeacherFilterParams(FilterParams):
+    is_active: Annotated[Optional[bool], Filter("is_active"), Field(description="Только активные / неактивные.")] = None
+    subject_id: Annotated[
+        Optional[int], Filter("subjects", "has", "subject_id"), Field(description="Преподают предмет.")
+    ] = None
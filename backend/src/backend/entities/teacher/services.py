@@ -1,16 +1,29 @@
+from typing import List
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.entities.base import ListResponseModel
+from backend.api.responses import ExportResponse, RawJSONResponse
+from backend.core.config import settings
+from backend.entities.base import BatchResponseModel, ImportReport, ListResponseModel
 from backend.entities.teacher.schemas import (
+    TeacherFilterParams,
     TeacherCreateResponse,
     TeacherPostRequest,
     TeacherPutRequest,
     TeacherResponse,
+    TeacherSearchResponse,
     TeacherUpdateResponse,
 )
 from backend.entities.teacher.validators import validate_teacher_request
 from backend.entities.teacher.repository import teacher_repository
-from backend.api.depends import PaginationParamsDep
+from backend.api.depends import (
+    BatchIdsDep,
+    ExpandParamsDep,
+    ExportParamsDep,
+    ImportParamsDep,
+    PaginationParamsDep,
+    ReadSessionFactoryDep,
+)
 
 
 class TeacherManager:
@@ -19,33 +32,64 @@ class TeacherManager:
     async def create_teacher(
         cls, session: AsyncSession, request_data: TeacherPostRequest
     ) -> TeacherCreateResponse:
-        async with session.begin():
-            teacher = await teacher_repository.create(session, request_data)
-            return TeacherCreateResponse.model_validate(teacher)
+        teacher = await teacher_repository.create(session, request_data)
+        return TeacherCreateResponse.model_validate(teacher)
+
+    @classmethod
+    async def import_teachers(cls, session: AsyncSession, params: ImportParamsDep) -> ImportReport:
+        return await teacher_repository.import_teachers(session, params)
+
+    @classmethod
+    async def get_teacher(cls, session: AsyncSession, id: int, expand: ExpandParamsDep) -> TeacherResponse:
+        teacher = await teacher_repository.get_by_id(session, id, load_strategy="selectin", expand=expand)
+        return TeacherResponse.model_validate(teacher)
+
+    @classmethod
+    async def get_teachers_batch(
+        cls, session: AsyncSession, batch_ids: BatchIdsDep, expand: ExpandParamsDep
+    ) -> BatchResponseModel[TeacherResponse]:
+        batch = await teacher_repository.get_many(session, batch_ids.ids, load_strategy="selectin", expand=expand)
+        return BatchResponseModel[TeacherResponse].from_batch(batch)
+
+    @classmethod
+    async def search_teachers(cls, session: AsyncSession, query: str, limit: int) -> List[TeacherSearchResponse]:
+        teachers = await teacher_repository.search(session, query, limit)
+        return [TeacherSearchResponse.model_validate(teacher) for teacher in teachers]
 
     @classmethod
     async def list_teachers(
-        cls, session: AsyncSession, pagination: PaginationParamsDep
-    ) -> ListResponseModel:
-        teachers = await teacher_repository.list_teachers(session, pagination)
-        total = await teacher_repository.entity_count(session)
-        return ListResponseModel[TeacherResponse](
-            items=teachers,
-            total=total,
-            limit=pagination.limit,
-            offset=pagination.offset,
-        )
+        cls,
+        session: AsyncSession,
+        pagination: PaginationParamsDep,
+        expand: ExpandParamsDep,
+        filters: TeacherFilterParams,
+    ) -> ListResponseModel | RawJSONResponse:
+        if settings.api_config.READ_MODE == "json":
+            content = await teacher_repository.list_json(session, pagination, TeacherResponse, expand, filters)
+            return RawJSONResponse(content)
+
+        page = await teacher_repository.list_teachers(session, pagination, expand, filters)
+        return ListResponseModel[TeacherResponse].from_page(page, pagination)
+
+    @classmethod
+    def export_teachers(
+        cls,
+        session_factory: ReadSessionFactoryDep,
+        export: ExportParamsDep,
+        expand: ExpandParamsDep,
+        filters: TeacherFilterParams,
+    ) -> ExportResponse:
+        chunks = teacher_repository.export(session_factory, TeacherResponse, export.format, expand, filters)
+        return ExportResponse(chunks, export.format, "teachers")
 
     @classmethod
     @validate_teacher_request
     async def update_teacher(
         cls, session: AsyncSession, id: int, request_data: TeacherPutRequest
     ) -> TeacherUpdateResponse:
-        async with session.begin():
-            teacher = await teacher_repository.update(session, id, request_data)
-            return TeacherUpdateResponse.model_validate(teacher)
+        teacher = await teacher_repository.update(session, id, request_data)
+        return TeacherUpdateResponse.model_validate(teacher)
 
     @classmethod
     async def delete_teacher(cls, session: AsyncSession, id: int) -> None:
         await teacher_repository.delete(session, id)
-        await session.commit()
@@ -9,11 +9,18 @@ from backend.core.exceptions import (
     InvalidSubjectIDException,
 )
 from backend.entities.base import BaseValidator
-from backend.entities.subject.models import Subject
+from backend.entities.subject.repository import subject_repository
 from backend.entities.teacher.models import Teacher
 
 
 class TeacherReqValidator(BaseValidator):
+    constraint_errors = {
+        "uq_teachers_last_name_first_name_patronymic": lambda self, key: DuplicateTeacherException(
+            f"{self.request_data.last_name} {self.request_data.first_name} {self.request_data.patronymic}"
+        ),
+        "fk_teacher_subjects_subject_id_subjects": lambda self, key: InvalidSubjectIDException(int(key)),
+    }
+
     def __init__(self, func, *args, **kwargs):
         super().__init__(func, *args, **kwargs)
 
@@ -30,30 +37,29 @@ class TeacherReqValidator(BaseValidator):
         if existing_teacher := await self.session.scalar(stmt):
             raise DuplicateTeacherException(existing_teacher.name)
 
-    async def check_teacher_subjects_validity(self):
+    def check_request_data(self):
         user_ids = [subj.id for subj in self.request_data.subjects]
         duplicates = [item for item, count in Counter(user_ids).items() if count > 1]
         if duplicates:
             raise DuplicateSubjectIDException(*duplicates)
 
-        stmt = select(Subject.id).where(Subject.id.in_(user_ids))
-        db_subject_ids = await self.session.scalars(stmt)
+    async def check_teacher_subjects_validity(self):
+        user_ids = [subj.id for subj in self.request_data.subjects]
+
+        db_subject_ids = await subject_repository.existing_ids(self.session, user_ids)
 
-        if wrong_subject_ids := set(user_ids) - set(db_subject_ids):
+        if wrong_subject_ids := set(user_ids) - db_subject_ids:
             raise InvalidSubjectIDException(*wrong_subject_ids)
 
     async def validate(self):
-        try:
-            await self.check_teacher_subjects_validity()
-            await self.check_duplicate_teacher()
-        finally:
-            await self.session.rollback()
+        self.check_request_data()
+        await self.check_teacher_subjects_validity()
+        await self.check_duplicate_teacher()
 
 
 def validate_teacher_request(func):
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        await TeacherReqValidator(func, *args, **kwargs).validate()
-        return await func(*args, **kwargs)
+        return await TeacherReqValidator(func, *args, **kwargs).run()
 
     return wrapper
@@ -0,0 +1,62 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Sequence
+
+from backend.core.config import settings
+from timetable.problem import Component, Problem, decompose
+from timetable.solver import Solution, merge, solve_best
+
+
+def _solve_components(components: Sequence[Component], seeds: Sequence[Optional[int]]) -> list[Solution]:
+    return [solve_best(component.problem, seeds) for component in components]
+
+
+class SchedulePool:
+    """Randomized restarts of the timetable search spread over a pool of worker processes.
+
+    The problem is first split into independent parts (``decompose``), every part is searched on
+    its own and the best solutions of the parts are merged. A task is one part with a share of
+    the seeds: the worker gets that part once and sends back only its best solution. The pool is
+    spawned on first use, a single worker searches in a thread instead.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    async def solve(self, problem: Problem, restarts: Optional[int] = None) -> Solution:
+        """Best of ``restarts`` searches per part, one per worker by default; the first one is not randomized."""
+        seeds = [None, *range(1, restarts or self.workers)]
+        # the biggest parts go first, so they don't end up alone on a worker at the end
+        components = sorted(decompose(problem), key=lambda component: -len(component.problem.courses))
+
+        if self.workers == 1 or len(seeds) == len(components) == 1:
+            solutions = await asyncio.to_thread(_solve_components, components, seeds)
+            return merge(problem, components, solutions)
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        shares = [seeds[worker :: self.workers] for worker in range(min(self.workers, len(seeds)))]
+        tasks = [
+            [loop.run_in_executor(executor, solve_best, component.problem, share) for share in shares]
+            for component in components
+        ]
+        # shares[0] starts with the deterministic search, ties go to it
+        solutions = [min(await asyncio.gather(*part), key=lambda solution: solution.penalty) for part in tasks]
+        return merge(problem, components, solutions)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # forking a process with a running event loop and open connections is unsafe
+            self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+
+schedule_pool = SchedulePool(settings.api_config.SCHEDULE_WORKERS)
@@ -0,0 +1,109 @@
+from datetime import date
+from typing import Sequence
+
+from sqlalchemy import Row, Subquery, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from backend.entities.classroom.models import Classroom
+from backend.entities.lesson.models import Lesson
+from backend.entities.relations.models import ClassroomSubject, StudentGroupSubject, TeacherSubject
+from backend.entities.student_group.models import StudentGroup
+from backend.entities.teacher.models import Teacher
+from timetable.problem import GroupHours, Problem, Room, TeacherHours, build_problem
+
+
+class ScheduleRepository:
+    async def load_problem(
+        self, session: AsyncSession, date_from: date, date_to: date, school_shift: int, periods: int
+    ) -> Problem:
+        """Curriculum, teachers of active staff and rooms with their subjects, three flat selects.
+
+        Lessons the week already has in other shifts count against both the groups' study hours
+        and the teachers' teaching hours, so the shifts of a week share one curriculum.
+        """
+        other_shifts = Lesson.school_shift != school_shift
+        group_lessons = self._lesson_counts(Lesson.student_group_id, date_from, date_to, other_shifts)
+        study_hours = StudentGroupSubject.study_hours - func.coalesce(group_lessons.c.lessons, 0)
+        group_hours = (
+            select(
+                StudentGroupSubject.student_group_id,
+                StudentGroup.capacity,
+                StudentGroupSubject.subject_id,
+                study_hours,
+            )
+            .join(StudentGroup, StudentGroup.id == StudentGroupSubject.student_group_id)
+            .outerjoin(
+                group_lessons,
+                (group_lessons.c.owner_id == StudentGroupSubject.student_group_id)
+                & (group_lessons.c.subject_id == StudentGroupSubject.subject_id),
+            )
+            .where(study_hours > 0)
+        )
+
+        teacher_lessons = self._lesson_counts(Lesson.teacher_id, date_from, date_to, other_shifts)
+        teaching_hours = TeacherSubject.teaching_hours - func.coalesce(teacher_lessons.c.lessons, 0)
+        teacher_hours = (
+            select(TeacherSubject.teacher_id, TeacherSubject.subject_id, teaching_hours)
+            .join(Teacher, Teacher.id == TeacherSubject.teacher_id)
+            .outerjoin(
+                teacher_lessons,
+                (teacher_lessons.c.owner_id == TeacherSubject.teacher_id)
+                & (teacher_lessons.c.subject_id == TeacherSubject.subject_id),
+            )
+            .where(Teacher.is_active, teaching_hours > 0)
+        )
+
+        # NULL for rooms linked to no subject
+        subject_ids = func.array_agg(ClassroomSubject.subject_id).filter(ClassroomSubject.subject_id.is_not(None))
+        rooms = (
+            select(Classroom.id, Classroom.capacity, subject_ids)
+            .outerjoin(ClassroomSubject, ClassroomSubject.classroom_id == Classroom.id)
+            .group_by(Classroom.id)
+            .order_by(Classroom.id)
+        )
+
+        return build_problem(
+            (date_to - date_from).days + 1,
+            periods,
+            [GroupHours(*row) for row in await session.execute(group_hours)],
+            [TeacherHours(*row) for row in await session.execute(teacher_hours)],
+            [Room(id, capacity, tuple(ids or ())) for id, capacity, ids in await session.execute(rooms)],
+        )
+
+    async def week_lessons(
+        self, session: AsyncSession, date_from: date, date_to: date, school_shift: int
+    ) -> Sequence[Row]:
+        stmt = select(
+            Lesson.lesson_date,
+            Lesson.lesson_number,
+            Lesson.student_group_id,
+            Lesson.teacher_id,
+            Lesson.classroom_id,
+            Lesson.subject_id,
+        ).where(Lesson.lesson_date.between(date_from, date_to), Lesson.school_shift == school_shift)
+        return (await session.execute(stmt)).all()
+
+    async def missing_hours(self, session: AsyncSession, date_from: date, date_to: date) -> int:
+        """Curriculum lessons of all groups the week's lessons between the dates, of any shift, fall short of."""
+        scheduled = self._lesson_counts(Lesson.student_group_id, date_from, date_to)
+        missing = func.greatest(StudentGroupSubject.study_hours - func.coalesce(scheduled.c.lessons, 0), 0)
+        stmt = select(func.coalesce(func.sum(missing), 0)).select_from(StudentGroupSubject).outerjoin(
+            scheduled,
+            (scheduled.c.owner_id == StudentGroupSubject.student_group_id)
+            & (scheduled.c.subject_id == StudentGroupSubject.subject_id),
+        )
+        return int(await session.scalar(stmt))
+
+    @staticmethod
+    def _lesson_counts(owner: InstrumentedAttribute, date_from: date, date_to: date, *conditions) -> Subquery:
+        """Lessons between the dates per ``owner`` (group or teacher) and subject."""
+        return (
+            select(owner.label("owner_id"), Lesson.subject_id, func.count().label("lessons"))
+            .where(Lesson.lesson_date.between(date_from, date_to), *conditions)
+            .group_by(owner, Lesson.subject_id)
+            .subquery()
+        )
+
+
+schedule_repository = ScheduleRepository()
@@ -0,0 +1,87 @@
+from datetime import date
+from typing import List, Optional
+
+from fastapi import HTTPException
+from pydantic import Field, field_validator
+
+from backend.entities.base import CustomBaseModel
+from backend.entities.lesson.schemas import LessonBaseSchema
+from timetable.scoring import Score
+
+# INFO: BASE
+
+
+class ScheduleWeek(CustomBaseModel):
+    week_start: date = Field(..., description="Понедельник недели расписания")
+    school_shift: int = Field(1, ge=1, le=3)
+    days: int = Field(5, ge=1, le=6, description="Учебных дней в неделе")
+
+    @field_validator("week_start")
+    @classmethod
+    def validate_week_start(cls, value: date) -> date:
+        if value.weekday() != 0:
+            raise HTTPException(status_code=400, detail="Неделя расписания должна начинаться с понедельника.")
+        return value
+
+
+# INFO: REQUEST
+
+
+class ScheduleGenerateRequest(ScheduleWeek):
+    lessons_per_day: int = Field(7, ge=1, le=8, description="Уроков в день, нумерация с 1")
+    restarts: Optional[int] = Field(
+        None, ge=1, le=256, description="Случайных перезапусков поиска, по умолчанию по одному на процесс"
+    )
+    dry_run: bool = Field(False, description="Только показать расписание, не заменяя уроки недели в этой смене")
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "week_start": "2025-03-17",
+                "school_shift": 1,
+                "days": 5,
+                "lessons_per_day": 7,
+                "dry_run": True,
+            }
+        }
+    }
+
+
+class ScheduleScoreParams(ScheduleWeek):
+    pass
+
+
+# INFO: RESPONSE
+
+
+class ScheduleScore(CustomBaseModel):
+    penalty: int = Field(..., description="Сумма штрафов с весами, меньше - лучше")
+    unplaced: int = Field(..., description="Уроков учебного плана, которых нет в неделе")
+    clashes: int = Field(..., description="Уроков в уже занятом слоте группы, преподавателя или кабинета")
+    student_gaps: int = Field(..., description="Окон в днях групп")
+    teacher_windows: int = Field(..., description="Окон в днях преподавателей")
+    load_imbalance: int = Field(..., description="Разница самого загруженного и самого свободного дня, по группам")
+    subject_repetition: int = Field(..., description="Повторов предмета у группы в один день")
+
+    @classmethod
+    def from_score(cls, score: Score) -> "ScheduleScore":
+        return cls(penalty=score.total, **score._asdict())
+
+
+class ScheduleScoreResponse(ScheduleScore):
+    lessons: int
+
+
+class UnscheduledHours(CustomBaseModel):
+    student_group_id: int
+    subject_id: int
+    teacher_id: Optional[int] = None
+    hours: int = Field(..., description="Уроков в неделю, не попавших в расписание")
+    reason: str
+
+
+class ScheduleGenerateResponse(CustomBaseModel):
+    placed: int
+    score: ScheduleScore
+    unscheduled: List[UnscheduledHours]
+    lessons: List[LessonBaseSchema]
@@ -0,0 +1,90 @@
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.entities.lesson.repository import lesson_repository
+from backend.entities.lesson.schemas import LessonBaseSchema
+from backend.scheduling.pool import schedule_pool
+from backend.scheduling.repository import schedule_repository
+from backend.scheduling.schemas import (
+    ScheduleGenerateRequest,
+    ScheduleGenerateResponse,
+    ScheduleScore,
+    ScheduleScoreParams,
+    ScheduleScoreResponse,
+    UnscheduledHours,
+)
+from timetable.problem import Problem
+from timetable.scoring import Scorer, score_week
+from timetable.solver import Solution
+
+# lesson_number is 0..8
+LESSON_NUMBERS = 9
+
+
+class ScheduleManager:
+    @classmethod
+    async def generate_schedule(
+        cls, session: AsyncSession, request_data: ScheduleGenerateRequest
+    ) -> ScheduleGenerateResponse:
+        date_to = request_data.week_start + timedelta(days=request_data.days - 1)
+        problem = await schedule_repository.load_problem(
+            session, request_data.week_start, date_to, request_data.school_shift, request_data.lessons_per_day
+        )
+        solution = await schedule_pool.solve(problem, request_data.restarts)
+        lessons = cls._lessons(problem, solution, request_data)
+
+        if not request_data.dry_run:
+            await lesson_repository.replace_range(
+                session, request_data.week_start, date_to, request_data.school_shift, lessons
+            )
+
+        return ScheduleGenerateResponse(
+            placed=len(lessons),
+            score=ScheduleScore.from_score(Scorer(problem).score(solution)),
+            unscheduled=cls._unscheduled(problem, solution),
+            lessons=[LessonBaseSchema.model_validate(lesson) for lesson in lessons],
+        )
+
+    @classmethod
+    async def score_schedule(cls, session: AsyncSession, params: ScheduleScoreParams) -> ScheduleScoreResponse:
+        date_to = params.week_start + timedelta(days=params.days - 1)
+        rows = await schedule_repository.week_lessons(session, params.week_start, date_to, params.school_shift)
+        missing = await schedule_repository.missing_hours(session, params.week_start, date_to)
+        score = score_week(params.week_start, params.days, LESSON_NUMBERS, rows, missing)
+        return ScheduleScoreResponse(lessons=len(rows), **ScheduleScore.from_score(score).model_dump())
+
+    @staticmethod
+    def _lessons(problem: Problem, solution: Solution, request_data: ScheduleGenerateRequest) -> list[dict]:
+        lessons = []
+        for course_index, slot, room in solution.placements.tolist():
+            course = problem.courses[course_index]
+            day, period = divmod(slot, problem.periods)
+            lessons.append(
+                {
+                    "lesson_date": request_data.week_start + timedelta(days=day),
+                    "school_shift": request_data.school_shift,
+                    "lesson_number": period + 1,
+                    "classroom_id": problem.room_ids[room],
+                    "subject_id": course.subject_id,
+                    "teacher_id": problem.teacher_ids[course.teacher],
+                    "student_group_id": problem.group_ids[course.group],
+                }
+            )
+        return lessons
+
+    @staticmethod
+    def _unscheduled(problem: Problem, solution: Solution) -> list[UnscheduledHours]:
+        unscheduled = [UnscheduledHours(**item._asdict()) for item in problem.unassigned]
+        for course, hours in zip(problem.courses, solution.unplaced):
+            if hours:
+                unscheduled.append(
+                    UnscheduledHours(
+                        student_group_id=problem.group_ids[course.group],
+                        subject_id=course.subject_id,
+                        teacher_id=problem.teacher_ids[course.teacher],
+                        hours=hours,
+                        reason="нет свободного времени",
+                    )
+                )
+        return unscheduled
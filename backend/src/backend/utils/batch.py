@@ -0,0 +1,33 @@
+from fastapi import Query
+from pydantic.dataclasses import dataclass
+
+from backend.core.config import settings
+from backend.core.exceptions import InvalidBatchIdsException
+
+
+@dataclass
+class BatchIds:
+    ids: list[int]
+
+
+def get_batch_ids(
+    ids: list[str] = Query(
+        ...,
+        description=(
+            "Идентификаторы через запятую или повторением параметра: 'ids=3,1,2' или 'ids=3&ids=1'. "
+            "Порядок ответа совпадает с порядком запроса."
+        ),
+    ),
+) -> BatchIds:
+    limit = settings.api_config.BATCH_LIMIT
+    items = [item.strip() for value in ids for item in value.split(",") if item.strip()]
+    try:
+        parsed = [int(item) for item in items]
+    except ValueError:
+        raise InvalidBatchIdsException(",".join(ids), limit)
+
+    # repeated ids are answered once, at their first position
+    unique_ids = list(dict.fromkeys(parsed))
+    if not unique_ids or len(unique_ids) > limit:
+        raise InvalidBatchIdsException(",".join(ids), limit)
+    return BatchIds(ids=unique_ids)
@@ -0,0 +1,153 @@
+import codecs
+import csv
+from collections import deque
+from typing import Any, AsyncIterator, Type, Union, get_origin
+
+import orjson
+from fastapi import Query, Request
+from pydantic import BaseModel, ConfigDict
+from pydantic.dataclasses import dataclass
+
+from backend.core.exceptions import InvalidImportFileException
+from backend.utils.export import MEDIA_TYPES, ExportFormat
+
+# the body is read raw, this documents it for both formats
+IMPORT_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {media_type: {"schema": {"type": "string"}} for media_type in MEDIA_TYPES.values()},
+    }
+}
+
+# field values of a record, or why it couldn't be read
+RawRow = Union[dict[str, Any], str]
+
+
+@dataclass(config=ConfigDict(arbitrary_types_allowed=True))
+class ImportParams:
+    format: ExportFormat
+    # the request body as it arrives
+    chunks: AsyncIterator[bytes]
+
+
+async def get_import_params(
+    request: Request,
+    format: ExportFormat = Query(
+        "ndjson",
+        description="'ndjson' - тело POST-запроса на строку, 'csv' - заголовок с именами полей, списки в ячейках как JSON",
+    ),
+) -> ImportParams:
+    return ImportParams(format=format, chunks=request.stream())
+
+
+async def read_rows(params: ImportParams, schema: Type[BaseModel]) -> AsyncIterator[tuple[int, RawRow]]:
+    """Line number and field values of every record, read while the body arrives.
+
+    Empty CSV cells are left out, so defaults apply.
+    """
+    lines = _lines(params.chunks)
+    if params.format == "ndjson":
+        rows = _ndjson_rows(lines)
+    else:
+        json_fields = {name for name, field in schema.model_fields.items() if get_origin(field.annotation) is list}
+        rows = _csv_rows(lines, json_fields)
+    async for row in rows:
+        yield row
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[list[str]]:
+    """The complete lines of every chunk, line ends kept; a character split between chunks is decoded whole."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    tail = ""
+    async for chunk in chunks:
+        *lines, tail = (tail + _decode(decoder, chunk)).split("\n")
+        if lines:
+            yield [f"{line}\n" for line in lines]
+    if tail := tail + _decode(decoder, b"", final=True):
+        yield [tail]
+
+
+def _decode(decoder: codecs.IncrementalDecoder, chunk: bytes, final: bool = False) -> str:
+    try:
+        return decoder.decode(chunk, final)
+    except UnicodeDecodeError:
+        raise InvalidImportFileException("ожидается текст в кодировке UTF-8")
+
+
+async def _ndjson_rows(lines: AsyncIterator[list[str]]) -> AsyncIterator[tuple[int, RawRow]]:
+    line_no = 0
+    async for batch in lines:
+        for line in batch:
+            line_no += 1
+            if not line.strip():
+                continue
+            try:
+                row = orjson.loads(line)
+            except orjson.JSONDecodeError as error:
+                yield line_no, f"Неверный JSON: {error}"
+                continue
+            yield line_no, row if isinstance(row, dict) else "Ожидается объект JSON"
+
+
+class _Records:
+    """Lines for a csv reader that is fed as the body arrives.
+
+    Lines become readable only once the quotes are balanced, so the reader never runs
+    out of input in the middle of a quoted cell that spans lines.
+    """
+
+    def __init__(self) -> None:
+        self.ready: deque[str] = deque()
+        self.pending: list[str] = []
+        self.in_quotes = False
+
+    def feed(self, lines: list[str]) -> None:
+        for line in lines:
+            self.pending.append(line)
+            self.in_quotes ^= line.count('"') % 2 == 1
+            if not self.in_quotes:
+                self.ready.extend(self.pending)
+                self.pending.clear()
+
+    def flush(self) -> None:
+        self.ready.extend(self.pending)
+        self.pending.clear()
+
+    def __iter__(self) -> "_Records":
+        return self
+
+    def __next__(self) -> str:
+        if not self.ready:
+            raise StopIteration
+        return self.ready.popleft()
+
+
+async def _csv_rows(lines: AsyncIterator[list[str]], json_fields: set[str]) -> AsyncIterator[tuple[int, RawRow]]:
+    records = _Records()
+    # the reader resumes where it stopped whenever more lines are fed
+    reader = csv.DictReader(records)
+    async for batch in lines:
+        records.feed(batch)
+        for record in reader:
+            yield reader.line_num, _csv_row(record, json_fields)
+    records.flush()
+    for record in reader:
+        yield reader.line_num, _csv_row(record, json_fields)
+
+
+def _csv_row(record: dict[Any, Any], json_fields: set[str]) -> RawRow:
+    # DictReader puts surplus cells under None and fills missing ones with None
+    if None in record:
+        return "Значений больше, чем столбцов в заголовке"
+
+    row = {}
+    for name, cell in record.items():
+        if cell is None or cell == "":
+            continue
+        if name in json_fields:
+            try:
+                cell = orjson.loads(cell)
+            except orjson.JSONDecodeError:
+                return f"Неверный JSON в столбце '{name}'"
+        row[name] = cell
+    return row
@@ -21,6 +21,12 @@ def parse_cors(v: Any) -> list[AnyUrl] | str:
     raise HTTPException(status_code=400, detail=f"Invalid CORS value: {v}")
 
 
+def parse_list(v: Any) -> list[str] | str:
+    if isinstance(v, str) and not v.startswith("["):
+        return [i.strip() for i in v.split(",") if i.strip()]
+    return v
+
+
 def path_to_dotted_string(api_path: str | Path) -> str:
     if isinstance(api_path, Path):
         return str(api_path).strip("/").replace("/", ".")
@@ -0,0 +1,32 @@
+from typing import Optional
+
+from fastapi import Query
+from pydantic.dataclasses import dataclass
+
+
+@dataclass
+class ExpandParams:
+    relations: Optional[dict[str, Optional[str]]] = None
+
+    @property
+    def expand_all(self) -> bool:
+        return self.relations is None
+
+
+def get_expand(
+    expand: Optional[str] = Query(
+        None,
+        description=(
+            "Связи для загрузки через запятую, опционально с методом загрузки: 'subjects:joined,teachers'. "
+            "Пустое значение - без связей, отсутствие параметра - все связи."
+        ),
+    ),
+) -> ExpandParams:
+    if expand is None:
+        return ExpandParams()
+
+    relations: dict[str, Optional[str]] = {}
+    for item in filter(None, (part.strip() for part in expand.split(","))):
+        relation, _, load_strategy = item.partition(":")
+        relations[relation.strip()] = load_strategy.strip() or None
+    return ExpandParams(relations=relations)
@@ -0,0 +1,38 @@
+import csv
+import io
+from typing import Any, Iterable, Literal, Sequence
+
+from fastapi import Query
+from pydantic.dataclasses import dataclass
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES: dict[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+@dataclass
+class ExportParams:
+    format: ExportFormat = "ndjson"
+
+
+def get_export_params(
+    format: ExportFormat = Query(
+        "ndjson",
+        description="'ndjson' - объект JSON на строку, 'csv' - связи в ячейках как JSON",
+    ),
+) -> ExportParams:
+    return ExportParams(format=format)
+
+
+def ndjson_chunk(rows: Iterable[Sequence[str]]) -> bytes:
+    """Rows of a single column with the item already rendered as JSON by Postgres."""
+    return "".join(f"{row[0]}\n" for row in rows).encode()
+
+
+def csv_chunk(rows: Iterable[Iterable[Any]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
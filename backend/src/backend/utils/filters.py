@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, inspect
+
+
+@dataclass(frozen=True)
+class Filter:
+    """How a filter parameter becomes a WHERE condition.
+
+    ``source`` is a column, hybrid or relationship of the entity model. ``has`` matches
+    entities with at least one related row whose ``related`` column equals the value (EXISTS).
+    """
+
+    source: str
+    op: Literal["eq", "ge", "le", "has"] = "eq"
+    related: Optional[str] = None
+
+    def condition(self, model: Any, value: Any) -> ColumnElement:
+        attribute = getattr(model, self.source)
+        if self.op == "ge":
+            return attribute >= value
+        if self.op == "le":
+            return attribute <= value
+        if self.op == "has":
+            target = inspect(model).relationships[self.source].mapper.class_
+            return attribute.any(getattr(target, self.related) == value)
+        return attribute == value
+
+
+class FilterParams(BaseModel):
+    """Query parameters of a list endpoint, each field annotated with its ``Filter``.
+
+    Unset parameters (None) don't filter.
+    """
+
+    def conditions(self, model: Any) -> list[ColumnElement]:
+        conditions = []
+        for name, field in type(self).model_fields.items():
+            if (value := getattr(self, name)) is None:
+                continue
+            spec = next(item for item in field.metadata if isinstance(item, Filter))
+            conditions.append(spec.condition(model, value))
+        return conditions
@@ -1,9 +1,12 @@
-from typing import Optional
+import base64
+from typing import Any, Literal, Optional
 
+import orjson
 from fastapi import Query
 from pydantic.dataclasses import dataclass
 
 from backend.core.config import settings
+from backend.core.exceptions import InvalidCursorException
 
 
 @dataclass
@@ -12,6 +15,12 @@ class PaginationParams:
     limit: int
     order_by: Optional[str]
     desc: bool
+    mode: Literal["offset", "cursor"] = "offset"
+    cursor: Optional[str] = None
+
+    @property
+    def is_cursor_mode(self) -> bool:
+        return self.mode == "cursor" or self.cursor is not None
 
 
 def get_pagination(
@@ -21,5 +30,26 @@ def get_pagination(
     ),
     order_by: Optional[str] = Query("id", description="Поле для сортировки"),
     desc: bool = Query(False, description="Сортировка по убыванию"),
+    mode: Literal["offset", "cursor"] = Query(
+        "offset", description="Режим пагинации: 'offset' (смещение) или 'cursor' (курсор)"
+    ),
+    cursor: Optional[str] = Query(None, description="Курсор следующей страницы (next_cursor из ответа)"),
 ) -> PaginationParams:
-    return PaginationParams(offset=offset, limit=limit, order_by=order_by, desc=desc)
+    return PaginationParams(offset=offset, limit=limit, order_by=order_by, desc=desc, mode=mode, cursor=cursor)
+
+
+def encode_cursor(order_by: str, desc: bool, value: Any, id: int) -> str:
+    payload = orjson.dumps({"o": order_by, "d": desc, "v": value, "id": id})
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: str, desc: bool) -> tuple[Any, int]:
+    try:
+        payload = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        value, id = payload["v"], int(payload["id"])
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursorException(cursor)
+
+    if payload.get("o") != order_by or payload.get("d") != desc:
+        raise InvalidCursorException(cursor)
+    return value, id
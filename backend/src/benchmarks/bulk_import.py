@@ -0,0 +1,76 @@
+"""
+Times /teachers/import with a generated district (every teacher with three subjects) and fails when
+it takes longer than the target. The import runs in a unit of work that is rolled back, nothing is kept.
+Needs a database with at least three subjects:
+
+    cd src && python -m benchmarks.bulk_import --teachers 5000
+"""
+
+import argparse
+import asyncio
+import sys
+from itertools import product
+from time import perf_counter
+from typing import AsyncIterator
+
+import orjson
+from sqlalchemy import select
+
+from backend.core.database import session_manager
+from backend.entities.subject.models import Subject
+from backend.entities.teacher.services import TeacherManager
+from backend.utils.bulk_import import ImportParams
+
+TARGET_SECONDS = 5
+# what a request body arrives in, roughly
+CHUNK_SIZE = 64 * 1024
+
+LETTERS = "абвгдежзиклмнопрстуфхцчшэюя"
+
+
+def district(teachers: int, subject_ids: list[int]) -> bytes:
+    # distinct made-up names that pass the schema validator: 'Аб', 'Аба', ...
+    names = ("".join(letters).capitalize() for length in range(2, 5) for letters in product(LETTERS, repeat=length))
+    rows = (
+        {
+            "last_name": "Районов",
+            "first_name": next(names),
+            "patronymic": "Петрович",
+            "subjects": [{"id": id, "teaching_hours": 6} for id in subject_ids],
+        }
+        for _ in range(teachers)
+    )
+    return b"\n".join(orjson.dumps(row) for row in rows)
+
+
+async def chunked(body: bytes) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield body[start : start + CHUNK_SIZE]
+
+
+async def main(teachers: int) -> int:
+    async with session_manager.async_session() as session:
+        subject_ids = (await session.scalars(select(Subject.id).order_by(Subject.id).limit(3))).all()
+    params = ImportParams(format="ndjson", chunks=chunked(district(teachers, list(subject_ids))))
+
+    async with session_manager.async_session() as session:
+        async with session.begin() as transaction:
+            start = perf_counter()
+            report = await TeacherManager.import_teachers(session, params)
+            elapsed = perf_counter() - start
+            await transaction.rollback()
+
+    await session_manager.dispose()
+    print(f"{report.imported} of {teachers} teachers imported in {elapsed:.2f} s, {len(report.errors)} errors")
+    for error in report.errors[:5]:
+        print(f"  row {error.row}: {error.detail}")
+    print(f"target {TARGET_SECONDS} s{'' if elapsed <= TARGET_SECONDS else '  OVER TARGET'}")
+    return int(elapsed > TARGET_SECONDS or bool(report.errors))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--teachers", type=int, default=5000)
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.teachers)))
@@ -0,0 +1,83 @@
+"""
+Compares the ORM ('selectin'), raw projection and Postgres-rendered JSON read paths of the list endpoints.
+
+Runs against the configured database, data can be seeded with fake.main.Seeder:
+
+    cd src && python -m benchmarks.list_read_modes --limit 50 --repeat 200
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+
+import orjson
+from sqlalchemy import event
+
+from backend.core.database import session_manager
+from backend.entities.base import ListResponseModel
+from backend.entities.classroom.repository import classroom_repository
+from backend.entities.classroom.schemas import ClassroomResponse
+from backend.entities.student_group.repository import student_group_repository
+from backend.entities.student_group.schemas import StudentGroupResponse
+from backend.entities.subject.repository import subject_repository
+from backend.entities.subject.schemas import SubjectResponse
+from backend.entities.teacher.repository import teacher_repository
+from backend.entities.teacher.schemas import TeacherResponse
+from backend.utils.pagination import PaginationParams
+
+CASES = {
+    "teachers": (teacher_repository, TeacherResponse),
+    "subjects": (subject_repository, SubjectResponse),
+    "classrooms": (classroom_repository, ClassroomResponse),
+    "student_groups": (student_group_repository, StudentGroupResponse),
+}
+
+
+class StatementCounter:
+    def __init__(self) -> None:
+        self.count = 0
+        event.listen(session_manager.async_engine.sync_engine, "before_cursor_execute", self)
+
+    def __call__(self, *args) -> None:
+        self.count += 1
+
+
+async def run_case(repository, schema, mode: str, limit: int, repeat: int, counter: StatementCounter):
+    pagination = PaginationParams(offset=0, limit=limit, order_by="id", desc=False)
+    counter.count = 0
+
+    start = perf_counter()
+    for _ in range(repeat):
+        async with session_manager.async_session() as session:
+            if mode == "json":
+                await repository.list_json(session, pagination, schema)
+                continue
+            if mode == "orm":
+                page = await repository.list_page(session, pagination, load_strategy="selectin")
+            else:
+                page = await repository.list_rows(session, pagination, schema)
+            response = ListResponseModel[schema].from_page(page, pagination)
+            orjson.dumps(response.model_dump())
+    elapsed = perf_counter() - start
+
+    return elapsed / repeat * 1000, counter.count / repeat
+
+
+async def main(limit: int, repeat: int) -> None:
+    counter = StatementCounter()
+    print(f"{'entity':<16}{'mode':<6}{'ms/request':>12}{'queries':>10}")
+    for name, (repository, schema) in CASES.items():
+        for mode in ("orm", "raw", "json"):
+            await run_case(repository, schema, mode, limit, 3, counter)  # warm up
+            ms, queries = await run_case(repository, schema, mode, limit, repeat, counter)
+            print(f"{name:<16}{mode:<6}{ms:>12.2f}{queries:>10.1f}")
+    await session_manager.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.limit, args.repeat))
@@ -0,0 +1,85 @@
+"""
+Times timetable generation for a school of independent buildings (own groups, teachers and rooms),
+once as a single problem and once split into its parts by decompose, and fails when the split
+search falls short of the speed-up its parallel parts allow. The buildings are the made-up school of benchmarks.schedule_generate:
+
+    cd src && python -m benchmarks.schedule_decompose --buildings 4 --groups 60 --workers 0
+"""
+
+import argparse
+import asyncio
+import sys
+from time import perf_counter
+
+from backend.scheduling.pool import SchedulePool
+from benchmarks.schedule_generate import CURRICULUM, SPECIAL_SUBJECTS, school
+from timetable.problem import GroupHours, Room, TeacherHours, build_problem, decompose
+from timetable.solver import solve
+
+# building b has ids b * OFFSET + 1, ...
+OFFSET = 100_000
+# of min(workers, parts), the speed-up the parallel parts allow at best
+TARGET_EFFICIENCY = 0.7
+
+
+def district(buildings: int, groups: int, slots: int) -> tuple[list[GroupHours], list[TeacherHours], list[Room]]:
+    group_hours, teacher_hours, rooms = [], [], []
+    for building in range(buildings):
+        offset = building * OFFSET
+        building_groups, building_teachers, building_rooms = school(groups, slots)
+        # room eligibility goes by subject, so a building with rooms of its own has subjects of its own
+        group_hours += [
+            row._replace(student_group_id=row.student_group_id + offset, subject_id=row.subject_id + offset)
+            for row in building_groups
+        ]
+        teacher_hours += [
+            row._replace(teacher_id=row.teacher_id + offset, subject_id=row.subject_id + offset)
+            for row in building_teachers
+        ]
+        general = tuple(id + offset for id in CURRICULUM if id not in SPECIAL_SUBJECTS)
+        rooms += [
+            room._replace(
+                classroom_id=room.classroom_id + offset,
+                subject_ids=tuple(id + offset for id in room.subject_ids) or general,
+            )
+            for room in building_rooms
+        ]
+    return group_hours, teacher_hours, rooms
+
+
+async def main(buildings: int, groups: int, workers: int, days: int, periods: int) -> int:
+    group_hours, teacher_hours, rooms = district(buildings, groups, days * periods)
+    problem = build_problem(days, periods, group_hours, teacher_hours, rooms)
+    parts = decompose(problem)
+
+    start = perf_counter()
+    whole = solve(problem)
+    whole_elapsed = perf_counter() - start
+
+    pool = SchedulePool(workers)
+    try:
+        await pool.solve(problem, 1)
+        start = perf_counter()
+        split = await pool.solve(problem, 1)
+        split_elapsed = perf_counter() - start
+    finally:
+        pool.shutdown()
+
+    print(f"{buildings} buildings x {groups} groups, {len(parts)} parts, {pool.workers} workers")
+    print(f"  one problem: {whole_elapsed:.2f} s, {whole.unplaced_total} left out, penalty {whole.penalty}")
+    print(f"  split:       {split_elapsed:.2f} s, {split.unplaced_total} left out, penalty {split.penalty}")
+    speed_up, target = whole_elapsed / split_elapsed, TARGET_EFFICIENCY * min(pool.workers, len(parts))
+    print(f"speed-up {speed_up:.2f}x, target {target:.2f}x{'' if speed_up >= target else '  BELOW TARGET'}")
+    return int(speed_up < target)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--buildings", type=int, default=4)
+    parser.add_argument("--groups", type=int, default=60)
+    parser.add_argument("--workers", type=int, default=0, help="0 - one per core")
+    parser.add_argument("--days", type=int, default=5)
+    parser.add_argument("--periods", type=int, default=7)
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.buildings, args.groups, args.workers, args.days, args.periods)))
@@ -0,0 +1,74 @@
+"""
+Times timetable generation for a made-up school and fails when it takes longer than the target or
+leaves lessons out. Everything is generated in memory, no database is needed:
+
+    cd src && python -m benchmarks.schedule_generate --groups 60
+"""
+
+import argparse
+import sys
+from math import ceil
+from time import perf_counter
+
+from timetable.problem import GroupHours, Room, TeacherHours, build_problem
+from timetable.solver import solve
+
+TARGET_SECONDS = 5
+
+# subject id: weekly hours of every group, 32 of 35 slots
+CURRICULUM = {1: 5, 2: 4, 3: 3, 4: 3, 5: 2, 6: 1, 7: 3, 8: 2, 9: 2, 10: 2, 11: 2, 12: 3}
+# subjects with rooms of their own (labs, gym), the other subjects share the universal rooms
+SPECIAL_SUBJECTS = (7, 8, 11, 12)
+TEACHER_HOURS = 24
+
+
+def school(groups: int, slots: int) -> tuple[list[GroupHours], list[TeacherHours], list[Room]]:
+    group_hours = [
+        GroupHours(group_id, 25, subject_id, hours)
+        for group_id in range(1, groups + 1)
+        for subject_id, hours in CURRICULUM.items()
+    ]
+
+    teacher_hours, teacher_id = [], 0
+    for subject_id, hours in CURRICULUM.items():
+        # budgets are spent in whole courses
+        for _ in range(ceil(groups / (TEACHER_HOURS // hours))):
+            teacher_id += 1
+            teacher_hours.append(TeacherHours(teacher_id, subject_id, TEACHER_HOURS))
+
+    rooms = [Room(room_id, 30, ()) for room_id in range(1, groups)]
+    for subject_id in SPECIAL_SUBJECTS:
+        # one room more than the subject's lessons strictly need
+        count = ceil(groups * CURRICULUM[subject_id] / slots) + 1
+        rooms += [Room(len(rooms) + number, 30, (subject_id,)) for number in range(1, count + 1)]
+    return group_hours, teacher_hours, rooms
+
+
+def main(groups: int, days: int, periods: int) -> int:
+    group_hours, teacher_hours, rooms = school(groups, days * periods)
+
+    start = perf_counter()
+    problem = build_problem(days, periods, group_hours, teacher_hours, rooms)
+    solution = solve(problem)
+    elapsed = perf_counter() - start
+
+    lessons = sum(course.hours for course in problem.courses)
+    missing = solution.unplaced_total + sum(item.hours for item in problem.unassigned)
+    print(
+        f"{groups} groups, {len(problem.teacher_ids)} teachers, {len(rooms)} rooms: "
+        f"{len(solution.placements)} of {lessons} lessons placed in {elapsed:.2f} s, {missing} left out"
+    )
+    for item in problem.unassigned[:5]:
+        print(f"  group {item.student_group_id}, subject {item.subject_id}: {item.reason}")
+    print(f"target {TARGET_SECONDS} s{'' if elapsed <= TARGET_SECONDS else '  OVER TARGET'}")
+    return int(elapsed > TARGET_SECONDS or bool(missing))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--groups", type=int, default=60)
+    parser.add_argument("--days", type=int, default=5)
+    parser.add_argument("--periods", type=int, default=7)
+    args = parser.parse_args()
+
+    sys.exit(main(args.groups, args.days, args.periods))
@@ -0,0 +1,62 @@
+"""
+Times the same number of randomized timetable searches with 1, 2, 4, ... worker processes up to the
+core count and fails when the speed-up at the core count falls short of the target efficiency.
+The school is the made-up one of benchmarks.schedule_generate, no database is needed:
+
+    cd src && python -m benchmarks.schedule_parallel --groups 60 --restarts 32
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from time import perf_counter
+
+from backend.scheduling.pool import SchedulePool
+from benchmarks.schedule_generate import school
+from timetable.problem import build_problem
+
+# speed-up divided by the worker count
+TARGET_EFFICIENCY = 0.7
+
+
+async def timed(workers: int, problem, restarts: int) -> tuple[float, int]:
+    pool = SchedulePool(workers)
+    try:
+        # spawning and importing the workers is not part of the search
+        await pool.solve(problem, workers)
+        start = perf_counter()
+        solution = await pool.solve(problem, restarts)
+        return perf_counter() - start, solution.penalty
+    finally:
+        pool.shutdown()
+
+
+async def main(groups: int, restarts: int, days: int, periods: int) -> int:
+    problem = build_problem(days, periods, *school(groups, days * periods))
+    cores = os.cpu_count() or 1
+    counts = sorted({*(2**power for power in range(cores.bit_length()) if 2**power <= cores), cores})
+
+    baseline, efficiency = None, 1.0
+    for workers in counts:
+        elapsed, penalty = await timed(workers, problem, restarts)
+        baseline = baseline or elapsed
+        efficiency = baseline / elapsed / workers
+        print(
+            f"{workers:>3} workers: {restarts} searches in {elapsed:.2f} s, "
+            f"speed-up {baseline / elapsed:.2f}x, efficiency {efficiency:.0%}, best penalty {penalty}"
+        )
+
+    print(f"target efficiency {TARGET_EFFICIENCY:.0%} at {cores} cores{'' if efficiency >= TARGET_EFFICIENCY else '  BELOW TARGET'}")
+    return int(efficiency < TARGET_EFFICIENCY)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--groups", type=int, default=60)
+    parser.add_argument("--restarts", type=int, default=32)
+    parser.add_argument("--days", type=int, default=5)
+    parser.add_argument("--periods", type=int, default=7)
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.groups, args.restarts, args.days, args.periods)))
@@ -0,0 +1,40 @@
+"""
+Times scoring a generated timetable of the made-up school of benchmarks.schedule_generate and fails when
+one evaluation takes longer than the target. No database is needed:
+
+    cd src && python -m benchmarks.schedule_score --groups 60
+"""
+
+import argparse
+import sys
+import timeit
+
+from benchmarks.schedule_generate import school
+from timetable.problem import build_problem
+from timetable.scoring import Scorer
+from timetable.solver import solve
+
+TARGET_MICROSECONDS = 1000
+
+
+def main(groups: int, days: int, periods: int, repeat: int) -> int:
+    problem = build_problem(days, periods, *school(groups, days * periods))
+    solution = solve(problem)
+    scorer = Scorer(problem)
+
+    microseconds = timeit.timeit(lambda: scorer.score(solution), number=repeat) / repeat * 1e6
+    print(f"{len(solution.placements)} lessons: {scorer.score(solution)}")
+    print(f"{microseconds:.0f} us per evaluation")
+    print(f"target {TARGET_MICROSECONDS} us{'' if microseconds <= TARGET_MICROSECONDS else '  OVER TARGET'}")
+    return int(microseconds > TARGET_MICROSECONDS)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--groups", type=int, default=60)
+    parser.add_argument("--days", type=int, default=5)
+    parser.add_argument("--periods", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+
+    sys.exit(main(args.groups, args.days, args.periods, args.repeat))
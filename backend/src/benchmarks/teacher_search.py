@@ -0,0 +1,55 @@
+"""
+Measures /teachers/search latency with autocomplete-style queries (growing prefixes of real names)
+and fails when the p95 exceeds the target. Needs a seeded database with pg_trgm:
+
+    cd src && python -m benchmarks.teacher_search --rounds 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+from time import perf_counter
+
+from sqlalchemy import select
+
+from backend.core.database import session_manager
+from backend.entities.teacher.models import Teacher
+from backend.entities.teacher.services import TeacherManager
+
+# one request per keystroke has to come back before the next one
+TARGET_P95_MS = 20
+
+
+async def main(rounds: int, limit: int) -> int:
+    async with session_manager.async_session() as session:
+        names = (await session.scalars(select(Teacher.name).limit(50))).all()
+    queries = [name[:length] for name in names for length in range(2, min(len(name), 12) + 1)]
+
+    timings = []
+    for _ in range(rounds):
+        for query in queries:
+            async with session_manager.async_session() as session:
+                start = perf_counter()
+                await TeacherManager.search_teachers(session, query, limit)
+                timings.append((perf_counter() - start) * 1000)
+
+    await session_manager.dispose()
+    if not timings:
+        print("no teachers to search for")
+        return 1
+
+    p50 = statistics.median(timings)
+    p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+    print(f"{len(timings)} queries  p50 {p50:.2f} ms  p95 {p95:.2f} ms  max {max(timings):.2f} ms")
+    print(f"target p95 {TARGET_P95_MS} ms{'' if p95 <= TARGET_P95_MS else '  OVER TARGET'}")
+    return int(p95 > TARGET_P95_MS)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.rounds, args.limit)))
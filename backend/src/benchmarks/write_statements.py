@@ -0,0 +1,144 @@
+"""
+Counts the SQL statements each write endpoint sends to the database and fails unless every count is
+exactly the expected one, so a single extra round trip shows up as a failure.
+
+The managers are called exactly as the routers call them (request validation included), every
+call gets its own unit of work. Rows created here are deleted again. An empty migrated database is
+seeded first. Runs both validation modes unless one is given; CI runs it via scripts/check_statements.sh:
+
+    cd src && python -m benchmarks.write_statements --validation-mode optimistic
+"""
+
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import event, func, select
+
+from backend.core.config import settings
+from backend.core.database import session_manager
+from backend.entities.classroom.schemas import ClassroomPostRequest, ClassroomPutRequest
+from backend.entities.classroom.services import ClassroomManager
+from backend.entities.student_group.schemas import StudentGroupPostRequest, StudentGroupPutRequest
+from backend.entities.student_group.services import StudentGroupManager
+from backend.entities.subject.schemas import SubjectPostRequest, SubjectPutRequest
+from backend.entities.subject.models import Subject
+from backend.entities.subject.services import SubjectManager
+from backend.entities.teacher.schemas import TeacherPostRequest, TeacherPutRequest
+from backend.entities.teacher.services import TeacherManager
+from fake.main import Seeder
+
+# optimistic: INSERT/UPDATE ... RETURNING, one association sync statement (teachers, classrooms and
+# student groups), the table_versions bump on commit; PUT /subjects re-reads the subject's relations for the
+# response in one more select. DELETE is the DELETE and the bump in both modes.
+# pessimistic adds its validation SELECTs: the subject ids (the same three) and the name uniqueness check.
+EXPECTED = {
+    "pessimistic": {
+        "POST /teachers": 5,
+        "PUT /teachers/{id}": 5,
+        "DELETE /teachers/{id}": 2,
+        "POST /classrooms": 5,
+        "PUT /classrooms/{id}": 5,
+        "DELETE /classrooms/{id}": 2,
+        "POST /student_groups": 5,
+        "PUT /student_groups/{id}": 5,
+        "DELETE /student_groups/{id}": 2,
+        "POST /subjects": 3,
+        "PUT /subjects/{id}": 4,
+        "DELETE /subjects/{id}": 2,
+    },
+    "optimistic": {
+        "POST /teachers": 3,
+        "PUT /teachers/{id}": 3,
+        "DELETE /teachers/{id}": 2,
+        "POST /classrooms": 3,
+        "PUT /classrooms/{id}": 3,
+        "DELETE /classrooms/{id}": 2,
+        "POST /student_groups": 3,
+        "PUT /student_groups/{id}": 3,
+        "DELETE /student_groups/{id}": 2,
+        "POST /subjects": 2,
+        "PUT /subjects/{id}": 3,
+        "DELETE /subjects/{id}": 2,
+    },
+}
+
+
+class StatementCounter:
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+        event.listen(session_manager.async_engine.sync_engine, "before_cursor_execute", self)
+
+    def __call__(self, conn, cursor, statement, *args) -> None:
+        self.statements.append(statement)
+
+
+async def measure(counter: StatementCounter, call, *args):
+    counter.statements.clear()
+    async with session_manager.async_session() as session, session.begin():
+        result = await call(session, *args)
+    return result, len(counter.statements)
+
+
+async def seed() -> None:
+    async with session_manager.async_session() as session:
+        if await session.scalar(select(func.count()).select_from(Subject)):
+            return
+    await Seeder.seed_all()
+
+
+async def check(counter: StatementCounter, validation_mode: str) -> bool:
+    settings.api_config.VALIDATION_MODE = validation_mode
+    expected_counts = EXPECTED[validation_mode]
+    teacher = dict(last_name="Проверкин", first_name="Счётчик", patronymic="Запросович")
+    cases = [
+        ("teachers", TeacherManager.create_teacher, TeacherManager.update_teacher, TeacherManager.delete_teacher,
+         TeacherPostRequest(**teacher, subjects=[{"id": 1, "teaching_hours": 10}, {"id": 2, "teaching_hours": 5}]),
+         TeacherPutRequest(**teacher, is_active=False, subjects=[{"id": 2, "teaching_hours": 7}])),
+        ("classrooms", ClassroomManager.create_classroom, ClassroomManager.update_classroom,
+         ClassroomManager.delete_classroom,
+         ClassroomPostRequest(name="999-ю", capacity=20, subjects=[{"id": 1}, {"id": 2}]),
+         ClassroomPutRequest(name="999-э", capacity=25, subjects=[{"id": 2}, {"id": 3}])),
+        ("student_groups", StudentGroupManager.create_student_group, StudentGroupManager.update_student_group,
+         StudentGroupManager.delete_student_group,
+         StudentGroupPostRequest(name="10-Э", capacity=20, subjects=[{"id": 1, "study_hours": 3}]),
+         StudentGroupPutRequest(name="10-Ю", capacity=20, subjects=[{"id": 1, "study_hours": 4}])),
+        ("subjects", SubjectManager.create_subject, SubjectManager.update_subject, SubjectManager.delete_subject,
+         SubjectPostRequest(name="Проверка"), SubjectPutRequest(name="Перепроверка")),
+    ]
+
+    failed = False
+    print(f"{validation_mode}\n{'endpoint':<30}{'statements':>12}{'expected':>10}")
+    for name, create, update, delete, post_request, put_request in cases:
+        created, count = await measure(counter, create, post_request)
+        results = [(f"POST /{name}", count)]
+        _, count = await measure(counter, update, created.id, put_request)
+        results.append((f"PUT /{name}/{{id}}", count))
+        _, count = await measure(counter, delete, created.id)
+        results.append((f"DELETE /{name}/{{id}}", count))
+
+        for endpoint, count in results:
+            expected = expected_counts[endpoint]
+            failed |= count != expected
+            print(f"{endpoint:<30}{count:>12}{expected:>10}{'' if count == expected else '  UNEXPECTED'}")
+
+    return failed
+
+
+async def main(validation_modes: list[str]) -> int:
+    await seed()
+    counter = StatementCounter()
+    failed = False
+    for validation_mode in validation_modes:
+        failed |= await check(counter, validation_mode)
+
+    await session_manager.dispose()
+    return int(failed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--validation-mode", choices=list(EXPECTED), help="only this mode, both by default")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main([args.validation_mode] if args.validation_mode else list(EXPECTED))))
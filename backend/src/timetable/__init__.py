@@ -0,0 +1,5 @@
+"""Timetable search over plain data: the problem, the solver and the scoring.
+
+Kept outside the ``backend`` package on purpose: the workers of ``backend.scheduling.pool`` import
+it to unpickle their tasks, and importing ``backend`` would build the app and its engines in each.
+"""
@@ -0,0 +1,216 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable, NamedTuple, Optional
+
+
+class Course(NamedTuple):
+    """``hours`` weekly lessons of ``subject_id`` for a group with one teacher, in any of ``rooms``.
+
+    ``group``, ``teacher`` and ``rooms`` are indexes into ``Problem.group_ids`` etc.
+    """
+
+    group: int
+    teacher: int
+    subject_id: int
+    hours: int
+    rooms: tuple[int, ...]
+
+
+class Unassigned(NamedTuple):
+    """Curriculum hours that can't be scheduled at all, see ``build_problem``."""
+
+    student_group_id: int
+    subject_id: int
+    teacher_id: Optional[int]
+    hours: int
+    reason: str
+
+
+class GroupHours(NamedTuple):
+    student_group_id: int
+    capacity: Optional[int]
+    subject_id: int
+    study_hours: int
+
+
+class TeacherHours(NamedTuple):
+    teacher_id: int
+    subject_id: int
+    teaching_hours: int
+
+
+class Room(NamedTuple):
+    classroom_id: int
+    capacity: Optional[int]
+    subject_ids: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class Problem:
+    """One weekly timetable to build: ``days`` x ``periods`` slots and the courses to place into them.
+
+    Plain ints and tuples only, so it is cheap to pickle to worker processes.
+    Slot ``s`` is day ``s // periods``, lesson ``s % periods + 1``.
+    """
+
+    days: int
+    periods: int
+    group_ids: tuple[int, ...]
+    teacher_ids: tuple[int, ...]
+    room_ids: tuple[int, ...]
+    courses: tuple[Course, ...]
+    unassigned: tuple[Unassigned, ...] = ()
+
+    @property
+    def slots(self) -> int:
+        return self.days * self.periods
+
+
+def build_problem(
+    days: int,
+    periods: int,
+    group_hours: Iterable[GroupHours],
+    teacher_hours: Iterable[TeacherHours],
+    rooms: Iterable[Room],
+) -> Problem:
+    """Turns curriculum hours into courses: who teaches which group a subject and in which rooms.
+
+    Every (group, subject) gets a single teacher of the subject, the one with the most of its
+    ``teaching_hours`` left, as long as their week isn't full. Rooms linked to the subject are
+    eligible, rooms linked to no subject take any subject; a room smaller than the group is not.
+    Hours without a teacher or a room end up in ``Problem.unassigned``.
+    """
+    group_hours = sorted(group_hours, key=lambda row: (-row.study_hours, row.student_group_id, row.subject_id))
+    rooms = list(rooms)
+
+    budgets: dict[int, dict[int, int]] = defaultdict(dict)
+    for row in teacher_hours:
+        budgets[row.subject_id][row.teacher_id] = row.teaching_hours
+
+    subject_rooms: dict[int, list[Room]] = defaultdict(list)
+    universal_rooms = [room for room in rooms if not room.subject_ids]
+    for room in rooms:
+        for subject_id in room.subject_ids:
+            subject_rooms[subject_id].append(room)
+
+    group_ids = sorted({row.student_group_id for row in group_hours})
+    teacher_ids = sorted({teacher_id for teachers in budgets.values() for teacher_id in teachers})
+    room_ids = [room.classroom_id for room in rooms]
+    group_index = {id: index for index, id in enumerate(group_ids)}
+    teacher_index = {id: index for index, id in enumerate(teacher_ids)}
+    room_index = {id: index for index, id in enumerate(room_ids)}
+
+    teacher_load: dict[int, int] = defaultdict(int)
+    courses, unassigned = [], []
+    for row in group_hours:
+        if row.study_hours <= 0:
+            continue
+
+        candidates = [
+            teacher_id
+            for teacher_id, left in budgets[row.subject_id].items()
+            if left >= row.study_hours and teacher_load[teacher_id] + row.study_hours <= days * periods
+        ]
+        if not candidates:
+            unassigned.append(Unassigned(row.student_group_id, row.subject_id, None, row.study_hours, "нет преподавателя"))
+            continue
+        teacher_id = max(candidates, key=lambda id: (budgets[row.subject_id][id], -teacher_load[id], -id))
+
+        eligible = [
+            room_index[room.classroom_id]
+            for room in subject_rooms.get(row.subject_id) or universal_rooms
+            if room.capacity is None or row.capacity is None or room.capacity >= row.capacity
+        ]
+        if not eligible:
+            unassigned.append(
+                Unassigned(row.student_group_id, row.subject_id, teacher_id, row.study_hours, "нет подходящего кабинета")
+            )
+            continue
+
+        budgets[row.subject_id][teacher_id] -= row.study_hours
+        teacher_load[teacher_id] += row.study_hours
+        courses.append(
+            Course(
+                group_index[row.student_group_id],
+                teacher_index[teacher_id],
+                row.subject_id,
+                row.study_hours,
+                tuple(eligible),
+            )
+        )
+
+    return Problem(
+        days=days,
+        periods=periods,
+        group_ids=tuple(group_ids),
+        teacher_ids=tuple(teacher_ids),
+        room_ids=tuple(room_ids),
+        courses=tuple(courses),
+        unassigned=tuple(unassigned),
+    )
+
+
+class Component(NamedTuple):
+    """An independent part of a problem and where its courses and rooms sit in the whole one."""
+
+    problem: Problem
+    courses: tuple[int, ...]
+    rooms: tuple[int, ...]
+
+
+def decompose(problem: Problem) -> list[Component]:
+    """Splits ``problem`` into parts that share no group, teacher or eligible room.
+
+    Courses are joined through their group, teacher and rooms with a union-find, each connected
+    part is a problem of its own that can be solved without looking at the others. Rooms no
+    course can use belong to no part.
+    """
+    groups, teachers = len(problem.group_ids), len(problem.teacher_ids)
+    # nodes: groups, then teachers, then rooms
+    parents = list(range(groups + teachers + len(problem.room_ids)))
+
+    def find(node: int) -> int:
+        while parents[node] != node:
+            parents[node] = parents[parents[node]]
+            node = parents[node]
+        return node
+
+    for course in problem.courses:
+        root = find(course.group)
+        for node in (groups + course.teacher, *(groups + teachers + room for room in course.rooms)):
+            parents[find(node)] = root
+
+    parts: dict[int, list[int]] = defaultdict(list)
+    for index, course in enumerate(problem.courses):
+        parts[find(course.group)].append(index)
+
+    components = []
+    for course_indexes in parts.values():
+        courses = [problem.courses[index] for index in course_indexes]
+        group_map = {group: index for index, group in enumerate(sorted({course.group for course in courses}))}
+        teacher_map = {teacher: index for index, teacher in enumerate(sorted({course.teacher for course in courses}))}
+        room_map = {
+            room: index for index, room in enumerate(sorted({room for course in courses for room in course.rooms}))
+        }
+        components.append(
+            Component(
+                problem=Problem(
+                    days=problem.days,
+                    periods=problem.periods,
+                    group_ids=tuple(problem.group_ids[group] for group in group_map),
+                    teacher_ids=tuple(problem.teacher_ids[teacher] for teacher in teacher_map),
+                    room_ids=tuple(problem.room_ids[room] for room in room_map),
+                    courses=tuple(
+                        course._replace(
+                            group=group_map[course.group],
+                            teacher=teacher_map[course.teacher],
+                            rooms=tuple(room_map[room] for room in course.rooms),
+                        )
+                        for course in courses
+                    ),
+                ),
+                courses=tuple(course_indexes),
+                rooms=tuple(room_map),
+            )
+        )
+    return components
@@ -0,0 +1,145 @@
+from datetime import date
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple, Sequence
+
+import numpy as np
+
+from timetable.problem import Problem
+
+if TYPE_CHECKING:
+    from timetable.solver import Solution
+
+
+class Score(NamedTuple):
+    """Penalty counts of a week of lessons, ``total`` weighs them with ``WEIGHTS``."""
+
+    # curriculum lessons that are not in the week
+    unplaced: int = 0
+    # extra lessons of a group, teacher or room in an already taken slot
+    clashes: int = 0
+    # free lessons between a group's first and last lesson of a day
+    student_gaps: int = 0
+    # the same for teachers
+    teacher_windows: int = 0
+    # a group's most loaded day minus its least loaded one
+    load_imbalance: int = 0
+    # more than one lesson of a subject for a group in a day
+    subject_repetition: int = 0
+
+    @property
+    def total(self) -> int:
+        return sum(weight * count for weight, count in zip(WEIGHTS, self))
+
+
+# a left out or double-booked lesson outweighs any number of soft penalties
+WEIGHTS = Score(unplaced=1000, clashes=1000, student_gaps=1, teacher_windows=1, load_imbalance=1, subject_repetition=1)
+
+
+def occupancy(
+    owner: np.ndarray, day: np.ndarray, period: np.ndarray, owners: int, days: int, periods: int
+) -> np.ndarray:
+    """Lessons per owner, day and period: an ``owners x days x periods`` count array."""
+    cells = (owner * days + day) * periods + period
+    return np.bincount(cells, minlength=owners * days * periods).reshape(owners, days, periods)
+
+
+@lru_cache
+def _gap_table(periods: int) -> np.ndarray:
+    """Gaps of every taken-periods bitmask of a day, 512 entries at most."""
+    table = [0] * (1 << periods)
+    for mask in range(1, 1 << periods):
+        table[mask] = mask.bit_length() - (mask & -mask).bit_length() + 1 - mask.bit_count()
+    return np.array(table)
+
+
+def gaps(counts: np.ndarray) -> int:
+    """Free periods between the first and the last taken one, over all owners and days.
+
+    Every owner's day is packed into a bitmask with one matrix product and looked up.
+    """
+    periods = counts.shape[2]
+    masks = (counts > 0) @ (1 << np.arange(periods))
+    return int(_gap_table(periods)[masks].sum())
+
+
+def clashes(counts: np.ndarray) -> int:
+    """Lessons beyond the first one in each cell."""
+    return int(counts.sum() - np.count_nonzero(counts))
+
+
+def score_lessons(
+    days: int,
+    periods: int,
+    day: np.ndarray,
+    period: np.ndarray,
+    group: np.ndarray,
+    teacher: np.ndarray,
+    room: np.ndarray,
+    subject: np.ndarray,
+    unplaced: int = 0,
+) -> Score:
+    """Scores lessons given as parallel arrays, one element per lesson.
+
+    Groups, teachers, rooms and subjects are indexes ``0..n-1``. Everything is a handful of
+    array operations over the occupancy arrays, no loop over the lessons.
+    """
+    if not len(day):
+        return Score(unplaced=unplaced)
+
+    groups = occupancy(group, day, period, int(group.max()) + 1, days, periods)
+    teachers = occupancy(teacher, day, period, int(teacher.max()) + 1, days, periods)
+    rooms = occupancy(room, day, period, int(room.max()) + 1, days, periods)
+
+    daily = groups.sum(axis=2)
+    # only groups with lessons this week
+    daily = daily[daily.any(axis=1)]
+
+    subject_days = np.bincount((group * (int(subject.max()) + 1) + subject) * days + day)
+
+    return Score(
+        unplaced=unplaced,
+        clashes=clashes(groups) + clashes(teachers) + clashes(rooms),
+        student_gaps=gaps(groups),
+        teacher_windows=gaps(teachers),
+        load_imbalance=int((daily.max(axis=1) - daily.min(axis=1)).sum()),
+        subject_repetition=int(np.maximum(subject_days - 1, 0).sum()),
+    )
+
+
+def score_week(week_start: date, days: int, periods: int, rows: Sequence[Sequence[Any]], unplaced: int = 0) -> Score:
+    """Scores stored lessons, rows of ``(lesson_date, lesson_number, group, teacher, room, subject)`` ids."""
+    if not rows:
+        return Score(unplaced=unplaced)
+
+    dates, numbers, *ids = zip(*rows)
+    day = (np.array(dates, dtype="datetime64[D]") - np.datetime64(week_start, "D")).astype(np.int64)
+    group, teacher, room, subject = (np.unique(np.array(owner_ids), return_inverse=True)[1] for owner_ids in ids)
+    return score_lessons(days, periods, day, np.array(numbers), group, teacher, room, subject, unplaced)
+
+
+class Scorer:
+    """Scores solutions of one problem, the per-course arrays are built once."""
+
+    def __init__(self, problem: Problem) -> None:
+        self.problem = problem
+        courses = np.array(
+            [(course.group, course.teacher, course.subject_id) for course in problem.courses], dtype=np.int64
+        ).reshape(-1, 3)
+        self.course_group, self.course_teacher = courses[:, 0], courses[:, 1]
+        _, self.course_subject = np.unique(courses[:, 2], return_inverse=True)
+        self.slot_day, self.slot_period = np.divmod(np.arange(problem.slots), problem.periods)
+        self.unassigned = sum(item.hours for item in problem.unassigned)
+
+    def score(self, solution: "Solution") -> Score:
+        course, slot, room = solution.placements.astype(np.int64).T
+        return score_lessons(
+            self.problem.days,
+            self.problem.periods,
+            self.slot_day[slot],
+            self.slot_period[slot],
+            self.course_group[course],
+            self.course_teacher[course],
+            room,
+            self.course_subject[course],
+            unplaced=solution.unplaced_total + self.unassigned,
+        )
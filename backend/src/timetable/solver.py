@@ -0,0 +1,259 @@
+import random
+from dataclasses import dataclass, replace
+from itertools import chain
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from timetable.problem import Component, Problem
+from timetable.scoring import Scorer
+
+# sweeps over all lessons in _Timetable.improve
+IMPROVE_PASSES = 8
+
+
+class Placement(NamedTuple):
+    course: int
+    slot: int
+    room: int
+
+
+def placement_array(placements: Sequence[Placement]) -> np.ndarray:
+    """``(course, slot, room)`` rows sorted by course and slot, the form ``Solution`` keeps them in."""
+    array = np.fromiter(chain.from_iterable(placements), dtype=np.int32, count=3 * len(placements)).reshape(-1, 3)
+    return array[np.lexsort((array[:, 1], array[:, 0]))]
+
+
+@dataclass(frozen=True, eq=False)
+class Solution:
+    # an (n, 3) int32 array of Placement rows, scored and pickled without a loop over the lessons
+    placements: np.ndarray
+    # lessons of each course that found no slot, by course index
+    unplaced: tuple[int, ...]
+    # Score.total, lower is better
+    penalty: int = 0
+    seed: Optional[int] = None
+
+    @property
+    def unplaced_total(self) -> int:
+        return sum(self.unplaced)
+
+
+class _Timetable:
+    """Busy slots of every teacher, group and room as int bitmasks, bit ``s`` is slot ``s``.
+
+    "Free for the group, the teacher and one of the rooms" is a handful of ORs and ANDs, the
+    earliest free lesson of a day is the lowest set bit.
+    """
+
+    def __init__(self, problem: Problem, rng: Optional[random.Random]) -> None:
+        self.problem = problem
+        self.rng = rng
+        self.full = (1 << problem.slots) - 1
+        self.day_masks = [((1 << problem.periods) - 1) << (day * problem.periods) for day in range(problem.days)]
+
+        self.group_busy = [0] * len(problem.group_ids)
+        self.teacher_busy = [0] * len(problem.teacher_ids)
+        self.room_busy = [0] * len(problem.room_ids)
+        # who holds a slot, to find the lesson to move out of the way
+        self.group_at: list[dict[int, int]] = [{} for _ in problem.group_ids]
+        self.teacher_at: list[dict[int, int]] = [{} for _ in problem.teacher_ids]
+        self.course_days = [[0] * problem.days for _ in problem.courses]
+        self.lessons: list[Optional[Placement]] = []
+
+    def day_gaps(self, busy: int, day: int) -> int:
+        """Free lessons of the day between the first and the last busy one."""
+        if lessons := busy >> (day * self.problem.periods) & self.day_masks[0]:
+            return lessons.bit_length() - (lessons & -lessons).bit_length() + 1 - lessons.bit_count()
+        return 0
+
+    def free_slots(self, course: int) -> int:
+        course = self.problem.courses[course]
+        rooms_free = 0
+        for room in course.rooms:
+            rooms_free |= ~self.room_busy[room]
+        return self.full & rooms_free & ~(self.group_busy[course.group] | self.teacher_busy[course.teacher])
+
+    def best_slot(self, course: int, free: int) -> int:
+        """Another day than the course's other lessons, the group's least loaded one, as early as possible."""
+        group = self.group_busy[self.problem.courses[course].group]
+        days = self.course_days[course]
+        day = min(
+            (day for day, mask in enumerate(self.day_masks) if free & mask),
+            key=lambda day: (
+                days[day],
+                (group & self.day_masks[day]).bit_count(),
+                day,
+            ),
+        )
+        candidates = free & self.day_masks[day]
+        return (candidates & -candidates).bit_length() - 1
+
+    def add(self, course: int, slot: int, room: Optional[int] = None) -> int:
+        info = self.problem.courses[course]
+        bit = 1 << slot
+        if room is None:
+            room = next(room for room in info.rooms if not self.room_busy[room] & bit)
+
+        lesson = len(self.lessons)
+        self.lessons.append(Placement(course, slot, room))
+        self.group_busy[info.group] |= bit
+        self.teacher_busy[info.teacher] |= bit
+        self.room_busy[room] |= bit
+        self.group_at[info.group][slot] = lesson
+        self.teacher_at[info.teacher][slot] = lesson
+        self.course_days[course][slot // self.problem.periods] += 1
+        return lesson
+
+    def remove(self, lesson: int) -> Placement:
+        placement = self.lessons[lesson]
+        self.lessons[lesson] = None
+        info = self.problem.courses[placement.course]
+        bit = ~(1 << placement.slot)
+        self.group_busy[info.group] &= bit
+        self.teacher_busy[info.teacher] &= bit
+        self.room_busy[placement.room] &= bit
+        del self.group_at[info.group][placement.slot]
+        del self.teacher_at[info.teacher][placement.slot]
+        self.course_days[placement.course][placement.slot // self.problem.periods] -= 1
+        return placement
+
+    def place(self, course: int) -> bool:
+        if not (free := self.free_slots(course)):
+            return False
+        self.add(course, self.best_slot(course, free))
+        return True
+
+    def place_by_moving(self, course: int) -> bool:
+        """Frees a slot for ``course`` by moving the one lesson of its group or teacher that holds it."""
+        info = self.problem.courses[course]
+        slots = list(range(self.problem.slots))
+        if self.rng:
+            self.rng.shuffle(slots)
+
+        for slot in slots:
+            blockers = {self.group_at[info.group].get(slot), self.teacher_at[info.teacher].get(slot)} - {None}
+            if len(blockers) != 1:
+                continue
+
+            (blocker,) = blockers
+            moved = self.remove(blocker)
+            if self.free_slots(course) >> slot & 1:
+                lesson = self.add(course, slot)
+                if free := self.free_slots(moved.course):
+                    self.add(moved.course, self.best_slot(moved.course, free))
+                    return True
+                self.remove(lesson)
+            self.add(moved.course, moved.slot, moved.room)
+        return False
+
+    def improve(self) -> None:
+        """Moves single lessons to free slots that leave their group and teacher fewer gaps.
+
+        A move never puts more lessons of a course on one day than there were. Stops after a
+        sweep without moves or after ``IMPROVE_PASSES`` sweeps.
+        """
+        periods = self.problem.periods
+        for _ in range(IMPROVE_PASSES):
+            order = [lesson for lesson, placement in enumerate(self.lessons) if placement is not None]
+            if self.rng:
+                self.rng.shuffle(order)
+
+            moved = False
+            for lesson in order:
+                placement = self.remove(lesson)
+                info = self.problem.courses[placement.course]
+                group, teacher = self.group_busy[info.group], self.teacher_busy[info.teacher]
+                days = self.course_days[placement.course]
+                limit = days[placement.slot // periods]
+
+                def added_gaps(slot: int) -> int:
+                    bit, day = 1 << slot, slot // periods
+                    return (
+                        self.day_gaps(group | bit, day)
+                        - self.day_gaps(group, day)
+                        + self.day_gaps(teacher | bit, day)
+                        - self.day_gaps(teacher, day)
+                    )
+
+                best, best_gaps = placement.slot, added_gaps(placement.slot)
+                free = self.free_slots(placement.course)
+                while free:
+                    bit = free & -free
+                    free ^= bit
+                    slot = bit.bit_length() - 1
+                    if days[slot // periods] <= limit and (gaps := added_gaps(slot)) < best_gaps:
+                        best, best_gaps = slot, gaps
+
+                if best == placement.slot:
+                    self.add(placement.course, placement.slot, placement.room)
+                else:
+                    self.add(placement.course, best)
+                    moved = True
+            if not moved:
+                break
+
+
+def solve(problem: Problem, seed: Optional[int] = None) -> Solution:
+    """Greedy placement of every course lesson, most constrained courses first, then a repair pass.
+
+    Lessons that find no slot get one more try in ``_Timetable.place_by_moving``, then
+    ``_Timetable.improve`` closes gaps. Without ``seed`` the result is deterministic; a seed
+    shuffles the order lessons are repaired and moved in, so different seeds end in different
+    timetables.
+    """
+    rng = random.Random(seed) if seed is not None else None
+    timetable = _Timetable(problem, rng)
+
+    teacher_hours = [0] * len(problem.teacher_ids)
+    group_hours = [0] * len(problem.group_ids)
+    for course in problem.courses:
+        teacher_hours[course.teacher] += course.hours
+        group_hours[course.group] += course.hours
+
+    def difficulty(index: int) -> tuple:
+        course = problem.courses[index]
+        return (len(course.rooms), -teacher_hours[course.teacher], -group_hours[course.group], -course.hours)
+
+    pending = [
+        index
+        for index in sorted(range(len(problem.courses)), key=difficulty)
+        for _ in range(problem.courses[index].hours)
+        if not timetable.place(index)
+    ]
+
+    unplaced = [0] * len(problem.courses)
+    for index in pending:
+        if not timetable.place_by_moving(index):
+            unplaced[index] += 1
+    timetable.improve()
+
+    solution = Solution(
+        placements=placement_array([lesson for lesson in timetable.lessons if lesson is not None]),
+        unplaced=tuple(unplaced),
+        seed=seed,
+    )
+    return replace(solution, penalty=Scorer(problem).score(solution).total)
+
+
+def solve_best(problem: Problem, seeds: Sequence[Optional[int]]) -> Solution:
+    """The lowest-penalty solution of one ``solve`` per seed, the first one on ties."""
+    return min((solve(problem, seed) for seed in seeds), key=lambda solution: solution.penalty)
+
+
+def merge(problem: Problem, components: Sequence[Component], solutions: Sequence[Solution]) -> Solution:
+    """A solution of ``problem`` from solutions of its ``decompose`` parts, penalties add up."""
+    parts, unplaced = [np.empty((0, 3), dtype=np.int32)], [0] * len(problem.courses)
+    for component, solution in zip(components, solutions, strict=True):
+        part = solution.placements.copy()
+        part[:, 0] = np.asarray(component.courses, dtype=np.int32)[part[:, 0]]
+        part[:, 2] = np.asarray(component.rooms, dtype=np.int32)[part[:, 2]]
+        parts.append(part)
+        for index, count in zip(component.courses, solution.unplaced):
+            unplaced[index] = count
+    placements = np.concatenate(parts)
+    return Solution(
+        placements=placements[np.lexsort((placements[:, 1], placements[:, 0]))],
+        unplaced=tuple(unplaced),
+        penalty=sum(solution.penalty for solution in solutions),
+    )